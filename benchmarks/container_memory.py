@@ -0,0 +1,95 @@
+from random import Random
+from sys import argv
+from typing import Any, Callable
+
+from data_structures import (
+    BinarySearchTree, Cache, CompactHashTable, ConcurrentHashTable,
+    CuckooHashTable, DoublyLinkedList, HashTable, IndexableSkipList,
+    LinkedList, Queue, RobinHoodHashTable, Stack, TypedHashTable,
+    UnrolledLinkedList,)
+from data_structures.utils import BloomFilter
+
+from .hash_table_memory import traced_size
+
+
+def fill_sequence(container_type: type, method: str):
+    def fill(keys: list[str], values: list[int]) -> Any:
+        container = container_type()
+        add = getattr(container, method)
+
+        for value in values:
+            add(value)
+
+        return container
+
+    return fill
+
+
+def fill_mapping(container_type: Callable[[], Any]):
+    def fill(keys: list[str], values: list[int]) -> Any:
+        container = container_type()
+
+        for key, value in zip(keys, values):
+            container.put(key, value)
+
+        return container
+
+    return fill
+
+
+def fill_cache(keys: list[str], values: list[int]) -> Cache[int]:
+    return fill_mapping(lambda: Cache(len(keys)))(keys, values)
+
+
+def fill_bloom_filter(keys: list[str], values: list[int]) -> BloomFilter:
+    bloom = BloomFilter(len(keys))
+    bloom.update(keys)
+    return bloom
+
+
+CONTAINERS: dict[str, Callable[[list[str], list[int]], Any]] = {
+    'LinkedList': fill_sequence(LinkedList, 'append'),
+    'DoublyLinkedList': fill_sequence(DoublyLinkedList, 'append'),
+    'UnrolledLinkedList': fill_sequence(UnrolledLinkedList, 'append'),
+    'IndexableSkipList': fill_sequence(IndexableSkipList, 'append'),
+    'Stack': fill_sequence(Stack, 'push'),
+    'Queue': fill_sequence(Queue, 'enqueue'),
+    'BinarySearchTree': fill_mapping(BinarySearchTree),
+    'HashTable': fill_mapping(HashTable),
+    'CompactHashTable': fill_mapping(CompactHashTable),
+    'TypedHashTable': fill_mapping(TypedHashTable),
+    'RobinHoodHashTable': fill_mapping(RobinHoodHashTable),
+    'CuckooHashTable': fill_mapping(CuckooHashTable),
+    'ConcurrentHashTable': fill_mapping(ConcurrentHashTable),
+    'Cache': fill_cache,
+    'BloomFilter': fill_bloom_filter,
+}
+
+
+def measure(
+    fill: Callable[[list[str], list[int]], Any],
+    keys: list[str],
+    values: list[int],
+) -> float:
+    return traced_size(fill, keys, values) / len(keys)
+
+
+def main(*sizes: int):
+    sizes = sizes or (10 ** 4, 10 ** 5, 10 ** 6)
+    print('Container memory footprint (bytes per element, excluding the')
+    print('keys and values themselves)')
+    print(f"{'container':>20}" + ''.join(f'{size:>12}' for size in sizes))
+    inputs = []
+
+    for size in sizes:
+        keys = [f'key-{n}' for n in range(size)]
+        Random(0).shuffle(keys)
+        inputs.append((keys, list(range(size, size * 2))))
+
+    for name, fill in CONTAINERS.items():
+        row = [measure(fill, keys, values) for keys, values in inputs]
+        print(f'{name:>20}' + ''.join(f'{memory:>12.1f}' for memory in row))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:]])
@@ -0,0 +1,74 @@
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from data_structures import HashTable, RobinHoodHashTable
+
+
+def summarize(histogram: dict[int, int]) -> str:
+    total = sum(histogram.values())
+    mean = sum(length * count for length, count in histogram.items()) / total
+    seen = 0
+
+    for length, count in histogram.items():
+        seen += count
+
+        if seen >= total * 0.99:
+            break
+
+    return f'mean {mean:.2f}, p99 {length}, max {max(histogram)}'
+
+
+def churn(table: HashTable[int], size: int, rounds: int) -> dict[str, float]:
+    random = Random(0)
+    live = [f'key-{n}' for n in range(size)]
+
+    for n, key in enumerate(live):
+        table.put(key, n)
+
+    start = perf_counter()
+
+    for n in range(size, size + rounds):
+        index = random.randrange(len(live))
+        table.delete(live[index])
+        live[index] = f'key-{n}'
+        table.put(live[index], n)
+
+    churn_time = perf_counter() - start
+    start = perf_counter()
+
+    for n in range(rounds):
+        try:
+            table.get(f'missing-{n}')
+        except KeyError:
+            pass
+
+    miss_time = perf_counter() - start
+
+    return {
+        'churn': churn_time / rounds * 1e6,
+        'miss': miss_time / rounds * 1e6,
+        'tombstones': table._num_tombstones,
+    }
+
+
+def main(size: int = 50_000, rounds: int = 200_000):
+    print(f'Steady-size churn: {size} keys, {rounds} delete+put rounds')
+
+    tables: list[tuple[str, HashTable[int]]] = [
+        ('HashTable', HashTable()),
+        ('RobinHoodHashTable', RobinHoodHashTable()),
+    ]
+
+    for label, table in tables:
+        result = churn(table, size, rounds)
+        print(f'{label}:')
+        print(f"  delete+put   {result['churn']:.2f} us/round")
+        print(f"  missing get  {result['miss']:.2f} us/lookup")
+        print(f"  tombstones   {result['tombstones']}")
+        print(f'  probe length {summarize(table.probe_histogram())}')
+        print(f'  histogram    {table.probe_histogram()}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:3]])
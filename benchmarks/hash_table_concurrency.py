@@ -0,0 +1,88 @@
+from random import Random
+from sys import argv
+from threading import Barrier, Lock, Thread
+from time import perf_counter
+from typing import Hashable
+
+from data_structures import ConcurrentHashTable, HashTable
+
+
+class LockedHashTable:
+    def __init__(self):
+        self._table: HashTable[int] = HashTable()
+        self._lock = Lock()
+
+
+    def get(self, key: Hashable) -> int:
+        with self._lock:
+            return self._table.get(key)
+
+
+    def put(self, key: Hashable, value: int):
+        with self._lock:
+            self._table.put(key, value)
+
+
+    def update(self, key: Hashable, value: int):
+        with self._lock:
+            self._table.update(key, value)
+
+
+def worker(
+    table, thread: int, ops: int, size: int, write_ratio: float,
+    barrier: Barrier,
+):
+    random = Random(thread)
+    barrier.wait()
+
+    for n in range(ops):
+        key = f'key-{random.randrange(size)}'
+
+        if random.random() < write_ratio:
+            table.update(key, n)
+        else:
+            table.get(key)
+
+
+def throughput(
+    table, num_threads: int, ops: int, size: int, write_ratio: float,
+) -> float:
+    for n in range(size):
+        table.put(f'key-{n}', n)
+
+    barrier = Barrier(num_threads + 1)
+    threads = [
+        Thread(
+            target=worker,
+            args=(table, thread, ops, size, write_ratio, barrier))
+        for thread in range(num_threads)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return num_threads * ops / (perf_counter() - start)
+
+
+def main(ops: int = 50_000, size: int = 10_000):
+    print(f'Throughput: {ops} ops per thread over {size} keys (ops/s)')
+    print(f"{'threads':>8} {'writes':>7} {'global lock':>12} {'sharded':>12}")
+
+    for num_threads in [1, 2, 4, 8]:
+        for write_ratio in [0.0, 0.1, 0.5]:
+            locked = throughput(
+                LockedHashTable(), num_threads, ops, size, write_ratio)
+            sharded = throughput(
+                ConcurrentHashTable(), num_threads, ops, size, write_ratio)
+            print(
+                f'{num_threads:>8} {write_ratio:>7.0%} '
+                f'{locked:>12,.0f} {sharded:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:3]])
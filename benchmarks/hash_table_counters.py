@@ -0,0 +1,56 @@
+import tracemalloc
+from sys import argv
+from time import perf_counter
+
+from data_structures import CompactHashTable, HashTable, TypedHashTable
+
+
+def build(table_type: type, size: int):
+    table = table_type()
+
+    for n in range(size):
+        table.put(n, n * 2)
+
+    return table
+
+
+def increment(table, size: int):
+    for n in range(size):
+        table[n] += 1
+
+
+def main(size: int = 10 ** 7):
+    print(f'{size} int counters keyed by int')
+    print(f"{'table':>18}{'bytes/key':>12}{'put (s)':>10}{'+= 1 (s)':>10}"
+          f"{'sum (s)':>10}")
+
+    for table_type in [HashTable, CompactHashTable, TypedHashTable]:
+        tracemalloc.start()
+        start = perf_counter()
+        table = build(table_type, size)
+        put_time = perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = perf_counter()
+        increment(table, size)
+        increment_time = perf_counter() - start
+
+        start = perf_counter()
+
+        if table_type is TypedHashTable:
+            with table.values_view() as view:
+                total = sum(view)
+        else:
+            total = sum(table.values())
+
+        sum_time = perf_counter() - start
+        assert total == size * size
+        print(
+            f'{table_type.__name__:>18}{memory / size:>12.1f}'
+            f'{put_time:>10.2f}{increment_time:>10.2f}{sum_time:>10.2f}')
+        del table
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:2]])
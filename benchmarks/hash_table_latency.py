@@ -0,0 +1,44 @@
+from sys import argv
+from time import perf_counter
+
+from data_structures import HashTable
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def time_puts(table: HashTable[int], size: int) -> list[float]:
+    samples: list[float] = []
+
+    for n in range(size):
+        start = perf_counter()
+        table.put(f'key-{n}', n)
+        samples.append(perf_counter() - start)
+
+    return samples
+
+
+def main(size: int = 200_000):
+    print(f'HashTable.put latency, {size} keys (microseconds)')
+    print(f"{'mode':<24}{'p50':>10}{'p99':>10}{'p99.9':>10}{'max':>12}")
+
+    tables: list[tuple[str, HashTable[int]]] = [
+        ('stop-the-world', HashTable()),
+        ('incremental (step 64)', HashTable(64)),
+        ('incremental (50us)', HashTable(1024, 50e-6)),
+    ]
+
+    for label, table in tables:
+        samples = time_puts(table, size)
+        print(
+            f'{label:<24}'
+            f'{percentile(samples, 0.5) * 1e6:>10.2f}'
+            f'{percentile(samples, 0.99) * 1e6:>10.2f}'
+            f'{percentile(samples, 0.999) * 1e6:>10.2f}'
+            f'{max(samples) * 1e6:>12.2f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:2]])
@@ -0,0 +1,57 @@
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from data_structures import CuckooHashTable, HashTable, RobinHoodHashTable
+
+from .hash_table_latency import percentile
+
+
+def time_gets(table, keys: list[str]) -> list[float]:
+    samples: list[float] = []
+
+    for key in keys:
+        start = perf_counter()
+
+        try:
+            table.get(key)
+        except KeyError:
+            pass
+
+        samples.append(perf_counter() - start)
+
+    return samples
+
+
+def main(size: int = 200_000, lookups: int = 200_000):
+    random = Random(0)
+    hits = [f'key-{random.randrange(size)}' for _ in range(lookups)]
+    misses = [f'missing-{n}' for n in range(lookups)]
+    print(f'get latency, {size} keys, {lookups} lookups (microseconds)')
+    print(
+        f"{'table':<22}{'lookup':<8}{'p50':>8}{'p99':>8}{'p99.9':>8}"
+        f"{'max':>10}")
+
+    tables: list[tuple[str, HashTable[int] | CuckooHashTable[int]]] = [
+        ('HashTable', HashTable()),
+        ('RobinHoodHashTable', RobinHoodHashTable()),
+        ('CuckooHashTable(2)', CuckooHashTable(2)),
+        ('CuckooHashTable(3)', CuckooHashTable(3)),
+    ]
+
+    for label, table in tables:
+        for n in range(size):
+            table.put(f'key-{n}', n)
+
+        for kind, keys in [('hit', hits), ('miss', misses)]:
+            samples = time_gets(table, keys)
+            print(
+                f'{label:<22}{kind:<8}'
+                f'{percentile(samples, 0.5) * 1e6:>8.2f}'
+                f'{percentile(samples, 0.99) * 1e6:>8.2f}'
+                f'{percentile(samples, 0.999) * 1e6:>8.2f}'
+                f'{max(samples) * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:3]])
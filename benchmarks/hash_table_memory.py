@@ -0,0 +1,53 @@
+import tracemalloc
+from functools import partial
+from sys import argv
+from typing import Any, Callable
+
+from data_structures import CompactHashTable, HashTable
+
+
+WARM_UP_SIZE = 100
+
+
+def traced_size(
+    fill: Callable[[list[str], list[int]], Any],
+    keys: list[str],
+    values: list[int],
+) -> int:
+    warm_up = fill(keys[:WARM_UP_SIZE], values[:WARM_UP_SIZE])
+    del warm_up
+    tracemalloc.start()
+    container = fill(keys, values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return size
+
+
+def fill_table(table_type: type, keys: list[str], values: list[int]) -> Any:
+    table = table_type()
+
+    for key, value in zip(keys, values):
+        table.put(key, value)
+
+    return table
+
+
+def measure(table_type: type, keys: list[str], values: list[int]) -> int:
+    return traced_size(partial(fill_table, table_type), keys, values)
+
+
+def main(*sizes: int):
+    print('HashTable memory footprint (bytes per key, excluding keys/values)')
+    print(f"{'keys':>12}{'HashTable':>14}{'CompactHashTable':>20}")
+
+    for size in sizes or (10 ** 5, 10 ** 6, 10 ** 7):
+        keys = [f'key-{n}' for n in range(size)]
+        values = list(range(size))
+        tuples = measure(HashTable, keys, values)
+        compact = measure(CompactHashTable, keys, values)
+        print(f'{size:>12}{tuples / size:>14.1f}{compact / size:>20.1f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:]])
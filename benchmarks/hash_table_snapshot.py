@@ -0,0 +1,58 @@
+import os
+import pickle
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+
+from data_structures import HashTable
+
+
+def timed(function: Callable[[], object]) -> float:
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def pickle_items(table: HashTable[int], path: str):
+    with open(path, 'wb') as file:
+        pickle.dump(list(table.items()), file, pickle.HIGHEST_PROTOCOL)
+
+
+def unpickle_items(path: str) -> HashTable[int]:
+    with open(path, 'rb') as file:
+        return HashTable.from_items(pickle.load(file))
+
+
+def pickle_table(table: HashTable[int], path: str):
+    with open(path, 'wb') as file:
+        pickle.dump(table, file, pickle.HIGHEST_PROTOCOL)
+
+
+def unpickle_table(path: str) -> HashTable[int]:
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+def main(size: int = 1_000_000):
+    table = HashTable.from_items((f'key-{n}', n) for n in range(size))
+    print(f'Snapshot round trip: {size} str keys')
+    print(f"{'format':>16}{'dump (s)':>12}{'load (s)':>12}{'MB':>10}")
+
+    with TemporaryDirectory() as directory:
+        for label, dump, load in [
+            ('pickle items', pickle_items, unpickle_items),
+            ('pickle table', pickle_table, unpickle_table),
+            ('snapshot', lambda t, p: t.dump(p), HashTable.load),
+        ]:
+            path = os.path.join(directory, label.replace(' ', '_'))
+            dump_time = timed(lambda: dump(table, path))
+            load_time = timed(lambda: load(path))
+            megabytes = os.path.getsize(path) / 2 ** 20
+            print(
+                f'{label:>16}{dump_time:>12.3f}{load_time:>12.3f}'
+                f'{megabytes:>10.1f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:2]])
@@ -0,0 +1,80 @@
+import tracemalloc
+from sys import argv
+from time import perf_counter
+
+from data_structures import LinkedList, UnrolledLinkedList
+
+
+def walk_linked_list(l: LinkedList) -> int:
+    total = 0
+    node = l._head
+
+    while node:
+        total += node.data
+        node = node.next
+
+    return total
+
+
+def walk_unrolled_linked_list(l: UnrolledLinkedList) -> int:
+    total = 0
+
+    for data in l:
+        total += data
+
+    return total
+
+
+def measure(build, walk, size: int) -> tuple[float, float, float]:
+    tracemalloc.start()
+    start = perf_counter()
+    l = build(size)
+    build_time = perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = perf_counter()
+    total = walk(l)
+    walk_time = perf_counter() - start
+    assert total == size * (size - 1) // 2
+    return (memory / size, build_time, walk_time)
+
+
+def build_linked_list(size: int) -> LinkedList[int]:
+    l: LinkedList[int] = LinkedList()
+
+    for n in range(size):
+        l.append(n)
+
+    return l
+
+
+def build_unrolled(chunk_size: int):
+    def build(size: int) -> UnrolledLinkedList[int]:
+        l: UnrolledLinkedList[int] = UnrolledLinkedList(chunk_size=chunk_size)
+
+        for n in range(size):
+            l.append(n)
+
+        return l
+
+    return build
+
+
+def main(size: int = 10 ** 6):
+    print(f'{size} int elements appended then summed by iteration')
+    print(f"{'list':>22}{'bytes/item':>12}{'append (s)':>12}"
+          f"{'iterate (s)':>13}")
+    candidates = [('LinkedList', build_linked_list, walk_linked_list)] + [
+        (f'Unrolled (K={chunk_size})', build_unrolled(chunk_size),
+         walk_unrolled_linked_list)
+        for chunk_size in (16, 64, 256)]
+
+    for name, build, walk in candidates:
+        memory, build_time, walk_time = measure(build, walk, size)
+        print(f'{name:>22}{memory:>12.1f}{build_time:>12.3f}'
+              f'{walk_time:>13.3f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:]])
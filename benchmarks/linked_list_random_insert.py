@@ -0,0 +1,45 @@
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from data_structures import IndexableSkipList, LinkedList
+
+
+def random_inserts(l, positions: list[int]) -> float:
+    start = perf_counter()
+
+    for n, position in enumerate(positions):
+        l.insert(n, position)
+
+    return perf_counter() - start
+
+
+def random_reads(l: IndexableSkipList, positions: list[int]) -> float:
+    start = perf_counter()
+
+    for position in positions:
+        l[position]
+
+    return perf_counter() - start
+
+
+def main(size: int = 20000):
+    random = Random(0)
+    positions = [random.randrange(n + 1) for n in range(size)]
+    reads = [random.randrange(size) for _ in range(size)]
+    print(f'{size} inserts at random positions, then {size} random reads')
+    print(f"{'list':>20}{'insert (s)':>12}{'read (s)':>10}")
+
+    linked_list: LinkedList[int] = LinkedList()
+    insert_time = random_inserts(linked_list, positions)
+    print(f"{'LinkedList':>20}{insert_time:>12.3f}{'n/a':>10}")
+
+    skip_list: IndexableSkipList[int] = IndexableSkipList()
+    insert_time = random_inserts(skip_list, positions)
+    read_time = random_reads(skip_list, reads)
+    print(f"{'IndexableSkipList':>20}{insert_time:>12.3f}{read_time:>10.3f}")
+    assert list(skip_list) == list(linked_list)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:]])
@@ -0,0 +1,48 @@
+import tracemalloc
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from data_structures import LinkedList
+
+
+def measure(sort, values: list[int]) -> tuple[float, int]:
+    l = LinkedList(*values)
+    start = perf_counter()
+    l = sort(l)
+    elapsed = perf_counter() - start
+    assert list(l) == sorted(values)
+
+    l = LinkedList(*values)
+    tracemalloc.start()
+    sort(l)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+
+def sort_in_place(l: LinkedList[int]) -> LinkedList[int]:
+    l.sort()
+    return l
+
+
+def rebuild_sorted(l: LinkedList[int]) -> LinkedList[int]:
+    return LinkedList(*sorted(list(l)))
+
+
+def main(size: int = 10 ** 6):
+    random = Random(0)
+    values = [random.randrange(size) for _ in range(size)]
+    print(f'Sorting a LinkedList of {size} random ints')
+    print(f"{'method':>32}{'time (s)':>10}{'peak MiB':>10}")
+
+    for name, sort in [
+        ('LinkedList.sort()', sort_in_place),
+        ('LinkedList(*sorted(list(l)))', rebuild_sorted),
+    ]:
+        elapsed, peak = measure(sort, values)
+        print(f'{name:>32}{elapsed:>10.3f}{peak / 2 ** 20:>10.1f}')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in argv[1:]])
@@ -1,8 +1,17 @@
-from .hash_table import HashTable
-from .linked_list import LinkedList
+from .cache import Cache, memoize
+from .hash_table import (
+    CompactHashTable, ConcurrentHashTable, CuckooHashTable, HashTable,
+    PersistentHashTable, RobinHoodHashTable, SharedHashTable, TypedHashTable,)
+from .linked_list import (
+    DoublyLinkedList, IndexableSkipList, LinkedList, UnrolledLinkedList,)
 from .queue import Queue
 from .stack import Stack
 from .tree import BinarySearchTree
 
 
-__all__ = ['HashTable', 'LinkedList', 'Queue', 'Stack', 'BinarySearchTree']
+__all__ = [
+    'Cache', 'memoize', 'CompactHashTable', 'ConcurrentHashTable',
+    'CuckooHashTable', 'HashTable', 'PersistentHashTable',
+    'RobinHoodHashTable', 'SharedHashTable', 'TypedHashTable',
+    'DoublyLinkedList', 'IndexableSkipList', 'LinkedList',
+    'UnrolledLinkedList', 'Queue', 'Stack', 'BinarySearchTree',]
@@ -0,0 +1,8 @@
+from .cache import Cache
+from .eviction import ClockPolicy, EvictionPolicy, LFUPolicy, LRUPolicy
+from .memoize import memoize
+
+
+__all__ = [
+    'Cache', 'ClockPolicy', 'EvictionPolicy', 'LFUPolicy', 'LRUPolicy',
+    'memoize',]
@@ -0,0 +1,178 @@
+from time import monotonic
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from ..hash_table import HashTable
+from .eviction import (
+    CacheEntry, ClockPolicy, EvictionPolicy, LFUPolicy, LRUPolicy,)
+
+
+VT = TypeVar('VT')
+
+POLICIES: Dict[str, Callable[[], EvictionPolicy]] = {
+    'lru': LRUPolicy,
+    'lfu': LFUPolicy,
+    'clock': ClockPolicy,
+}
+
+
+class Cache(Generic[VT]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        policy: str | EvictionPolicy = 'lru',
+        timer: Callable[[], float] = monotonic,
+    ):
+        if isinstance(max_size, bool) or not isinstance(max_size, int):
+            raise TypeError('Max size must be an integer!')
+        elif max_size < 1:
+            raise ValueError('Max size must be positive!')
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError('TTL must be a positive number of seconds!')
+
+        if isinstance(policy, str):
+            if policy not in POLICIES:
+                raise ValueError(f"Unknown eviction policy {policy!r}!")
+
+            policy = POLICIES[policy]()
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._policy = policy
+        self._timer = timer
+        self._table: HashTable[CacheEntry[VT]] = HashTable()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._next_expiry: Optional[float] = None
+
+
+    def _lookup(self, key: Hashable) -> Optional[CacheEntry[VT]]:
+        try:
+            entry = self._table.get(key)
+        except KeyError:
+            return None
+
+        if entry.expires is not None and entry.expires <= self._timer():
+            self._remove_entry(entry)
+            self._expirations += 1
+            return None
+
+        return entry
+
+
+    def _purge_expired(self):
+        now = self._timer()
+
+        if self._next_expiry is None or self._next_expiry > now:
+            return
+
+        self._next_expiry = None
+
+        for key, entry in list(self._table.items()):
+            if entry.expires is None:
+                continue
+            elif entry.expires <= now:
+                self._remove_entry(entry)
+                self._expirations += 1
+            elif self._next_expiry is None or \
+                    entry.expires < self._next_expiry:
+                self._next_expiry = entry.expires
+
+
+    def _remove_entry(self, entry: CacheEntry[VT]):
+        self._table.delete(entry.key)
+        self._policy.remove(entry)
+
+
+    def __getitem__(self, key: Hashable) -> VT:
+        entry = self._lookup(key)
+
+        if not entry:
+            self._misses += 1
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._hits += 1
+        self._policy.touch(entry)
+        return entry.value
+
+
+    def __setitem__(self, key: Hashable, value: VT):
+        self.put(key, value)
+
+
+    def __delitem__(self, key: Hashable):
+        entry = self._lookup(key)
+
+        if not entry:
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._remove_entry(entry)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+    def __repr__(self) -> str:
+        return str({ key: entry.value for key, entry in self._table.items() })
+
+
+    def get(self, key: Hashable) -> VT:
+        return self.__getitem__(key)
+
+
+    def put(self, key: Hashable, value: VT, ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = self._ttl
+        elif ttl <= 0:
+            raise ValueError('TTL must be a positive number of seconds!')
+
+        expires = None if ttl is None else self._timer() + ttl
+        entry = self._lookup(key)
+
+        if expires is not None and \
+                (self._next_expiry is None or expires < self._next_expiry):
+            self._next_expiry = expires
+
+        if entry:
+            entry.value = value
+            entry.expires = expires
+            self._policy.touch(entry)
+            return
+
+        if len(self._table) >= self._max_size:
+            self._purge_expired()
+
+        if len(self._table) >= self._max_size:
+            self._remove_entry(self._policy.victim())
+            self._evictions += 1
+
+        entry = CacheEntry(key, value, expires)
+        self._table.put(key, entry)
+        self._policy.add(entry)
+
+
+    def delete(self, key: Hashable):
+        return self.__delitem__(key)
+
+
+    def clear(self):
+        for key, entry in list(self._table.items()):
+            self._remove_entry(entry)
+
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'size': len(self._table),
+        }
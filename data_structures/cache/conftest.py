@@ -0,0 +1,24 @@
+import pytest
+
+from . import Cache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_timer() -> FakeTimer:
+    return FakeTimer()
+
+
+@pytest.fixture
+def example_cache_small() -> Cache[str]:
+    c: Cache[str] = Cache(3)
+    c.put('first', 'first@email.dev')
+    c.put('second', 'second@email.dev')
+    return c
@@ -0,0 +1,216 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Hashable, Optional, TypeVar
+
+
+VT = TypeVar('VT')
+
+class CacheEntry(Generic[VT]):
+    __slots__ = (
+        'key', 'value', 'expires', 'prev', 'next', 'bucket', 'referenced',)
+
+    def __init__(self, key: Hashable, value: VT, expires: Optional[float]):
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.prev: Optional['CacheEntry[VT]'] = None
+        self.next: Optional['CacheEntry[VT]'] = None
+        self.bucket: Optional['FrequencyBucket'] = None
+        self.referenced = False
+
+    def __repr__(self):
+        return str({
+            'key': self.key,
+            'value': self.value,
+            'expires': self.expires,
+            'address': hex(id(self)),
+        })
+
+
+class EntryList:
+    def __init__(self):
+        self._sentinel: CacheEntry = CacheEntry(None, None, None)
+        self._sentinel.prev = self._sentinel.next = self._sentinel
+
+
+    def __bool__(self) -> bool:
+        return self._sentinel.next is not self._sentinel
+
+
+    def first(self) -> CacheEntry:
+        return self._sentinel.next # type: ignore
+
+
+    def append(self, entry: CacheEntry):
+        last = self._sentinel.prev
+        entry.prev = last
+        entry.next = self._sentinel
+        last.next = entry # type: ignore
+        self._sentinel.prev = entry
+
+
+    def remove(self, entry: CacheEntry):
+        entry.prev.next = entry.next # type: ignore
+        entry.next.prev = entry.prev # type: ignore
+        entry.prev = entry.next = None
+
+
+class FrequencyBucket:
+    __slots__ = ('frequency', 'entries', 'prev', 'next')
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.entries = EntryList()
+        self.prev: Optional['FrequencyBucket'] = None
+        self.next: Optional['FrequencyBucket'] = None
+
+
+class EvictionPolicy(ABC):
+    @abstractmethod
+    def add(self, entry: CacheEntry):
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def touch(self, entry: CacheEntry):
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def remove(self, entry: CacheEntry):
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def victim(self) -> CacheEntry:
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    def __init__(self):
+        self._entries = EntryList()
+
+
+    def add(self, entry: CacheEntry):
+        self._entries.append(entry)
+
+
+    def touch(self, entry: CacheEntry):
+        self._entries.remove(entry)
+        self._entries.append(entry)
+
+
+    def remove(self, entry: CacheEntry):
+        self._entries.remove(entry)
+
+
+    def victim(self) -> CacheEntry:
+        return self._entries.first()
+
+
+class LFUPolicy(EvictionPolicy):
+    def __init__(self):
+        self._head = FrequencyBucket(0)
+        self._head.prev = self._head.next = self._head
+
+
+    def _insert_bucket(
+        self,
+        after: FrequencyBucket,
+        frequency: int,
+    ) -> FrequencyBucket:
+        bucket = FrequencyBucket(frequency)
+        bucket.prev = after
+        bucket.next = after.next
+        after.next.prev = bucket # type: ignore
+        after.next = bucket
+        return bucket
+
+
+    def _unlink_entry(self, entry: CacheEntry) -> FrequencyBucket:
+        bucket: FrequencyBucket = entry.bucket # type: ignore
+        bucket.entries.remove(entry)
+        entry.bucket = None
+
+        if not bucket.entries:
+            bucket.prev.next = bucket.next # type: ignore
+            bucket.next.prev = bucket.prev # type: ignore
+            return bucket.prev # type: ignore
+
+        return bucket
+
+
+    def add(self, entry: CacheEntry):
+        bucket: FrequencyBucket = self._head.next # type: ignore
+
+        if bucket is self._head or bucket.frequency != 1:
+            bucket = self._insert_bucket(self._head, 1)
+
+        bucket.entries.append(entry)
+        entry.bucket = bucket
+
+
+    def touch(self, entry: CacheEntry):
+        frequency = entry.bucket.frequency + 1 # type: ignore
+        previous = self._unlink_entry(entry)
+        bucket: FrequencyBucket = previous.next # type: ignore
+
+        if bucket is self._head or bucket.frequency != frequency:
+            bucket = self._insert_bucket(previous, frequency)
+
+        bucket.entries.append(entry)
+        entry.bucket = bucket
+
+
+    def remove(self, entry: CacheEntry):
+        self._unlink_entry(entry)
+
+
+    def victim(self) -> CacheEntry:
+        return self._head.next.entries.first() # type: ignore
+
+
+class ClockPolicy(EvictionPolicy):
+    def __init__(self):
+        self._hand: Optional[CacheEntry] = None
+
+
+    def add(self, entry: CacheEntry):
+        hand = self._hand
+
+        if hand is None:
+            entry.prev = entry.next = entry
+            self._hand = entry
+            return
+
+        entry.prev = hand.prev
+        entry.next = hand
+        hand.prev.next = entry # type: ignore
+        hand.prev = entry
+
+
+    def touch(self, entry: CacheEntry):
+        entry.referenced = True
+
+
+    def remove(self, entry: CacheEntry):
+        if entry.next is entry:
+            self._hand = None
+        else:
+            if self._hand is entry:
+                self._hand = entry.next
+
+            entry.prev.next = entry.next # type: ignore
+            entry.next.prev = entry.prev # type: ignore
+
+        entry.prev = entry.next = None
+
+
+    def victim(self) -> CacheEntry:
+        hand: CacheEntry = self._hand # type: ignore
+
+        while hand.referenced:
+            hand.referenced = False
+            hand = hand.next # type: ignore
+
+        self._hand = hand
+        return hand
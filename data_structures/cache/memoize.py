@@ -0,0 +1,39 @@
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar
+
+from .cache import Cache
+from .eviction import EvictionPolicy
+
+
+RT = TypeVar('RT')
+
+KWARGS_MARK = object()
+
+def memoize(
+    max_size: int = 128,
+    ttl: Optional[float] = None,
+    policy: str | EvictionPolicy = 'lru',
+) -> Callable[[Callable[..., RT]], Callable[..., RT]]:
+    def decorator(function: Callable[..., RT]) -> Callable[..., RT]:
+        cache: Cache[Any] = Cache(max_size, ttl, policy)
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> RT:
+            key = args
+
+            if kwargs:
+                key += (KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+            try:
+                return cache.get(key)
+            except KeyError:
+                pass
+
+            result = function(*args, **kwargs)
+            cache.put(key, result)
+            return result
+
+        wrapper.cache = cache # type: ignore
+        return wrapper
+
+    return decorator
@@ -0,0 +1,182 @@
+from typing import Any
+
+import pytest
+
+from . import (
+    Cache, ClockPolicy, EvictionPolicy, LFUPolicy, LRUPolicy, memoize,)
+
+
+def test_cache_get_put_delete(example_cache_small: Cache[str]):
+    c = example_cache_small
+    assert len(c) == 2
+    assert c.get('first') == 'first@email.dev'
+    c.put('first', 'updated@email.dev')
+    c['third'] = 'third@email.dev'
+    assert c['first'] == 'updated@email.dev'
+    assert 'third' in c
+    c.delete('second')
+    del c['third']
+    assert len(c) == 1
+    assert 'second' not in c
+
+    for method in [c.get, c.delete]:
+        with pytest.raises(KeyError) as e:
+            method('second')
+
+        assert "Key 'second' not found!" in str(e.value)
+
+    c.clear()
+    assert len(c) == 0
+    assert c.stats() == {
+        'hits': 2, 'misses': 1, 'evictions': 0, 'expirations': 0, 'size': 0}
+
+
+def test_cache_lru_eviction(example_cache_small: Cache[str]):
+    c = example_cache_small
+    c.put('third', 'third@email.dev')
+    c.get('first')
+    c.put('fourth', 'fourth@email.dev')
+    assert 'second' not in c
+    c.put('fifth', 'fifth@email.dev')
+    assert 'third' not in c
+    assert sorted(c._table.keys(), key=str) == ['fifth', 'first', 'fourth']
+    assert c.stats()['evictions'] == 2
+
+
+def test_cache_lfu_eviction():
+    c: Cache[int] = Cache(3, None, 'lfu')
+    assert isinstance(c._policy, LFUPolicy)
+
+    for key in ['a', 'b', 'c']:
+        c.put(key, 0)
+
+    for key in ['a', 'a', 'b', 'c', 'c', 'c']:
+        c.get(key)
+
+    c.put('d', 0)
+    assert 'b' not in c
+    c.put('e', 0)
+    assert 'd' not in c
+    c.get('e')
+    c.get('e')
+    c.put('f', 0)
+    assert sorted(c._table.keys()) == ['c', 'e', 'f']
+    c.delete('c')
+    c.put('g', 0)
+    c.put('h', 0)
+    assert sorted(c._table.keys()) == ['e', 'g', 'h']
+
+
+def test_cache_clock_eviction():
+    c: Cache[int] = Cache(3, None, 'clock')
+    assert isinstance(c._policy, ClockPolicy)
+
+    for key in ['a', 'b', 'c']:
+        c.put(key, 0)
+
+    c.get('a')
+    c.put('d', 0)
+    assert sorted(c._table.keys()) == ['a', 'c', 'd']
+    c.get('c')
+    c.get('d')
+    c.put('e', 0)
+    assert sorted(c._table.keys()) == ['c', 'd', 'e']
+    c.delete('c')
+    c.delete('d')
+    c.delete('e')
+    c.put('f', 0)
+    assert c._policy._hand.key == 'f'
+
+
+def test_cache_ttl(fake_timer):
+    c: Cache[int] = Cache(3, 10, LRUPolicy(), fake_timer)
+    c.put('a', 1)
+    c.put('b', 2, 30)
+    fake_timer.now = 10
+    assert 'a' not in c
+    assert c.get('b') == 2
+    fake_timer.now = 20
+    c.put('b', 3)
+    fake_timer.now = 29
+    assert 'b' in c
+    fake_timer.now = 30
+
+    with pytest.raises(KeyError):
+        c.get('b')
+
+    assert c.stats() == {
+        'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 2, 'size': 0}
+
+
+def test_cache_evicts_expired_before_live(fake_timer):
+    c: Cache[int] = Cache(3, None, LRUPolicy(), fake_timer)
+    c.put('live', 1)
+    c.put('short', 2, 5)
+    c.put('long', 3, 50)
+    fake_timer.now = 10
+    c.put('new', 4)
+    assert sorted(c._table.keys(), key=str) == ['live', 'long', 'new']
+    assert c.stats()['evictions'] == 0
+    assert c.stats()['expirations'] == 1
+    c.put('newer', 5)
+    assert 'live' not in c
+    assert c.stats()['evictions'] == 1
+    fake_timer.now = 50
+    c.put('newest', 6)
+    assert sorted(c._table.keys(), key=str) == ['new', 'newer', 'newest']
+    assert c.stats()['evictions'] == 1
+    assert c.stats()['expirations'] == 2
+
+
+def test_cache_fail_options():
+    for args, error, message in [
+        (('3',), TypeError, 'Max size must be an integer!'),
+        ((0,), ValueError, 'Max size must be positive!'),
+        ((3, 0), ValueError, 'TTL must be a positive number of seconds!'),
+        ((3, None, 'fifo'), ValueError, "Unknown eviction policy 'fifo'!"),
+    ]:
+        with pytest.raises(error) as e:
+            Cache(*args) # type: ignore
+
+        assert message in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        Cache(3).put('a', 1, -1)
+
+    assert 'TTL must be a positive number of seconds!' in str(e.value)
+
+
+def test_cache_memoize():
+    calls = []
+
+    @memoize(2)
+    def square(n: int, offset: int = 0) -> int:
+        calls.append(n)
+        return n * n + offset
+
+    assert square(2) == 4
+    assert square(2) == 4
+    assert square(2, offset=1) == 5
+    assert square(3) == 9
+    assert square(2) == 4
+    assert calls == [2, 2, 3, 2]
+    assert square.__name__ == 'square'
+    assert square.cache.stats() == { # type: ignore
+        'hits': 1, 'misses': 4, 'evictions': 2, 'expirations': 0, 'size': 2}
+
+
+def test_cache_memoize_keyword_key_collision():
+    @memoize()
+    def describe(*args: Any, **kwargs: Any) -> str:
+        return f'{args} {kwargs}'
+
+    assert describe(a=1) == "() {'a': 1}"
+    assert describe((), (('a', 1),)) == "((), (('a', 1),)) {}"
+    assert describe(1, b=2) == "(1,) {'b': 2}"
+    assert describe(1, 'b', 2) == "(1, 'b', 2) {}"
+    assert describe.cache.stats()['misses'] == 4 # type: ignore
+
+
+def test_cache_eviction_policy_is_abstract():
+    with pytest.raises(TypeError):
+        EvictionPolicy() # type: ignore
@@ -1,4 +1,14 @@
+from .compact_hash_table import CompactHashTable
+from .concurrent_hash_table import ConcurrentHashTable
+from .cuckoo_hash_table import CuckooHashTable
 from .hash_table import HashTable
+from .persistent_hash_table import PersistentHashTable
+from .robin_hood_hash_table import RobinHoodHashTable
+from .shared_hash_table import SharedHashTable
+from .typed_hash_table import TypedHashTable
 
 
-__all__ = ['HashTable']
+__all__ = [
+    'CompactHashTable', 'ConcurrentHashTable', 'CuckooHashTable', 'HashTable',
+    'PersistentHashTable', 'RobinHoodHashTable', 'SharedHashTable',
+    'TypedHashTable',]
@@ -0,0 +1,241 @@
+from array import array
+from typing import (
+    Any, Generic, Hashable, Iterable, Iterator, List, MutableSequence, Tuple,
+    Type, TypeVar,)
+
+from ..utils import hash_key
+
+
+VT = TypeVar('VT')
+
+EMPTY = -1
+DUMMY = -2
+DELETED = object()
+
+
+def _index_typecode(size: int) -> str:
+    if size <= 2 ** 7:
+        return 'b'
+    elif size <= 2 ** 15:
+        return 'h'
+    elif size <= 2 ** 31:
+        return 'i'
+    else:
+        return 'q'
+
+
+class CompactHashTable(Generic[VT]):
+    _empty_value: Any = None
+
+    def __init__(self, **kwargs: VT):
+        if not kwargs:
+            self._data_type = None
+        else:
+            self._data_type = self._check_data_types(**kwargs)
+
+        self._hashes: array = array('q')
+        self._keys: List[Hashable] = []
+        self._values = self._new_values()
+        self._num_entries = 0
+        self._version = 0
+        self._indices = self._new_indices(max(len(kwargs) * 3, 8))
+
+        for key, value in kwargs.items():
+            self._insert_item(key, value)
+
+
+    def _check_data_types(self, **kwargs: VT) -> Type[VT]:
+        kwargs_values = list(kwargs.values())
+
+        for index, value in enumerate(kwargs_values):
+            if not isinstance(value, type(kwargs_values[index - 1])):
+                raise TypeError('All entries must have the same type!')
+
+        return type(kwargs_values[0])
+
+
+    def _new_values(
+        self,
+        values: Iterable[Any] = (),
+    ) -> MutableSequence[Any]:
+        return list(values)
+
+
+    def _new_indices(self, min_size: int) -> array:
+        size = 8
+
+        while size < min_size:
+            size <<= 1
+
+        return array(_index_typecode(size), [EMPTY]) * size
+
+
+    def _search_indices(self, key: Hashable, key_hash: int) -> Tuple[int, int]:
+        indices = self._indices
+        mask = len(indices) - 1
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        slot = key_hash & mask
+
+        while True:
+            index = indices[slot]
+
+            if index == EMPTY:
+                return (slot, EMPTY)
+
+            if index != DUMMY and self._hashes[index] == key_hash:
+                found = self._keys[index]
+
+                if found is key or found == key:
+                    return (slot, index)
+
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+
+
+    def _resize(self):
+        if self._num_entries < len(self._keys):
+            live = [
+                index for index, key in enumerate(self._keys)
+                if key is not DELETED]
+            self._hashes = array('q', [self._hashes[i] for i in live])
+            self._keys = [self._keys[i] for i in live]
+            self._values = self._new_values(self._values[i] for i in live)
+
+        indices = self._indices = self._new_indices(self._num_entries * 3)
+        mask = len(indices) - 1
+
+        for index, key_hash in enumerate(self._hashes):
+            perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+            slot = key_hash & mask
+
+            while indices[slot] != EMPTY:
+                perturb >>= 5
+                slot = (slot * 5 + perturb + 1) & mask
+
+            indices[slot] = index
+
+
+    def _entries(self) -> Iterator[Tuple[Hashable, VT]]:
+        version = self._version
+        keys = self._keys
+        values = self._values
+
+        for index in range(len(keys)):
+            if self._version != version:
+                raise RuntimeError(
+                    'CompactHashTable changed size during iteration!')
+
+            key = keys[index]
+
+            if key is not DELETED:
+                yield (key, values[index]) # type: ignore
+
+
+    def _insert_item(self, key: Hashable, value: VT):
+        key_hash = hash_key(key)
+
+        if not self._data_type:
+            self._data_type = type(value)
+        elif not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        slot, index = self._search_indices(key, key_hash)
+
+        if index != EMPTY:
+            raise ValueError(f"Key {key!r} already exists!")
+
+        self._values.append(value)
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._num_entries += 1
+        self._version += 1
+
+        if len(self._keys) * 3 >= len(self._indices) * 2:
+            self._resize()
+
+
+    def __getitem__(self, key: Hashable) -> VT:
+        key_hash = hash_key(key)
+
+        index = self._search_indices(key, key_hash)[1]
+
+        if index == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        return self._values[index] # type: ignore
+
+
+    def __setitem__(self, key: Hashable, value: VT):
+        key_hash = hash_key(key)
+
+        if self._data_type and not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        index = self._search_indices(key, key_hash)[1]
+
+        if index == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._values[index] = value
+
+
+    def __delitem__(self, key: Hashable):
+        key_hash = hash_key(key)
+
+        slot, index = self._search_indices(key, key_hash)
+
+        if index == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._indices[slot] = DUMMY
+        self._keys[index] = DELETED
+        self._values[index] = self._empty_value
+        self._num_entries -= 1
+        self._version += 1
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._search_indices(key, hash_key(key))[1] != EMPTY
+
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
+
+
+    def __len__(self) -> int:
+        return self._num_entries
+
+
+    def __repr__(self) -> str:
+        return str({ key: value for key, value in self._entries() })
+
+
+    def keys(self) -> Iterator[Hashable]:
+        for key, value in self._entries():
+            yield key
+
+
+    def values(self) -> Iterator[VT]:
+        for key, value in self._entries():
+            yield value
+
+
+    def items(self) -> Iterator[Tuple[Hashable, VT]]:
+        return self._entries()
+
+
+    def get(self, key: Hashable) -> VT:
+        return self.__getitem__(key)
+
+
+    def put(self, key: Hashable, value: VT):
+        self._insert_item(key, value)
+
+
+    def update(self, key: Hashable, value: VT):
+        return self.__setitem__(key, value)
+
+
+    def delete(self, key: Hashable):
+        return self.__delitem__(key)
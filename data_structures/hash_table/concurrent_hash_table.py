@@ -0,0 +1,127 @@
+from threading import Lock
+from typing import (
+    Generic, Hashable, Iterator, List, Optional, Tuple, Type, TypeVar,)
+
+from ..utils import hash_key
+from .hash_table import HashTable
+
+
+VT = TypeVar('VT')
+
+class ConcurrentHashTable(Generic[VT]):
+    def __init__(self, num_shards: int = 16, /, **kwargs: VT):
+        if isinstance(num_shards, bool) or not isinstance(num_shards, int):
+            raise TypeError('Number of shards must be an integer!')
+        elif num_shards < 1:
+            raise ValueError('Number of shards must be positive!')
+
+        self._shards: List[HashTable[VT]] = \
+            [HashTable() for _ in range(num_shards)]
+        self._locks = [Lock() for _ in range(num_shards)]
+        self._type_lock = Lock()
+        self._data_type: Optional[Type[VT]] = None
+
+        for key, value in kwargs.items():
+            self.put(key, value)
+
+
+    def _shard(self, key: Hashable) -> Tuple[HashTable[VT], Lock]:
+        index = hash_key(key) % len(self._shards)
+        return (self._shards[index], self._locks[index])
+
+
+    def _check_value_type(self, value: VT):
+        if not self._data_type:
+            with self._type_lock:
+                if not self._data_type:
+                    self._data_type = type(value)
+                    return
+
+        if not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+
+    def _entries(self) -> Iterator[Tuple[Hashable, VT]]:
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                items = list(shard.items())
+
+            yield from items
+
+
+    def __getitem__(self, key: Hashable) -> VT:
+        shard, lock = self._shard(key)
+
+        with lock:
+            return shard[key]
+
+
+    def __setitem__(self, key: Hashable, value: VT):
+        shard, lock = self._shard(key)
+
+        if self._data_type and not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        with lock:
+            shard[key] = value
+
+
+    def __delitem__(self, key: Hashable):
+        shard, lock = self._shard(key)
+
+        with lock:
+            del shard[key]
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        shard, lock = self._shard(key)
+
+        with lock:
+            return key in shard
+
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
+
+
+    def __len__(self) -> int:
+        return sum(shard._num_entries for shard in self._shards)
+
+
+    def __repr__(self) -> str:
+        return str({ key: value for key, value in self._entries() })
+
+
+    def keys(self) -> Iterator[Hashable]:
+        for key, value in self._entries():
+            yield key
+
+
+    def values(self) -> Iterator[VT]:
+        for key, value in self._entries():
+            yield value
+
+
+    def items(self) -> Iterator[Tuple[Hashable, VT]]:
+        return self._entries()
+
+
+    def get(self, key: Hashable) -> VT:
+        return self.__getitem__(key)
+
+
+    def put(self, key: Hashable, value: VT):
+        shard, lock = self._shard(key)
+        self._check_value_type(value)
+
+        with lock:
+            shard._data_type = self._data_type
+            shard.put(key, value)
+
+
+    def update(self, key: Hashable, value: VT):
+        return self.__setitem__(key, value)
+
+
+    def delete(self, key: Hashable):
+        return self.__delitem__(key)
@@ -1,6 +1,6 @@
 import pytest
 
-from . import HashTable
+from . import CompactHashTable, HashTable, RobinHoodHashTable
 
 
 @pytest.fixture
@@ -26,3 +26,16 @@ def example_hash_table_large() -> HashTable[str]:
         ninth='ninth@email.dev', tenth='tenth@email.dev',
         eleventh='eleventh@email.dev', twelfth='twelfth@email.dev',)
 
+
+
+@pytest.fixture
+def example_compact_hash_table_small() -> CompactHashTable[str]:
+    return CompactHashTable(first='first@email.dev', second='second@email.dev')
+
+
+@pytest.fixture
+def example_robin_hood_hash_table_medium() -> RobinHoodHashTable[str]:
+    return RobinHoodHashTable(
+        first='first@email.dev', second='second@email.dev',
+        third='third@email.dev', fourth='fourth@email.dev',
+        fifth='fifth@email.dev', sixth='sixth@email.dev',)
@@ -0,0 +1,276 @@
+from random import Random
+from typing import (
+    Generic, Hashable, Iterator, List, Optional, Tuple, Type, TypeVar,)
+
+from ..utils import hash_key
+
+
+VT = TypeVar('VT')
+Entry = Tuple[int, Hashable, VT]
+
+BUCKET_SIZE = 4
+STASH_SIZE = 4
+MAX_KICKS = 100
+MAX_REHASHES = 8
+MAX_LOAD = 0.9
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+class CuckooHashTable(Generic[VT]):
+    def __init__(self, num_hashes: int = 2, /, **kwargs: VT):
+        if isinstance(num_hashes, bool) or not isinstance(num_hashes, int):
+            raise TypeError('Number of hashes must be an integer!')
+        elif num_hashes < 2:
+            raise ValueError('Number of hashes must be at least 2!')
+
+        if not kwargs:
+            self._data_type = None
+        else:
+            self._data_type = self._check_data_types(**kwargs)
+
+        self._num_hashes = num_hashes
+        self._random = Random(0)
+        self._num_entries = 0
+        self._version = 0
+        self._num_rehashes = 0
+        self._stash: List[Entry[VT]] = []
+        self._new_tables(1)
+
+        while len(kwargs) > len(self._slots) * MAX_LOAD:
+            self._new_tables(self._num_buckets * 2)
+
+        for key, value in kwargs.items():
+            self._insert_item(key, value)
+
+
+    def _check_data_types(self, **kwargs: VT) -> Type[VT]:
+        kwargs_values = list(kwargs.values())
+
+        for index, value in enumerate(kwargs_values):
+            if not isinstance(value, type(kwargs_values[index - 1])):
+                raise TypeError('All entries must have the same type!')
+
+        return type(kwargs_values[0])
+
+
+    def _new_tables(self, num_buckets: int):
+        self._num_buckets = num_buckets
+        self._shift = 65 - num_buckets.bit_length()
+        self._multipliers = [
+            self._random.getrandbits(64) | 1 for _ in range(self._num_hashes)]
+        self._slots: List[Optional[Entry[VT]]] = \
+            [None] * (self._num_hashes * num_buckets * BUCKET_SIZE)
+
+
+    def _bucket_start(self, table: int, key_hash: int) -> int:
+        bucket = ((key_hash * self._multipliers[table]) & MASK_64) >> \
+            self._shift
+        return (table * self._num_buckets + bucket) * BUCKET_SIZE
+
+
+    def _search(self, key: Hashable, key_hash: int) -> Tuple[int, bool]:
+        slots = self._slots
+        shift = self._shift
+        offset = 0
+
+        for multiplier in self._multipliers:
+            start = (offset + (((key_hash * multiplier) & MASK_64) >> shift)) \
+                * BUCKET_SIZE
+            offset += self._num_buckets
+
+            for index in range(start, start + BUCKET_SIZE):
+                entry = slots[index]
+
+                if entry and entry[0] == key_hash and \
+                        (entry[1] is key or entry[1] == key):
+                    return (index, False)
+
+        for index, entry in enumerate(self._stash):
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return (index, True)
+
+        return (-1, False)
+
+
+    def _place(self, entry: Entry[VT]) -> Optional[Entry[VT]]:
+        slots = self._slots
+
+        for _ in range(MAX_KICKS):
+            starts = [
+                self._bucket_start(table, entry[0])
+                for table in range(self._num_hashes)]
+
+            for start in starts:
+                for index in range(start, start + BUCKET_SIZE):
+                    if slots[index] is None:
+                        slots[index] = entry
+                        return None
+
+            index = self._random.choice(starts) + \
+                self._random.randrange(BUCKET_SIZE)
+            entry, slots[index] = slots[index], entry # type: ignore
+
+        if len(self._stash) < STASH_SIZE:
+            self._stash.append(entry)
+            return None
+
+        return entry
+
+
+    def _rehash(self, pending: Entry[VT]):
+        entries = [entry for entry in self._slots if entry] + \
+            self._stash + [pending]
+        num_buckets = self._num_buckets
+
+        if len(entries) > len(self._slots) * MAX_LOAD / 2:
+            num_buckets *= 2
+
+        for _ in range(MAX_REHASHES):
+            self._num_rehashes += 1
+            self._new_tables(num_buckets)
+            self._stash = []
+            homeless = []
+
+            for entry in entries:
+                overflow = self._place(entry)
+
+                if overflow:
+                    homeless.append(overflow)
+
+            if not homeless:
+                return
+
+            if len(entries) > len(self._slots) * MAX_LOAD / 4:
+                num_buckets *= 2
+
+        self._stash.extend(homeless)
+
+
+    def _entries(self) -> Iterator[Entry[VT]]:
+        version = self._version
+
+        for entry in self._slots + self._stash:
+            if self._version != version:
+                raise RuntimeError(
+                    'CuckooHashTable changed size during iteration!')
+
+            if entry:
+                yield entry
+
+
+    def _insert_item(self, key: Hashable, value: VT):
+        key_hash = hash_key(key)
+
+        if not self._data_type:
+            self._data_type = type(value)
+        elif not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        if self._search(key, key_hash)[0] >= 0:
+            raise ValueError(f"Key {key!r} already exists!")
+
+        entry: Entry[VT] = (key_hash, key, value)
+
+        if self._num_entries >= len(self._slots) * MAX_LOAD:
+            self._rehash(entry)
+        else:
+            homeless = self._place(entry)
+
+            if homeless:
+                self._rehash(homeless)
+
+        self._num_entries += 1
+        self._version += 1
+
+
+    def __getitem__(self, key: Hashable) -> VT:
+        key_hash = hash_key(key)
+        index, stashed = self._search(key, key_hash)
+
+        if index < 0:
+            raise KeyError(f"Key {key!r} not found!")
+
+        if stashed:
+            return self._stash[index][2]
+
+        return self._slots[index][2] # type: ignore
+
+
+    def __setitem__(self, key: Hashable, value: VT):
+        key_hash = hash_key(key)
+
+        if self._data_type and not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        index, stashed = self._search(key, key_hash)
+
+        if index < 0:
+            raise KeyError(f"Key {key!r} not found!")
+
+        if stashed:
+            self._stash[index] = (key_hash, key, value)
+        else:
+            self._slots[index] = (key_hash, key, value)
+
+
+    def __delitem__(self, key: Hashable):
+        key_hash = hash_key(key)
+        index, stashed = self._search(key, key_hash)
+
+        if index < 0:
+            raise KeyError(f"Key {key!r} not found!")
+
+        if stashed:
+            del self._stash[index]
+        else:
+            self._slots[index] = None
+
+        self._num_entries -= 1
+        self._version += 1
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._search(key, hash_key(key))[0] >= 0
+
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
+
+
+    def __len__(self) -> int:
+        return self._num_entries
+
+
+    def __repr__(self) -> str:
+        return str({ entry[1]: entry[2] for entry in self._entries() })
+
+
+    def keys(self) -> Iterator[Hashable]:
+        for key_hash, key, value in self._entries():
+            yield key
+
+
+    def values(self) -> Iterator[VT]:
+        for key_hash, key, value in self._entries():
+            yield value
+
+
+    def items(self) -> Iterator[Tuple[Hashable, VT]]:
+        for key_hash, key, value in self._entries():
+            yield (key, value)
+
+
+    def get(self, key: Hashable) -> VT:
+        return self.__getitem__(key)
+
+
+    def put(self, key: Hashable, value: VT):
+        self._insert_item(key, value)
+
+
+    def update(self, key: Hashable, value: VT):
+        return self.__setitem__(key, value)
+
+
+    def delete(self, key: Hashable):
+        return self.__delitem__(key)
@@ -1,22 +1,59 @@
+import pickle
 from dataclasses import dataclass
-from typing import Generic, List, Literal, Optional, Tuple, Type, TypeVar
+from time import perf_counter
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Literal,
+    Optional, Tuple, Type, TypeVar,)
 
-from ..utils import next_prime
+from ..utils import BloomFilter, hash_fingerprint, hash_key, next_prime
 
 
 VT = TypeVar('VT')
+Entry = Tuple[int, Hashable, VT]
+Slot = Entry[VT] | None | Tuple[()]
+StatsHook = Callable[[str, Dict[str, float]], None]
+
+SNAPSHOT_MAGIC = 'SDSAHTS2'
+SNAPSHOT_BUFFER_SIZE = 1 << 20
 
 @dataclass
 class HashTable(Generic[VT]):
-    def __init__(self, **kwargs: VT):
+    def __init__(
+        self,
+        rehash_step: int = 0,
+        max_pause: Optional[float] = None,
+        /,
+        **kwargs: VT,
+    ):
+        if isinstance(rehash_step, bool) or not isinstance(rehash_step, int):
+            raise TypeError('Rehash step must be an integer!')
+        elif rehash_step < 0:
+            raise ValueError('Rehash step must not be negative!')
+
+        if max_pause is not None and max_pause <= 0:
+            raise ValueError('Max pause must be a positive number of seconds!')
+
+        self._rehash_step = rehash_step
+        self._max_pause = max_pause
+        self._old_array: Optional[List[Slot[VT]]] = None
+        self._rehash_index = 0
+        self._rehash_pace = rehash_step
+        self._num_entries = 0
+        self._version = 0
+        self._num_tombstones = 0
+        self._stats: Optional[Dict[str, float]] = None
+        self._probe_counts: Dict[int, int] = {}
+        self._hook: Optional[StatsHook] = None
+        self._bloom: Optional[BloomFilter] = None
+
         if not kwargs:
             self._data_type = None
         else:
             self._data_type = self._check_data_types(**kwargs)
 
-        self._array: List[Tuple[str, VT] | None | Tuple[()]] = \
+        self._array: List[Slot[VT]] = \
             [None] * max(next_prime(len(kwargs) * 2), 5)
-        
+
         for key, value in kwargs.items():
             self._insert_item(key, value)
 
@@ -27,18 +64,35 @@ class HashTable(Generic[VT]):
         for index, value in enumerate(kwargs_values):
             if not isinstance(value, type(kwargs_values[index - 1])):
                 raise TypeError('All entries must have the same type!')
-        
+
         return type(kwargs_values[0])
 
 
+    def _check_value_types(self, values: List[VT]):
+        if not values:
+            return
+
+        if not self._data_type:
+            for index, value in enumerate(values):
+                if not isinstance(value, type(values[index - 1])):
+                    raise TypeError('All entries must have the same type!')
+
+            self._data_type = type(values[0])
+        else:
+            for value in values:
+                if not isinstance(value, self._data_type):
+                    raise TypeError(
+                        f"Value must be of type {self._data_type}!")
+
+
     def _check_load(self) -> Literal[-1, 0, 1]:
-        num_entries = len([entry for entry in self._array if entry])
+        num_entries = self._num_entries
         num_slots = len(self._array)
 
-        if num_entries / num_slots < 1 / 6:
+        if self._old_array is None and num_entries / num_slots < 1 / 6:
             return -1
 
-        num_empty = len([entry for entry in self._array if entry is None])
+        num_empty = num_slots - num_entries - self._num_tombstones
 
         if num_empty / num_slots < 1 / 3:
             return 1
@@ -47,65 +101,265 @@ class HashTable(Generic[VT]):
 
 
     def _expand_array(self):
+        start = perf_counter() if self._stats is not None else None
+        old_size = len(self._array)
+        self._finish_rehash()
+        self._resize_array(max(next_prime(old_size * 2), 13))
+
+        if start is not None:
+            self._record_resize('expand', old_size, start)
+
+
+    def _shrink_array(self):
+        start = perf_counter() if self._stats is not None else None
+        old_size = len(self._array)
+        self._finish_rehash()
+        self._resize_array(max(next_prime(self._num_entries * 2), 5))
+
+        if start is not None:
+            self._record_resize('shrink', old_size, start)
+
+
+    def _reserve(self, num_items: int):
+        self._finish_rehash()
+        num_used = self._num_entries + self._num_tombstones + num_items
+
+        if num_used > len(self._array) * 2 // 3:
+            size = max(next_prime((self._num_entries + num_items) * 2), 5)
+            self._resize_array(size, False)
+
+
+    def _resize_array(self, size: int, incremental: bool = True):
         old_array = self._array
-        self._array = [None] * max(next_prime(len(self._array) * 2), 13)
+        self._array = [None] * size
+        self._num_tombstones = 0
+
+        if incremental and self._rehash_step:
+            self._old_array = old_array
+            self._rehash_index = 0
+            self._rehash_pace = max(
+                self._rehash_step,
+                -(-len(old_array) // max(self._num_entries // 6, 1)))
+            return self._rehash()
 
         for entry in old_array:
             if entry:
-                self._insert_item(entry[0], entry[1])
+                self._place_entry(entry)
 
 
-    def _shrink_array(self):
-        entries = [entry for entry in self._array if entry]
-        self._array = [None] * max(next_prime(len(entries) * 2), 5)
+    def _rehash(self):
+        old_array = self._old_array
 
-        for key, value in entries:
-            self._insert_item(key, value)
+        if old_array is None:
+            return
 
+        deadline = None
 
-    def _hash_key(self, key: str, retry: int) -> int:
-        if not key or not isinstance(key, str):
-            raise TypeError('Key must be a non-empty string!')
+        if self._max_pause is not None:
+            deadline = perf_counter() + self._max_pause
 
-        return hash(key + key[-retry:] * retry * int(2 ** (retry / 2))) % \
-            len(self._array)
+        index = self._rehash_index
+        stop = min(index + self._rehash_pace, len(old_array))
 
+        while index < stop:
+            entry = old_array[index]
 
-    def _search_array(self, key: str) -> Tuple[int, Optional[Tuple[str, VT]]]:
-        retry: int = 0
+            if entry:
+                self._place_entry(entry)
 
-        while retry < 25:
-            index = self._hash_key(key, retry)
+            index += 1
+
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        self._rehash_index = index
+
+        if index >= len(old_array):
+            self._old_array = None
+            self._rehash_index = 0
+
+
+    def _finish_rehash(self):
+        old_array = self._old_array
+
+        if old_array is None:
+            return
+
+        for index in range(self._rehash_index, len(old_array)):
+            entry = old_array[index]
+
+            if entry:
+                self._place_entry(entry)
+
+        self._old_array = None
+        self._rehash_index = 0
+
+
+    def _record_search(self, probes: int, comparisons: int):
+        stats: Dict[str, float] = self._stats # type: ignore
+        stats['searches'] += 1
+        stats['comparisons'] += comparisons
+        self._probe_counts[probes] = self._probe_counts.get(probes, 0) + 1
 
-            try:
-                entry = self._array[index]
-            except IndexError:
-                raise IndexError(
-                    f'Hash function returned index ({index})'
-                    f' outside of range(0, {len(self._array)})!')
 
-            if entry is None or (entry and entry[0] == key):
+    def _record_resize(self, event: str, old_size: int, start: float):
+        duration = perf_counter() - start
+        stats: Dict[str, float] = self._stats # type: ignore
+        stats[f'{event}_count'] += 1
+        stats[f'{event}_time'] += duration
+
+        if self._hook:
+            self._hook(event, {
+                'old_size': old_size,
+                'new_size': len(self._array),
+                'duration': duration,
+            })
+
+
+    def _add_to_bloom(self, key_hash: int):
+        bloom: BloomFilter = self._bloom # type: ignore
+
+        if len(bloom) >= bloom.capacity:
+            self.rebuild_bloom_filter()
+        else:
+            bloom.add_hash(key_hash)
+
+
+    def _hash_key(self, key: Hashable) -> int:
+        return hash_key(key)
+
+
+    def _probe_step(self, key_hash: int, size: int) -> int:
+        return 1 + (key_hash // size) % (size - 1)
+
+
+    def _place_entry(self, entry: Entry[VT]):
+        array = self._array
+        size = len(array)
+        index = entry[0] % size
+
+        if array[index] is not None:
+            step = self._probe_step(entry[0], size)
+
+            while array[index] is not None:
+                index = (index + step) % size
+
+        array[index] = entry
+
+
+    def _store_entry(self, index: int, entry: Entry[VT]):
+        self._array[index] = entry
+
+
+    def _search_array(
+        self,
+        key: Hashable,
+        key_hash: int,
+        array: Optional[List[Slot[VT]]] = None,
+    ) -> Tuple[int, Optional[Entry[VT]]]:
+        if array is None:
+            array = self._array
+
+        size = len(array)
+        index = key_hash % size
+        step = 0
+        comparisons = 0
+
+        for probes in range(1, size + 1):
+            entry = array[index]
+
+            if entry is None:
+                if self._stats is not None:
+                    self._record_search(probes, comparisons)
+
                 return (index, entry)
 
-            retry += 1
+            if entry and entry[0] == key_hash:
+                comparisons += 1
+
+                if entry[1] is key or entry[1] == key:
+                    if self._stats is not None:
+                        self._record_search(probes, comparisons)
+
+                    return (index, entry)
+
+            if not step:
+                step = self._probe_step(key_hash, size)
+
+            index = (index + step) % size
 
         raise RuntimeError(
-            f"Could not find key '{key}' after {retry} tries!")
+            f"Could not find key {key!r} after {size} tries!")
+
+
+    def _locate(
+        self,
+        key: Hashable,
+        key_hash: int,
+    ) -> Tuple[List[Slot[VT]], int, Optional[Entry[VT]]]:
+        index, entry = self._search_array(key, key_hash)
+
+        if entry is None and self._old_array is not None:
+            old_index, old_entry = \
+                self._search_array(key, key_hash, self._old_array)
+
+            if old_entry:
+                return (self._old_array, old_index, old_entry)
+
+        return (self._array, index, entry)
+
+
+    def _probe_length(self, array: List[Slot[VT]], index: int) -> int:
+        key_hash = array[index][0] # type: ignore
+        size = len(array)
+        step = self._probe_step(key_hash, size)
+        probe = key_hash % size
+        length = 1
+
+        while probe != index:
+            probe = (probe + step) % size
+            length += 1
+
+        return length
+
 
+    def _entries(self) -> Iterator[Entry[VT]]:
+        self._finish_rehash()
+        version = self._version
 
-    def _insert_item(self, key: str, value: VT, will_resize: bool = False):
-        if not key or not isinstance(key, str):
-            raise TypeError('Key must be a non-empty string!')
+        for entry in self._array:
+            if self._version != version:
+                raise RuntimeError('HashTable changed size during iteration!')
+
+            if entry:
+                yield entry
+
+
+    def _insert_item(
+        self,
+        key: Hashable,
+        value: VT,
+        will_resize: bool = False,
+    ):
+        key_hash = self._hash_key(key)
 
         if not self._data_type:
             self._data_type = type(value)
         elif not isinstance(value, self._data_type):
             raise TypeError(f"Value must be of type {self._data_type}!")
 
-        index, entry = self._search_array(key)
+        if will_resize:
+            self._rehash()
+
+        array, index, entry = self._locate(key, key_hash)
 
         if entry is None:
-            self._array[index] = (key, value)
+            self._store_entry(index, (key_hash, key, value))
+            self._num_entries += 1
+            self._version += 1
+
+            if self._bloom is not None:
+                self._add_to_bloom(key_hash)
 
             if will_resize:
                 resize = self._check_load()
@@ -115,68 +369,266 @@ class HashTable(Generic[VT]):
                 elif resize == -1:
                     return self._shrink_array()
         else:
-            raise ValueError(f"Key '{key}' already exists!")
+            raise ValueError(f"Key {key!r} already exists!")
+
 
+    def __getitem__(self, key: Hashable) -> VT:
+        key_hash = self._hash_key(key)
 
-    def __getitem__(self, key: str) -> VT:
-        if not key or not isinstance(key, str):
-            raise TypeError('Key must be a non-empty string!')
+        if self._bloom is not None and not self._bloom.contains_hash(key_hash):
+            raise KeyError(f"Key {key!r} not found!")
 
-        entry = self._search_array(key)[1]
+        self._rehash()
+        entry = self._locate(key, key_hash)[2]
 
         if entry:
-            return entry[1]
+            return entry[2]
         else:
-            raise KeyError(f"Key '{key}' not found!")
+            raise KeyError(f"Key {key!r} not found!")
 
 
-    def __setitem__(self, key: str, value: VT):
-        if not key or not isinstance(key, str):
-            raise TypeError('Key must be a non-empty string!')
+    def __setitem__(self, key: Hashable, value: VT):
+        key_hash = self._hash_key(key)
 
         if self._data_type and not isinstance(value, self._data_type):
             raise TypeError(f"Value must be of type {self._data_type}!")
 
-        index, entry = self._search_array(key)
+        self._rehash()
+        array, index, entry = self._locate(key, key_hash)
 
         if entry:
-            self._array[index] = (key, value)
+            array[index] = (key_hash, key, value)
         else:
-            raise KeyError(f"Key '{key}' not found!")
+            raise KeyError(f"Key {key!r} not found!")
 
 
-    def __delitem__(self, key: str):
-        if not key or not isinstance(key, str):
-            raise TypeError('Key must be a non-empty string!')
-
-        index, entry = self._search_array(key)
+    def __delitem__(self, key: Hashable):
+        key_hash = self._hash_key(key)
+        self._rehash()
+        array, index, entry = self._locate(key, key_hash)
 
         if entry:
-            self._array[index] = ()
+            array[index] = ()
+            self._num_entries -= 1
+            self._version += 1
+
+            if array is self._array:
+                self._num_tombstones += 1
+
+                if self._old_array is not None:
+                    old_index, old_entry = \
+                        self._search_array(key, key_hash, self._old_array)
+
+                    if old_entry:
+                        self._old_array[old_index] = ()
         else:
-            raise KeyError(f"Key '{key}' not found!")
+            raise KeyError(f"Key {key!r} not found!")
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        key_hash = self._hash_key(key)
+
+        if self._bloom is not None and not self._bloom.contains_hash(key_hash):
+            return False
+
+        self._rehash()
+        return bool(self._locate(key, key_hash)[2])
+
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return self.keys()
 
 
     def __len__(self) -> int:
-        return len([entry for entry in self._array if entry])
+        return self._num_entries
 
 
     def __repr__(self) -> str:
-        return str({ entry[0]: entry[1] for entry in self._array if entry })
+        return str({ entry[1]: entry[2] for entry in self._entries() })
+
+
+    def keys(self) -> Iterator[Hashable]:
+        for key_hash, key, value in self._entries():
+            yield key
+
+
+    def values(self) -> Iterator[VT]:
+        for key_hash, key, value in self._entries():
+            yield value
+
+
+    def items(self) -> Iterator[Tuple[Hashable, VT]]:
+        for key_hash, key, value in self._entries():
+            yield (key, value)
+
+
+    def probe_histogram(self) -> dict[int, int]:
+        histogram: dict[int, int] = {}
+        arrays = [(self._array, 0)]
+
+        if self._old_array is not None:
+            arrays.append((self._old_array, self._rehash_index))
+
+        for array, start in arrays:
+            for index in range(start, len(array)):
+                if array[index]:
+                    length = self._probe_length(array, index)
+                    histogram[length] = histogram.get(length, 0) + 1
+
+        return dict(sorted(histogram.items()))
+
+
+    def enable_stats(self, hook: Optional[StatsHook] = None):
+        self._stats = {
+            'searches': 0, 'comparisons': 0,
+            'expand_count': 0, 'expand_time': 0.0,
+            'shrink_count': 0, 'shrink_time': 0.0,}
+        self._probe_counts = {}
+        self._hook = hook
+
+
+    def disable_stats(self):
+        self._stats = None
+        self._probe_counts = {}
+        self._hook = None
+
+
+    def stats(self) -> Dict[str, Any]:
+        num_slots = len(self._array)
+        report: Dict[str, Any] = {
+            'entries': self._num_entries,
+            'slots': num_slots,
+            'tombstones': self._num_tombstones,
+            'load_factor': self._num_entries / num_slots,
+            'rehashing': self._old_array is not None,
+        }
+
+        if self._stats is not None:
+            report.update(self._stats)
+            report['probe_lengths'] = dict(sorted(self._probe_counts.items()))
 
+        return report
 
-    def get(self, key: str) -> VT:
+
+    def enable_bloom_filter(self, error_rate: float = 0.01):
+        self._bloom = BloomFilter(max(self._num_entries * 2, 64), error_rate)
+
+        for key_hash, key, value in self._entries():
+            self._bloom.add_hash(key_hash)
+
+
+    def disable_bloom_filter(self):
+        self._bloom = None
+
+
+    def rebuild_bloom_filter(self):
+        if self._bloom is not None:
+            self.enable_bloom_filter(self._bloom.error_rate)
+
+
+    def get(self, key: Hashable) -> VT:
         return self.__getitem__(key)
 
 
-    def put(self, key: str, value: VT):
+    def put(self, key: Hashable, value: VT):
         self._insert_item(key, value, True)
 
 
-    def update(self, key: str, value: VT):
+    def update(self, key: Hashable, value: VT):
         return self.__setitem__(key, value)
 
 
-    def delete(self, key: str):
+    def delete(self, key: Hashable):
         return self.__delitem__(key)
 
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[Tuple[Hashable, VT]],
+        expected_size: Optional[int] = None,
+    ) -> 'HashTable[VT]':
+        table: HashTable[VT] = cls()
+
+        if expected_size:
+            table._reserve(expected_size)
+
+        table.put_many(items)
+        return table
+
+
+    def put_many(self, items: Iterable[Tuple[Hashable, VT]]):
+        items = list(items)
+        hashes = []
+        seen = set()
+
+        for key, value in items:
+            key_hash = self._hash_key(key)
+
+            if key in seen or self._locate(key, key_hash)[2] is not None:
+                raise ValueError(f"Key {key!r} already exists!")
+
+            seen.add(key)
+            hashes.append(key_hash)
+
+        self._check_value_types([value for key, value in items])
+        self._reserve(len(items))
+
+        for (key, value), key_hash in zip(items, hashes):
+            index, entry = self._search_array(key, key_hash)
+            self._store_entry(index, (key_hash, key, value))
+            self._num_entries += 1
+            self._version += 1
+
+            if self._bloom is not None:
+                self._add_to_bloom(key_hash)
+
+
+    def dump(self, path: str):
+        self._finish_rehash()
+
+        with open(path, 'wb', buffering=SNAPSHOT_BUFFER_SIZE) as file:
+            pickle.dump(
+                (SNAPSHOT_MAGIC, hash_fingerprint(), type(self).__name__,
+                 self._data_type, self._num_entries, self._num_tombstones,
+                 self._array),
+                file, pickle.HIGHEST_PROTOCOL)
+
+
+    @classmethod
+    def load(cls, path: str) -> 'HashTable[VT]':
+        table: HashTable[VT] = cls()
+
+        with open(path, 'rb', buffering=SNAPSHOT_BUFFER_SIZE) as file:
+            try:
+                snapshot = pickle.load(file)
+            except (pickle.UnpicklingError, EOFError):
+                snapshot = None
+
+        if not isinstance(snapshot, tuple) or snapshot[0] != SNAPSHOT_MAGIC:
+            raise ValueError(f"'{path}' is not a HashTable snapshot!")
+
+        _, fingerprint, class_name, table._data_type, table._num_entries, \
+            num_tombstones, slots = snapshot
+
+        if fingerprint == hash_fingerprint() and class_name == cls.__name__:
+            table._array = slots
+            table._num_tombstones = num_tombstones
+        else:
+            table._array = [None] * len(slots)
+
+            for entry in slots:
+                if entry:
+                    key = entry[1]
+                    table._place_entry((table._hash_key(key), key, entry[2]))
+
+        return table
+
+
+    def get_many(self, keys: Iterable[Hashable]) -> List[VT]:
+        return [self.__getitem__(key) for key in keys]
+
+
+    def delete_many(self, keys: Iterable[Hashable]):
+        for key in keys:
+            self.__delitem__(key)
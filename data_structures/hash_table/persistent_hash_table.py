@@ -0,0 +1,368 @@
+import mmap
+import os
+import pickle
+from struct import Struct
+from typing import Generic, Hashable, Optional, Tuple, Type, TypeVar
+
+from ..utils import next_prime, stable_hash
+
+
+VT = TypeVar('VT')
+
+MAGIC = b'SDSAPHT1'
+HEADER = Struct('<8sQQQQQ')
+HEADER_SIZE = 64
+SLOT = Struct('<QQ')
+RECORD = Struct('<II')
+EMPTY = 0
+TOMBSTONE = 1
+KEY_TYPES = (str, bytes, int)
+
+
+class PersistentHashTable(Generic[VT]):
+    def __init__(
+        self,
+        path: str,
+        readonly: bool = False,
+        /,
+        **kwargs: VT,
+    ):
+        self._path = path
+        self._readonly = readonly
+        self._data_type: Optional[Type[VT]] = None
+
+        if not os.path.exists(self._slots_path):
+            if readonly:
+                raise FileNotFoundError(
+                    f"No persistent hash table at '{path}'!")
+
+            self._create(max(next_prime(len(kwargs) * 2), 13))
+
+        self._open()
+
+        for key, value in kwargs.items():
+            self.put(key, value)
+
+
+    @property
+    def _slots_path(self) -> str:
+        return f'{self._path}.slots'
+
+
+    @property
+    def _heap_path(self) -> str:
+        return f'{self._path}.heap'
+
+
+    def _create(self, capacity: int):
+        with open(self._slots_path, 'wb') as slots:
+            slots.write(
+                HEADER.pack(MAGIC, capacity, 0, 0, len(MAGIC), 0)
+                .ljust(HEADER_SIZE, b'\0'))
+            slots.truncate(HEADER_SIZE + capacity * SLOT.size)
+
+        with open(self._heap_path, 'wb') as heap:
+            heap.write(MAGIC)
+            heap.truncate(mmap.PAGESIZE)
+
+
+    def _open(self):
+        mode = 'rb' if self._readonly else 'r+b'
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        self._slots_file = open(self._slots_path, mode)
+        self._heap_file = open(self._heap_path, mode)
+        self._slots = mmap.mmap(self._slots_file.fileno(), 0, access=access)
+        self._heap = mmap.mmap(self._heap_file.fileno(), 0, access=access)
+
+        magic, self._capacity, self._num_entries, self._num_tombstones, \
+            self._heap_size, type_offset = HEADER.unpack_from(self._slots)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(
+                f"'{self._slots_path}' is not a persistent hash table!")
+
+        if type_offset:
+            self._data_type = pickle.loads(self._read_record(type_offset)[1])
+
+
+    def _write_header(self, type_offset: Optional[int] = None):
+        if type_offset is None:
+            type_offset = HEADER.unpack_from(self._slots)[5]
+
+        HEADER.pack_into(
+            self._slots, 0, MAGIC, self._capacity, self._num_entries,
+            self._num_tombstones, self._heap_size, type_offset)
+
+
+    def _check_writable(self):
+        if self._readonly:
+            raise RuntimeError('Persistent hash table is read-only!')
+
+
+    def _encode_key(self, key: Hashable) -> bytes:
+        if type(key) not in KEY_TYPES:
+            raise TypeError('Key must be a str, bytes or int!')
+
+        if isinstance(key, str) and not key:
+            raise TypeError('Key must be a non-empty string!')
+
+        return pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+
+
+    def _encode_value(self, value: VT) -> bytes:
+        if self._data_type is bytes:
+            return value # type: ignore
+
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+    def _decode_value(self, data: memoryview) -> VT:
+        if self._data_type is bytes:
+            return bytes(data) # type: ignore
+
+        return pickle.loads(data)
+
+
+    def _check_value_type(self, value: VT):
+        if not self._data_type:
+            self._data_type = type(value)
+            self._write_header(self._append_record(
+                b'', pickle.dumps(self._data_type)))
+        elif not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+
+    def _read_record(self, offset: int) -> Tuple[memoryview, memoryview]:
+        if offset + RECORD.size > len(self._heap):
+            self._remap_heap()
+
+        key_size, value_size = RECORD.unpack_from(self._heap, offset)
+        start = offset + RECORD.size
+        view = memoryview(self._heap)
+
+        return (
+            view[start:start + key_size],
+            view[start + key_size:start + key_size + value_size])
+
+
+    def _append_record(self, key: bytes, value: bytes) -> int:
+        offset = self._heap_size
+        end = offset + RECORD.size + len(key) + len(value)
+
+        if end > len(self._heap):
+            self._heap_file.truncate(max(len(self._heap) * 2, end))
+            self._remap_heap()
+
+        RECORD.pack_into(self._heap, offset, len(key), len(value))
+        start = offset + RECORD.size
+        self._heap[start:start + len(key)] = key
+        self._heap[start + len(key):end] = value
+        self._heap_size = end
+
+        return offset
+
+
+    def _remap_heap(self):
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        heap = self._heap
+        self._heap = mmap.mmap(self._heap_file.fileno(), 0, access=access)
+        self._release_heap(heap)
+
+
+    def _release_heap(self, heap: mmap.mmap):
+        try:
+            heap.close()
+        except BufferError:
+            pass
+
+
+    def _search_slots(self, key: bytes, key_hash: int) -> Tuple[int, int]:
+        slots = self._slots
+        capacity = self._capacity
+        index = key_hash % capacity
+        step = 1 + (key_hash // capacity) % (capacity - 1)
+        first_free = -1
+
+        for _ in range(capacity):
+            slot_hash, offset = \
+                SLOT.unpack_from(slots, HEADER_SIZE + index * SLOT.size)
+
+            if offset == EMPTY:
+                return (index if first_free < 0 else first_free, EMPTY)
+
+            if offset == TOMBSTONE:
+                if first_free < 0:
+                    first_free = index
+            elif slot_hash == key_hash and \
+                    self._read_record(offset)[0] == key:
+                return (index, offset)
+
+            index = (index + step) % capacity
+
+        if first_free >= 0:
+            return (first_free, EMPTY)
+
+        raise RuntimeError(f'Could not find key after {capacity} tries!')
+
+
+    def _write_slot(self, index: int, key_hash: int, offset: int):
+        SLOT.pack_into(
+            self._slots, HEADER_SIZE + index * SLOT.size, key_hash, offset)
+
+
+    def _expand(self):
+        entries = []
+
+        for index in range(self._capacity):
+            slot_hash, offset = SLOT.unpack_from(
+                self._slots, HEADER_SIZE + index * SLOT.size)
+
+            if offset > TOMBSTONE:
+                entries.append((slot_hash, offset))
+
+        capacity = max(next_prime(self._capacity * 2), 13)
+        self._slots.resize(HEADER_SIZE + capacity * SLOT.size)
+        self._slots[HEADER_SIZE:] = bytes(capacity * SLOT.size)
+        self._capacity = capacity
+        self._num_tombstones = 0
+
+        for slot_hash, offset in entries:
+            index = slot_hash % capacity
+            step = 1 + (slot_hash // capacity) % (capacity - 1)
+
+            while SLOT.unpack_from(
+                self._slots, HEADER_SIZE + index * SLOT.size,
+            )[1] != EMPTY:
+                index = (index + step) % capacity
+
+            self._write_slot(index, slot_hash, offset)
+
+        self._write_header()
+
+
+    def __getitem__(self, key: Hashable) -> VT:
+        encoded = self._encode_key(key)
+        offset = self._search_slots(encoded, stable_hash(encoded))[1]
+
+        if offset == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        return self._decode_value(self._read_record(offset)[1])
+
+
+    def __setitem__(self, key: Hashable, value: VT):
+        self._check_writable()
+        encoded = self._encode_key(key)
+
+        if self._data_type and not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        key_hash = stable_hash(encoded)
+        index, offset = self._search_slots(encoded, key_hash)
+
+        if offset == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._write_slot(
+            index, key_hash,
+            self._append_record(encoded, self._encode_value(value)))
+        self._write_header()
+
+
+    def __delitem__(self, key: Hashable):
+        self._check_writable()
+        encoded = self._encode_key(key)
+        key_hash = stable_hash(encoded)
+        index, offset = self._search_slots(encoded, key_hash)
+
+        if offset == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        self._write_slot(index, key_hash, TOMBSTONE)
+        self._num_entries -= 1
+        self._num_tombstones += 1
+        self._write_header()
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        encoded = self._encode_key(key)
+        return self._search_slots(encoded, stable_hash(encoded))[1] != EMPTY
+
+
+    def __len__(self) -> int:
+        return self._num_entries
+
+
+    def __enter__(self) -> 'PersistentHashTable[VT]':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def get(self, key: Hashable) -> VT:
+        return self.__getitem__(key)
+
+
+    def get_view(self, key: Hashable) -> memoryview:
+        encoded = self._encode_key(key)
+        offset = self._search_slots(encoded, stable_hash(encoded))[1]
+
+        if offset == EMPTY:
+            raise KeyError(f"Key {key!r} not found!")
+
+        return self._read_record(offset)[1].toreadonly()
+
+
+    def put(self, key: Hashable, value: VT):
+        self._check_writable()
+        encoded = self._encode_key(key)
+        self._check_value_type(value)
+        key_hash = stable_hash(encoded)
+        index, offset = self._search_slots(encoded, key_hash)
+
+        if offset != EMPTY:
+            raise ValueError(f"Key {key!r} already exists!")
+
+        if SLOT.unpack_from(
+            self._slots, HEADER_SIZE + index * SLOT.size,
+        )[1] == TOMBSTONE:
+            self._num_tombstones -= 1
+
+        self._write_slot(
+            index, key_hash,
+            self._append_record(encoded, self._encode_value(value)))
+        self._num_entries += 1
+
+        if (self._num_entries + self._num_tombstones) * 3 > \
+                self._capacity * 2:
+            self._expand()
+        else:
+            self._write_header()
+
+
+    def update(self, key: Hashable, value: VT):
+        return self.__setitem__(key, value)
+
+
+    def delete(self, key: Hashable):
+        return self.__delitem__(key)
+
+
+    def flush(self):
+        if not self._readonly:
+            self._slots.flush()
+            self._heap.flush()
+
+
+    def close(self):
+        if self._slots.closed:
+            return
+
+        self.flush()
+        self._slots.close()
+        self._release_heap(self._heap)
+        self._slots_file.close()
+        self._heap_file.close()
@@ -0,0 +1,109 @@
+from typing import Hashable, List, Optional, Tuple, TypeVar
+
+from .hash_table import Entry, HashTable, Slot
+
+
+VT = TypeVar('VT')
+
+class RobinHoodHashTable(HashTable[VT]):
+    def __init__(self, **kwargs: VT):
+        super().__init__(0, None, **kwargs)
+
+
+    def _displacement(self, key_hash: int, index: int, size: int) -> int:
+        return (index - key_hash % size) % size
+
+
+    def _place_entry(self, entry: Entry[VT]):
+        self._store_entry(entry[0] % len(self._array), entry)
+
+
+    def _store_entry(self, index: int, entry: Entry[VT]):
+        array = self._array
+        size = len(array)
+        distance = self._displacement(entry[0], index, size)
+
+        while True:
+            current = array[index]
+
+            if not current:
+                array[index] = entry
+                return
+
+            current_distance = self._displacement(current[0], index, size)
+
+            if current_distance < distance:
+                array[index] = entry
+                entry = current
+                distance = current_distance
+
+            index = (index + 1) % size
+            distance += 1
+
+
+    def _search_array(
+        self,
+        key: Hashable,
+        key_hash: int,
+        array: Optional[List[Slot[VT]]] = None,
+    ) -> Tuple[int, Optional[Entry[VT]]]:
+        if array is None:
+            array = self._array
+
+        size = len(array)
+        index = key_hash % size
+
+        comparisons = 0
+
+        for distance in range(size):
+            entry = array[index]
+
+            if not entry or \
+                    self._displacement(entry[0], index, size) < distance:
+                if self._stats is not None:
+                    self._record_search(distance + 1, comparisons)
+
+                return (index, None)
+
+            if entry[0] == key_hash:
+                comparisons += 1
+
+                if entry[1] is key or entry[1] == key:
+                    if self._stats is not None:
+                        self._record_search(distance + 1, comparisons)
+
+                    return (index, entry)
+
+            index = (index + 1) % size
+
+        raise RuntimeError(
+            f"Could not find key {key!r} after {size} tries!")
+
+
+    def _probe_length(self, array: List[Slot[VT]], index: int) -> int:
+        key_hash = array[index][0] # type: ignore
+        return self._displacement(key_hash, index, len(array)) + 1
+
+
+    def __delitem__(self, key: Hashable):
+        key_hash = self._hash_key(key)
+        index, entry = self._search_array(key, key_hash)
+
+        if not entry:
+            raise KeyError(f"Key {key!r} not found!")
+
+        array = self._array
+        size = len(array)
+        next_index = (index + 1) % size
+        following = array[next_index]
+
+        while following and \
+                self._displacement(following[0], next_index, size) > 0:
+            array[index] = following
+            index = next_index
+            next_index = (index + 1) % size
+            following = array[next_index]
+
+        array[index] = None
+        self._num_entries -= 1
+        self._version += 1
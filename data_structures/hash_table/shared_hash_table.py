@@ -0,0 +1,447 @@
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from typing import (
+    Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, Type,
+    TypeVar, cast,)
+
+from ..utils import next_prime, stable_hash
+
+
+VT = TypeVar('VT', int, float, bytes)
+
+MAGIC = b'SDSASHT1'
+HEADER = Struct('<8sQQQQQQc?')
+HEADER_SIZE = 64
+SEQUENCE = Struct('<Q')
+SEQUENCE_OFFSET = 8
+COUNTS_OFFSET = 24
+COUNTS = Struct('<QQ')
+VALUE_CODES: Dict[type, bytes] = { int: b'q', float: b'd', bytes: b's' }
+VALUE_TYPES = { code: value_type for value_type, code in VALUE_CODES.items() }
+EMPTY = 0
+USED = 1
+TOMBSTONE = 2
+MAX_TOMBSTONES = 0.25
+
+
+def _record_struct(
+    key_size: int,
+    value_size: int,
+    value_code: bytes,
+) -> Struct:
+    if value_code == b's':
+        return Struct(f'<BxHIQ{key_size}s{value_size}s')
+
+    return Struct(f'<BxHIQ{key_size}s{value_code.decode()}')
+
+
+class SharedHashTable(Generic[VT]):
+    """
+    Writers are serialized by the lock given to the constructor. A table
+    created without one has a single writer, its creator, and attached
+    handles are read-only. A table created with a lock can be written
+    through any handle attached with that same lock.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        key_size: int = 32,
+        value_type: Type[VT] = int, # type: ignore
+        value_size: int = 8,
+        name: Optional[str] = None,
+        lock: Optional[Any] = None,
+    ):
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError('Capacity must be an integer!')
+        elif capacity < 1:
+            raise ValueError('Capacity must be positive!')
+
+        if not 0 < key_size < 2 ** 16:
+            raise ValueError('Key size must be between 1 and 65535 bytes!')
+
+        if value_type not in VALUE_CODES:
+            raise TypeError('Value type must be int, float or bytes!')
+
+        if value_type is not bytes:
+            value_size = 8
+        elif value_size < 1:
+            raise ValueError('Value size must be positive!')
+
+        num_slots = max(next_prime(capacity * 2), 5)
+        record = _record_struct(key_size, value_size, VALUE_CODES[value_type])
+        self._shm = SharedMemory(
+            name, True, HEADER_SIZE + num_slots * record.size)
+        self._setup(lock, (
+            MAGIC, 0, capacity, 0, 0, key_size, value_size,
+            VALUE_CODES[value_type], lock is not None))
+
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+        lock: Optional[Any] = None,
+    ) -> 'SharedHashTable':
+        table = cls.__new__(cls)
+
+        if sys.version_info >= (3, 13):
+            table._shm = SharedMemory(name, track=False) # type: ignore
+        else:
+            table._shm = SharedMemory(name)
+            resource_tracker.unregister(
+                table._shm._name, 'shared_memory') # type: ignore
+
+        try:
+            table._setup(lock)
+        except ValueError:
+            table._shm.close()
+            raise
+
+        return table
+
+
+    def _setup(self, lock: Optional[Any], header: Tuple = ()):
+        buf = self._shm.buf
+
+        if buf is None:
+            raise ValueError('Shared memory is closed!')
+
+        if header:
+            HEADER.pack_into(buf, 0, *header)
+        elif bytes(buf[:len(MAGIC)]) != MAGIC:
+            raise ValueError(
+                f"'{self._shm.name}' is not a shared hash table!")
+
+        self._buf: memoryview = buf
+        magic, sequence, self._capacity, num_entries, num_tombstones, \
+            self._key_size, self._value_size, value_code, locked = \
+            HEADER.unpack_from(buf)
+
+        if lock is not None and not locked:
+            raise ValueError(
+                f"'{self._shm.name}' was created without a lock!")
+
+        self._data_type: Type[VT] = VALUE_TYPES[value_code] # type: ignore
+        self._record = _record_struct(
+            self._key_size, self._value_size, value_code)
+        self._num_slots = max(next_prime(self._capacity * 2), 5)
+        self._lock = lock
+        self._writable = lock is not None or bool(header)
+
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+
+    def _sequence(self) -> int:
+        return SEQUENCE.unpack_from(self._buf, SEQUENCE_OFFSET)[0]
+
+
+    def _read_consistent(self, read: Callable[[], Any]) -> Any:
+        while True:
+            sequence = self._sequence()
+
+            if sequence & 1:
+                continue
+
+            try:
+                result = read()
+            except Exception:
+                if self._sequence() == sequence:
+                    raise
+
+                continue
+
+            if self._sequence() == sequence:
+                return result
+
+
+    def _write_consistent(self, write: Callable[[], Any]) -> Any:
+        if not self._writable:
+            raise RuntimeError('Shared hash table is read-only!')
+
+        if self._lock is not None:
+            self._lock.acquire()
+
+        buf = self._buf
+        sequence = self._sequence()
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, sequence + 1)
+
+        try:
+            return write()
+        finally:
+            SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, sequence + 2)
+
+            if self._lock is not None:
+                self._lock.release()
+
+
+    def _counts(self) -> Tuple[int, int]:
+        return COUNTS.unpack_from(self._buf, COUNTS_OFFSET)
+
+
+    def _encode_key(self, key: str) -> bytes:
+        if not isinstance(key, str) or not key:
+            raise TypeError('Key must be a non-empty string!')
+
+        encoded = key.encode()
+
+        if len(encoded) > self._key_size:
+            raise ValueError(
+                f"Key {key!r} is longer than {self._key_size} bytes!")
+
+        return encoded
+
+
+    def _check_value(self, value: VT):
+        if not isinstance(value, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+        if self._data_type is bytes and \
+                len(cast(bytes, value)) > self._value_size:
+            raise ValueError(
+                f'Value is longer than {self._value_size} bytes!')
+        elif self._data_type is int and \
+                not -2 ** 63 <= cast(int, value) < 2 ** 63:
+            raise OverflowError('Value must fit in a signed 64-bit integer!')
+
+
+    def _decode_value(self, record: tuple) -> VT:
+        if self._data_type is bytes:
+            return record[5][:record[2]]
+
+        return record[5]
+
+
+    def _slot_offset(self, index: int) -> int:
+        return HEADER_SIZE + index * self._record.size
+
+
+    def _search_slots(self, key: bytes, key_hash: int) -> Tuple[int, tuple]:
+        buf = self._buf
+        unpack_from = self._record.unpack_from
+        num_slots = self._num_slots
+        index = key_hash % num_slots
+        step = 1 + (key_hash // num_slots) % (num_slots - 1)
+        first_free: Optional[Tuple[int, tuple]] = None
+
+        for _ in range(num_slots):
+            record = unpack_from(buf, self._slot_offset(index))
+
+            if record[0] == EMPTY:
+                return first_free or (index, record)
+
+            if record[0] == TOMBSTONE:
+                if first_free is None:
+                    first_free = (index, record)
+            elif record[3] == key_hash and \
+                    record[4][:record[1]] == key:
+                return (index, record)
+
+            index = (index + step) % num_slots
+
+        if first_free:
+            return first_free
+
+        raise RuntimeError(f'Could not find key after {num_slots} tries!')
+
+
+    def _write_record(
+        self,
+        index: int,
+        state: int,
+        key: bytes,
+        key_hash: int,
+        value: VT,
+    ):
+        value_length = \
+            len(cast(bytes, value)) if self._data_type is bytes else 0
+        self._record.pack_into(
+            self._buf, self._slot_offset(index), state, len(key),
+            value_length, key_hash, key, value)
+
+
+    def _compact(self):
+        buf = self._buf
+        num_slots = self._num_slots
+        record_size = self._record.size
+        scratch = bytearray(num_slots * record_size)
+
+        for index in range(num_slots):
+            offset = self._slot_offset(index)
+
+            if buf[offset] != USED:
+                continue
+
+            key_hash = self._record.unpack_from(buf, offset)[3]
+            new_index = key_hash % num_slots
+            step = 1 + (key_hash // num_slots) % (num_slots - 1)
+
+            while scratch[new_index * record_size] != EMPTY:
+                new_index = (new_index + step) % num_slots
+
+            scratch[new_index * record_size:(new_index + 1) * record_size] = \
+                buf[offset:offset + record_size]
+
+        buf[HEADER_SIZE:HEADER_SIZE + len(scratch)] = scratch
+        COUNTS.pack_into(buf, COUNTS_OFFSET, self._counts()[0], 0)
+
+
+    def _find(self, key: str) -> Optional[VT]:
+        encoded = self._encode_key(key)
+        key_hash = stable_hash(encoded)
+
+        def read() -> Optional[VT]:
+            record = self._search_slots(encoded, key_hash)[1]
+            return self._decode_value(record) if record[0] == USED else None
+
+        return self._read_consistent(read)
+
+
+    def __getitem__(self, key: str) -> VT:
+        value = self._find(key)
+
+        if value is None:
+            raise KeyError(f"Key {key!r} not found!")
+
+        return value
+
+
+    def __setitem__(self, key: str, value: VT):
+        encoded = self._encode_key(key)
+        key_hash = stable_hash(encoded)
+        self._check_value(value)
+
+        def write():
+            index, record = self._search_slots(encoded, key_hash)
+
+            if record[0] != USED:
+                raise KeyError(f"Key {key!r} not found!")
+
+            self._write_record(index, USED, encoded, key_hash, value)
+
+        self._write_consistent(write)
+
+
+    def __delitem__(self, key: str):
+        encoded = self._encode_key(key)
+        key_hash = stable_hash(encoded)
+
+        def write():
+            index, record = self._search_slots(encoded, key_hash)
+
+            if record[0] != USED:
+                raise KeyError(f"Key {key!r} not found!")
+
+            num_entries, num_tombstones = self._counts()
+            self._record.pack_into(
+                self._buf, self._slot_offset(index), TOMBSTONE,
+                *record[1:])
+            COUNTS.pack_into(
+                self._buf, COUNTS_OFFSET, num_entries - 1,
+                num_tombstones + 1)
+
+            if num_tombstones + 1 > self._num_slots * MAX_TOMBSTONES:
+                self._compact()
+
+        self._write_consistent(write)
+
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+
+    def __len__(self) -> int:
+        return self._counts()[0]
+
+
+    def __repr__(self) -> str:
+        return str(dict(self.items()))
+
+
+    def __enter__(self) -> 'SharedHashTable[VT]':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def keys(self) -> Iterator[str]:
+        for key, value in self.items():
+            yield key
+
+
+    def values(self) -> Iterator[VT]:
+        for key, value in self.items():
+            yield value
+
+
+    def items(self) -> Iterator[Tuple[str, VT]]:
+        def read() -> List[Tuple[str, VT]]:
+            buf = self._buf
+            unpack_from = self._record.unpack_from
+            items = []
+
+            for index in range(self._num_slots):
+                record = unpack_from(buf, self._slot_offset(index))
+
+                if record[0] == USED:
+                    items.append((
+                        record[4][:record[1]].decode(),
+                        self._decode_value(record)))
+
+            return items
+
+        return iter(self._read_consistent(read))
+
+
+    def get(self, key: str) -> VT:
+        return self.__getitem__(key)
+
+
+    def put(self, key: str, value: VT):
+        encoded = self._encode_key(key)
+        key_hash = stable_hash(encoded)
+        self._check_value(value)
+
+        def write():
+            num_entries, num_tombstones = self._counts()
+            index, record = self._search_slots(encoded, key_hash)
+
+            if record[0] == USED:
+                raise ValueError(f"Key {key!r} already exists!")
+
+            if num_entries >= self._capacity:
+                raise RuntimeError(
+                    f'Shared hash table is full ({self._capacity} keys)!')
+
+            if record[0] == TOMBSTONE:
+                num_tombstones -= 1
+
+            self._write_record(index, USED, encoded, key_hash, value)
+            COUNTS.pack_into(
+                self._buf, COUNTS_OFFSET, num_entries + 1,
+                num_tombstones)
+
+        self._write_consistent(write)
+
+
+    def update(self, key: str, value: VT):
+        return self.__setitem__(key, value)
+
+
+    def delete(self, key: str):
+        return self.__delitem__(key)
+
+
+    def close(self):
+        self._shm.close()
+
+
+    def unlink(self):
+        self._shm.unlink()
@@ -0,0 +1,170 @@
+import pytest
+
+from . import CompactHashTable
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(first='first', second='second', third='third'),
+    dict(first=1, second=2, third=3),
+    dict(first=(1, 'first'), second=(2, 'second'), third=(3, 'third')),
+    dict(first=[10, 11], second=[21, 22], third=[32, 33]),
+])
+def test_initialize_compact_hash_table_success(
+    kwargs: dict[str, str | int | tuple | list],
+):
+    h = CompactHashTable(**kwargs)
+    assert len(h) == 3
+    assert str(h) == str(kwargs)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(first='first', second='second', third=3),
+    dict(first=False, second='True', third=False),
+    dict(first=[10, 11], second=[21, 22], third=(32, 33)),
+])
+def test_initialize_compact_hash_table_fail(
+    kwargs: dict[str, str | int | bool | tuple | list],
+):
+    with pytest.raises(TypeError) as e:
+        CompactHashTable(**kwargs)
+
+    assert 'All entries must have the same type!' in str(e.value)
+
+
+def test_compact_hash_table_get_put_update_delete(
+    example_compact_hash_table_small: CompactHashTable[str],
+):
+    h = example_compact_hash_table_small
+    assert h.get('first') == 'first@email.dev'
+    assert h['second'] == 'second@email.dev'
+    h.put('third', 'third@email.dev')
+    assert h.get('third') == 'third@email.dev'
+    h.update('first', 'updated@email.dev')
+    h['second'] = 'updated_second@email.dev'
+    assert h.get('first') == 'updated@email.dev'
+    assert h.get('second') == 'updated_second@email.dev'
+    h.delete('first')
+    del h['third']
+    assert len(h) == 1
+    assert str(h) == "{'second': 'updated_second@email.dev'}"
+
+    for key in ['first', 'third']:
+        with pytest.raises(KeyError) as e:
+            h.get(key)
+
+        assert f"Key '{key}' not found!" in str(e.value)
+
+
+def test_compact_hash_table_errors(
+    example_compact_hash_table_small: CompactHashTable[str],
+):
+    h = example_compact_hash_table_small
+
+    with pytest.raises(ValueError) as value_error:
+        h.put('second', 'another@email.dev')
+
+    assert "Key 'second' already exists!" in str(value_error.value)
+
+    with pytest.raises(TypeError) as type_error:
+        h.put('third', 3) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(type_error.value)
+
+    with pytest.raises(TypeError) as type_error:
+        h.update('second', 2) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(type_error.value)
+
+    for reader in [h.get, h.delete]:
+        with pytest.raises(TypeError) as type_error:
+            reader('')
+
+        assert 'Key must be a non-empty string!' in str(type_error.value)
+
+    for writer in [h.update, h.put]:
+        with pytest.raises(TypeError) as type_error:
+            writer('', 'another@email.dev')
+
+        assert 'Key must be a non-empty string!' in str(type_error.value)
+
+    with pytest.raises(KeyError) as key_error:
+        h.update('third', 'updated@email.dev')
+
+    assert "Key 'third' not found!" in str(key_error.value)
+
+
+def test_compact_hash_table_insertion_order_and_resize():
+    h: CompactHashTable[int] = CompactHashTable()
+    assert h._indices.typecode == 'b'
+
+    for n in range(200):
+        h.put(f'{n}th', n)
+
+    assert h._indices.typecode == 'h'
+    assert len(h._indices) == 512
+    assert h._keys == [f'{n}th' for n in range(200)]
+
+    for n in range(0, 200, 2):
+        h.delete(f'{n}th')
+
+    assert len(h) == 100
+    assert len(h._keys) == 200
+
+    for n in range(200, 400):
+        h.put(f'{n}th', n)
+
+    assert len(h) == 300
+    assert h._keys == \
+        [f'{n}th' for n in range(1, 200, 2)] + \
+        [f'{n}th' for n in range(200, 400)]
+
+    for n in range(1, 400):
+        if n < 200 and n % 2 == 0:
+            with pytest.raises(KeyError):
+                h.get(f'{n}th')
+        else:
+            assert h.get(f'{n}th') == n
+
+
+def test_compact_hash_table_hashable_keys():
+    keys = [1, -1, 2 ** 64, b'first', (1, 'first'), None, 1.5]
+    h: CompactHashTable[int] = CompactHashTable()
+
+    for n, key in enumerate(keys):
+        h.put(key, n)
+
+    assert [h.get(key) for key in keys] == list(range(len(keys)))
+    assert h.get(1.0) == 0
+    h.delete(None)
+    assert len(h) == len(keys) - 1
+    assert str(h) == \
+        "{1: 0, -1: 1, 18446744073709551616: 2, b'first': 3," \
+        " (1, 'first'): 4, 1.5: 6}"
+
+    with pytest.raises(TypeError) as e:
+        h.put(['first'], 7) # type: ignore
+
+    assert 'Key must be hashable!' in str(e.value)
+
+
+def test_compact_hash_table_iteration(
+    example_compact_hash_table_small: CompactHashTable[str],
+):
+    h = example_compact_hash_table_small
+    h.put('third', 'third@email.dev')
+    h.delete('second')
+    assert list(h) == ['first', 'third']
+    assert list(h.values()) == ['first@email.dev', 'third@email.dev']
+    assert list(h.items()) == \
+        [('first', 'first@email.dev'), ('third', 'third@email.dev')]
+    assert 'first' in h
+    assert 'second' not in h
+
+    iterator = h.keys()
+    next(iterator)
+    h.put('fourth', 'fourth@email.dev')
+
+    with pytest.raises(RuntimeError) as e:
+        next(iterator)
+
+    assert 'CompactHashTable changed size during iteration!' in str(e.value)
@@ -0,0 +1,144 @@
+from threading import Barrier, Thread
+from typing import Callable, List
+
+import pytest
+
+from . import ConcurrentHashTable
+
+
+def run_threads(targets: List[Callable[[], None]]):
+    errors: List[BaseException] = []
+    barrier = Barrier(len(targets))
+
+    def run(target: Callable[[], None]):
+        barrier.wait()
+
+        try:
+            target()
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [Thread(target=run, args=(target,)) for target in targets]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_concurrent_hash_table_get_put_update_delete():
+    h = ConcurrentHashTable(
+        4, first='first@email.dev', second='second@email.dev')
+    assert len(h) == 2
+    assert len(h._shards) == 4
+    h.put('third', 'third@email.dev')
+    h.update('first', 'updated@email.dev')
+    h['second'] = 'updated_second@email.dev'
+    h.delete('third')
+    assert h.get('first') == 'updated@email.dev'
+    assert h['second'] == 'updated_second@email.dev'
+    assert 'third' not in h
+    assert sorted(h) == ['first', 'second']
+    assert dict(h.items()) == {
+        'first': 'updated@email.dev', 'second': 'updated_second@email.dev'}
+
+    with pytest.raises(KeyError) as e:
+        h.get('third')
+
+    assert "Key 'third' not found!" in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        h.put('first', 'another@email.dev')
+
+    assert "Key 'first' already exists!" in str(e.value)
+
+
+def test_concurrent_hash_table_fail_type_across_shards():
+    h: ConcurrentHashTable[int] = ConcurrentHashTable(8)
+
+    for n in range(8):
+        h.put(n, n)
+
+    for n in range(8, 16):
+        with pytest.raises(TypeError) as e:
+            h.put(n, str(n)) # type: ignore
+
+        assert "Value must be of type <class 'int'>!" in str(e.value)
+
+        with pytest.raises(TypeError) as e:
+            h.update(n - 8, str(n)) # type: ignore
+
+        assert "Value must be of type <class 'int'>!" in str(e.value)
+
+
+def test_concurrent_hash_table_shards_share_data_type():
+    h: ConcurrentHashTable[int] = ConcurrentHashTable(2)
+    h.put(0, 0)
+    h.put(1, True)
+    h.put(3, 3)
+    h.update(1, 1)
+    assert h.get(3) == 3
+    assert all(shard._data_type is int for shard in h._shards)
+
+
+def test_concurrent_hash_table_fail_num_shards():
+    with pytest.raises(TypeError) as e:
+        ConcurrentHashTable('4') # type: ignore
+
+    assert 'Number of shards must be an integer!' in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        ConcurrentHashTable(0)
+
+    assert 'Number of shards must be positive!' in str(e.value)
+
+
+def test_concurrent_hash_table_threaded_stress():
+    h: ConcurrentHashTable[int] = ConcurrentHashTable(8)
+    num_threads = 8
+    num_keys = 2000
+
+    def writer(thread: int) -> Callable[[], None]:
+        def run():
+            for n in range(num_keys):
+                h.put(f'{thread}-{n}', n)
+
+            for n in range(0, num_keys, 2):
+                h.update(f'{thread}-{n}', -n)
+
+            for n in range(0, num_keys, 4):
+                h.delete(f'{thread}-{n}')
+
+        return run
+
+    def reader():
+        for _ in range(5):
+            for thread in range(num_threads):
+                for n in range(0, num_keys, 50):
+                    try:
+                        assert abs(h.get(f'{thread}-{n}')) == n
+                    except KeyError:
+                        pass
+
+            assert len(h) <= num_threads * num_keys
+
+    run_threads(
+        [writer(thread) for thread in range(num_threads)] +
+        [reader for _ in range(4)])
+
+    assert len(h) == num_threads * (num_keys - num_keys // 4)
+    assert len(list(h.keys())) == len(h)
+
+    for thread in range(num_threads):
+        for n in range(num_keys):
+            key = f'{thread}-{n}'
+
+            if n % 4 == 0:
+                assert key not in h
+            elif n % 2 == 0:
+                assert h[key] == -n
+            else:
+                assert h[key] == n
@@ -0,0 +1,151 @@
+import pytest
+
+from . import CuckooHashTable
+from .cuckoo_hash_table import BUCKET_SIZE, STASH_SIZE
+
+
+def test_cuckoo_hash_table_get_put_update_delete():
+    h = CuckooHashTable(
+        2, first='first@email.dev', second='second@email.dev',
+        third='third@email.dev',)
+    assert len(h) == 3
+    assert h.get('first') == 'first@email.dev'
+    h.put('fourth', 'fourth@email.dev')
+    h.update('first', 'updated@email.dev')
+    h['second'] = 'updated_second@email.dev'
+    h.delete('third')
+    del h['fourth']
+    assert h['first'] == 'updated@email.dev'
+    assert h['second'] == 'updated_second@email.dev'
+    assert 'third' not in h
+    assert sorted(h) == ['first', 'second']
+    assert len(h) == 2
+
+    for method in [h.get, h.delete]:
+        with pytest.raises(KeyError) as e:
+            method('third')
+
+        assert "Key 'third' not found!" in str(e.value)
+
+    with pytest.raises(KeyError) as e:
+        h.update('third', 'third@email.dev')
+
+    assert "Key 'third' not found!" in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        h.put('first', 'first@email.dev')
+
+    assert "Key 'first' already exists!" in str(e.value)
+
+    with pytest.raises(TypeError) as e:
+        h.put('fifth', 5) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+
+
+@pytest.mark.parametrize('num_hashes', [2, 3, 4])
+def test_cuckoo_hash_table_many_keys(num_hashes: int):
+    h: CuckooHashTable[int] = CuckooHashTable(num_hashes)
+
+    for n in range(5000):
+        h.put(f'{n}th', n)
+
+    assert len(h) == 5000
+    assert len(h._stash) <= STASH_SIZE
+    assert h._num_entries <= len(h._slots) * 0.9
+    assert all(h[f'{n}th'] == n for n in range(5000))
+
+    for n in range(0, 5000, 2):
+        h.delete(f'{n}th')
+
+    assert len(h) == 2500
+    assert sorted(h.values()) == list(range(1, 5000, 2))
+
+
+def test_cuckoo_hash_table_constant_lookup():
+    h: CuckooHashTable[int] = CuckooHashTable(3)
+
+    for n in range(1000):
+        h.put(n, n)
+
+    for n in range(1000):
+        index, stashed = h._search(n, n)
+
+        if stashed:
+            assert h._stash[index][1] == n
+        else:
+            assert any(
+                h._bucket_start(table, n) <= index <
+                h._bucket_start(table, n) + BUCKET_SIZE
+                for table in range(3))
+
+
+def test_cuckoo_hash_table_stash_and_rehash(monkeypatch):
+    monkeypatch.setattr(
+        'data_structures.hash_table.cuckoo_hash_table.MAX_KICKS', 1)
+    h: CuckooHashTable[int] = CuckooHashTable()
+    assert h._num_buckets == 1
+    n = 0
+
+    while not h._stash:
+        h.put(n, n)
+        n += 1
+
+    rehashes = h._num_rehashes
+
+    for entry in list(h._stash):
+        assert h[entry[1]] == entry[2]
+        h.update(entry[1], -entry[2])
+        assert h[entry[1]] == -entry[2]
+
+    while h._num_rehashes == rehashes:
+        h.put(n, n)
+        n += 1
+
+    assert len(h) == n
+    assert all(abs(h[key]) == key for key in range(n))
+
+    for entry in list(h._stash):
+        h.delete(entry[1])
+        assert entry[1] not in h
+
+
+def test_cuckoo_hash_table_colliding_hashes():
+    h: CuckooHashTable[int] = CuckooHashTable()
+    modulus = 2 ** 61 - 1
+
+    for k in range(20):
+        h.put(k * modulus, k)
+
+    assert len(h) == 20
+    assert len(h._stash) > STASH_SIZE
+    assert h._num_buckets <= 16
+    assert all(h[k * modulus] == k for k in range(20))
+
+    for k in range(0, 20, 2):
+        h.delete(k * modulus)
+
+    assert sorted(h.values()) == list(range(1, 20, 2))
+
+
+def test_cuckoo_hash_table_iteration_fail_modified():
+    h = CuckooHashTable(2, first=1, second=2)
+    iterator = h.items()
+    next(iterator)
+    h.put('third', 3)
+
+    with pytest.raises(RuntimeError) as e:
+        list(iterator)
+
+    assert 'CuckooHashTable changed size during iteration!' in str(e.value)
+
+
+@pytest.mark.parametrize('num_hashes, error, message', [
+    ('2', TypeError, 'Number of hashes must be an integer!'),
+    (1, ValueError, 'Number of hashes must be at least 2!'),
+])
+def test_cuckoo_hash_table_fail_num_hashes(num_hashes, error, message):
+    with pytest.raises(error) as e:
+        CuckooHashTable(num_hashes)
+
+    assert message in str(e.value)
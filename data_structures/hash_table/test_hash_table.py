@@ -1,3 +1,9 @@
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
 import pytest
 
 from . import HashTable
@@ -344,3 +350,554 @@ def test_hash_table_shrink_array_large(
     assert len([i for i in h._array if i == ()]) == 0
     assert len([i for i in h._array if i]) == 4
 
+
+
+@pytest.mark.parametrize('args, error, message', [
+    (('1',), TypeError, 'Rehash step must be an integer!'),
+    ((True,), TypeError, 'Rehash step must be an integer!'),
+    ((-1,), ValueError, 'Rehash step must not be negative!'),
+    ((1, 0), ValueError, 'Max pause must be a positive number of seconds!'),
+])
+def test_hash_table_rehash_options_fail(
+    args: tuple, error: type[Exception], message: str,
+):
+    with pytest.raises(error) as e:
+        HashTable(*args, first='first@email.dev')
+
+    assert message in str(e.value)
+
+
+def test_hash_table_incremental_expand():
+    h: HashTable[str] = HashTable(1, first='first@email.dev')
+    keys = ['first']
+
+    for n in range(2, 40):
+        key = f'{n}th'
+        h.put(key, f'{key}@email.dev')
+        keys.append(key)
+
+        for other in keys:
+            assert h.get(other) == f'{other}@email.dev'
+
+        assert len(h) == len(keys)
+
+    h.put('last', 'last@email.dev')
+    assert h._old_array is not None
+
+    while h._old_array is not None:
+        h.get('first')
+
+    assert len(h) == len(keys) + 1
+    assert len([i for i in h._array if i]) == len(keys) + 1
+
+
+def test_hash_table_incremental_update_delete_during_rehash():
+    h: HashTable[str] = HashTable(1, first='first@email.dev')
+    n = 1
+
+    while n < 20 or h._old_array is None:
+        n += 1
+        h.put(f'{n}th', f'{n}th@email.dev')
+
+    h.update('first', 'updated@email.dev')
+    h.delete('2th')
+    assert h.get('first') == 'updated@email.dev'
+
+    with pytest.raises(KeyError) as e:
+        h.get('2th')
+
+    assert "Key '2th' not found!" in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        h.put('3th', 'another@email.dev')
+
+    assert "Key '3th' already exists!" in str(e.value)
+
+    while h._old_array is not None:
+        h.get('first')
+
+    assert len(h) == n - 1
+    assert h.get('first') == 'updated@email.dev'
+
+    for key in range(3, n + 1):
+        assert h.get(f'{key}th') == f'{key}th@email.dev'
+
+
+def test_hash_table_incremental_max_pause():
+    h: HashTable[int] = HashTable(1000, 1e-9, first=1)
+
+    for n in range(2, 200):
+        h.put(f'{n}th', n)
+
+    for n in range(2, 200):
+        assert h.get(f'{n}th') == n
+
+    assert len(h) == 199
+
+
+@pytest.mark.parametrize('rehash_step', [1, 2, 8])
+def test_hash_table_incremental_many_keys(rehash_step: int):
+    h: HashTable[int] = HashTable(rehash_step)
+
+    for n in range(5000):
+        h.put(f'k{n}', n)
+
+    assert len(h) == 5000
+
+    for n in range(0, 5000, 2):
+        h.delete(f'k{n}')
+
+    assert len(h) == 2500
+
+    for n in range(1, 5000, 2):
+        assert h.get(f'k{n}') == n
+
+
+@pytest.mark.parametrize('rehash_step', [0, 1, 8])
+def test_hash_table_occupancy_counters(rehash_step: int):
+    h: HashTable[int] = HashTable(rehash_step)
+    keys: set[str] = set()
+
+    for n in range(300):
+        key = f'{n % 97}th'
+
+        if key in keys:
+            h.delete(key)
+            keys.remove(key)
+        else:
+            h.put(key, n)
+            keys.add(key)
+
+        old_array = (h._old_array or [])[h._rehash_index:]
+        assert len(h) == len(keys)
+        assert h._num_entries == \
+            len([i for i in h._array + old_array if i])
+        assert h._num_tombstones == len([i for i in h._array if i == ()])
+
+
+@pytest.mark.parametrize('size', [5, 13, 29, 59])
+def test_hash_table_probe_sequence_visits_every_slot(size: int):
+    h: HashTable[str] = HashTable()
+
+    for key_hash in [0, 1, size - 1, size, 12345, -98765, 2 ** 61 - 2]:
+        step = h._probe_step(key_hash, size)
+        indices = {(key_hash + step * n) % size for n in range(size)}
+        assert indices == set(range(size))
+
+
+def test_hash_table_search_full_array(
+    example_hash_table_small: HashTable[str],
+):
+    h = example_hash_table_small
+    h._insert_item('third', 'third@email.dev')
+    h._insert_item('fourth', 'fourth@email.dev')
+    assert len(h._array) == 5
+
+    for key in ['first', 'second', 'third', 'fourth']:
+        assert h.get(key) == f'{key}@email.dev'
+
+    index, entry = h._search_array('fifth', hash('fifth'))
+    assert entry is None and h._array[index] is None
+
+    h._insert_item('fifth', 'fifth@email.dev')
+    assert h.get('fifth') == 'fifth@email.dev'
+
+    with pytest.raises(RuntimeError) as e:
+        h.get('sixth')
+
+    assert "Could not find key 'sixth' after 5 tries!" in str(e.value)
+
+
+def test_hash_table_entries_store_hash(
+    example_hash_table_medium: HashTable[str],
+):
+    entries = [entry for entry in example_hash_table_medium._array if entry]
+    assert len(entries) == 6
+
+    for key_hash, key, value in entries:
+        assert key_hash == hash(key)
+        assert value == f'{key}@email.dev'
+
+
+def test_hash_table_from_items():
+    items = [(f'{n}th', f'{n}th@email.dev') for n in range(100)]
+    h = HashTable.from_items(iter(items))
+    assert len(h) == 100
+    assert len(h._array) == 211
+
+    for key, value in items:
+        assert h.get(key) == value
+
+    h = HashTable.from_items(items[:10], expected_size=100)
+    assert len(h) == 10
+    assert len(h._array) == 211
+    assert h.get_many([key for key, value in items[:10]]) == \
+        [value for key, value in items[:10]]
+
+
+def test_hash_table_from_items_fail():
+    with pytest.raises(TypeError) as e:
+        HashTable.from_items([('first', 'first'), ('second', 2)])
+
+    assert 'All entries must have the same type!' in str(e.value)
+
+    with pytest.raises(ValueError) as e:
+        HashTable.from_items([('first', 'first'), ('first', 'second')])
+
+    assert "Key 'first' already exists!" in str(e.value)
+
+
+def test_hash_table_put_many(example_hash_table_small: HashTable[str]):
+    h = example_hash_table_small
+    h.put_many((f'{n}th', f'{n}th@email.dev') for n in range(3, 30))
+    assert len(h) == 29
+    assert len(h._array) == 59
+    assert h.get('first') == 'first@email.dev'
+    assert h.get_many(['3th', '29th', 'second']) == \
+        ['3th@email.dev', '29th@email.dev', 'second@email.dev']
+
+    h.put_many([])
+    assert len(h) == 29
+
+
+def test_hash_table_put_many_fail(example_hash_table_small: HashTable[str]):
+    h = example_hash_table_small
+
+    with pytest.raises(TypeError) as type_error:
+        h.put_many([('third', 'third@email.dev'), ('fourth', 4)]) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(type_error.value)
+    assert len(h) == 2
+
+    for items in [
+        [('third', 'third@email.dev'), ('first', 'x@email.dev')],
+        [('third', 'third@email.dev'), ('third', 'x@email.dev')],
+    ]:
+        with pytest.raises(ValueError) as value_error:
+            h.put_many(items)
+
+        assert 'already exists!' in str(value_error.value)
+        assert len(h) == 2
+        assert 'third' not in h
+        assert h.get('first') == 'first@email.dev'
+
+
+def test_hash_table_put_many_fail_leaves_type_unset():
+    h: HashTable[int] = HashTable()
+
+    with pytest.raises(ValueError):
+        h.put_many([('second', 'second'), ('second', 'again')]) # type: ignore
+
+    assert h._data_type is None
+    h.put_many([('second', 2)])
+    assert h.get('second') == 2
+
+
+def test_hash_table_put_many_during_rehash():
+    h: HashTable[int] = HashTable(1)
+
+    while len(h) < 20 or h._old_array is None:
+        h.put(f'{len(h)}th', len(h))
+
+    size = len(h)
+    h.put_many((f'{n}th', n) for n in range(size, 200))
+    assert h._old_array is None
+    assert h.get_many([f'{n}th' for n in range(200)]) == list(range(200))
+
+
+def test_hash_table_get_many_delete_many(
+    example_hash_table_medium: HashTable[str],
+):
+    h = example_hash_table_medium
+    h.delete_many(['first', 'third', 'fifth'])
+    assert len(h) == 3
+    assert h.get_many(['second', 'fourth']) == \
+        ['second@email.dev', 'fourth@email.dev']
+
+    with pytest.raises(KeyError) as e:
+        h.get_many(['second', 'third'])
+
+    assert "Key 'third' not found!" in str(e.value)
+
+    with pytest.raises(KeyError) as e:
+        h.delete_many(['second', 'fifth'])
+
+    assert "Key 'fifth' not found!" in str(e.value)
+
+
+@dataclass(frozen=True)
+class CompositeKey:
+    region: str
+    id: int
+
+
+@pytest.mark.parametrize('keys', [
+    [1, 2, 3, -1, 0, 2 ** 64, -(2 ** 70)],
+    [b'first', b'second', b'third'],
+    [(1, 'first'), (2, 'second'), (2, 'third')],
+    [CompositeKey('eu', 1), CompositeKey('eu', 2), CompositeKey('us', 1)],
+    [1.5, None, 'first', (1, 2), frozenset({1})],
+])
+def test_hash_table_hashable_keys(keys: list):
+    h: HashTable[int] = HashTable()
+
+    for n, key in enumerate(keys):
+        h.put(key, n)
+
+    assert len(h) == len(keys)
+
+    for n, key in enumerate(keys):
+        assert h.get(key) == n
+        h.update(key, n * 10)
+        assert h[key] == n * 10
+
+    h.delete(keys[0])
+
+    with pytest.raises(KeyError) as e:
+        h.get(keys[0])
+
+    assert f'Key {keys[0]!r} not found!' in str(e.value)
+
+
+def test_hash_table_int_keys_match_equal_keys():
+    h: HashTable[str] = HashTable()
+    h.put(1, 'one')
+    h.put(2 ** 61, 'big')
+    h.put(-1, 'minus one')
+    assert h.get(1.0) == 'one'
+    assert h.get(True) == 'one'
+    assert h.get(float(2 ** 61)) == 'big'
+    assert h.get(-1.0) == 'minus one'
+
+    with pytest.raises(ValueError) as e:
+        h.put(1.0, 'one again')
+
+    assert 'Key 1.0 already exists!' in str(e.value)
+
+
+@pytest.mark.parametrize('key', [[1, 2], {'first': 1}, {1, 2}])
+def test_hash_table_unhashable_key_fail(
+    key: list | dict | set,
+    example_hash_table_small: HashTable[str],
+):
+    with pytest.raises(TypeError) as e:
+        example_hash_table_small.put(key, 'another@email.dev') # type: ignore
+
+    assert 'Key must be hashable!' in str(e.value)
+
+    with pytest.raises(TypeError) as e:
+        example_hash_table_small.get(key) # type: ignore
+
+    assert 'Key must be hashable!' in str(e.value)
+
+
+@pytest.mark.parametrize('rehash_step', [0, 1])
+def test_hash_table_probe_histogram(rehash_step: int):
+    h: HashTable[int] = HashTable(rehash_step)
+
+    for n in range(100):
+        h.put(f'{n}th', n)
+
+    histogram = h.probe_histogram()
+    assert sum(histogram.values()) == 100
+    assert min(histogram) == 1
+    assert list(histogram) == sorted(histogram)
+
+
+def test_hash_table_iteration(example_hash_table_medium: HashTable[str]):
+    h = example_hash_table_medium
+    keys = ['first', 'second', 'third', 'fourth', 'fifth', 'sixth']
+    assert sorted(h, key=str) == sorted(keys)
+    assert sorted(h.keys(), key=str) == sorted(keys)
+    assert sorted(h.values()) == sorted(f'{key}@email.dev' for key in keys)
+    assert sorted(h.items()) == \
+        sorted((key, f'{key}@email.dev') for key in keys)
+    assert dict(h.items()) == eval(str(h))
+    assert list(HashTable().items()) == []
+
+
+def test_hash_table_contains(example_hash_table_small: HashTable[str]):
+    h = example_hash_table_small
+    assert 'first' in h
+    assert 'third' not in h
+    h.delete('first')
+    assert 'first' not in h
+
+    with pytest.raises(TypeError) as e:
+        ['first'] in h # type: ignore
+
+    assert 'Key must be hashable!' in str(e.value)
+
+
+@pytest.mark.parametrize('mutation', [
+    lambda h: h.put('seventh', 'seventh@email.dev'),
+    lambda h: h.delete('sixth'),
+    lambda h: h.put_many([('seventh', 'seventh@email.dev')]),
+])
+def test_hash_table_iteration_fail_modified(
+    mutation,
+    example_hash_table_medium: HashTable[str],
+):
+    h = example_hash_table_medium
+    iterator = h.items()
+    next(iterator)
+    mutation(h)
+
+    with pytest.raises(RuntimeError) as e:
+        list(iterator)
+
+    assert 'HashTable changed size during iteration!' in str(e.value)
+
+
+def test_hash_table_iteration_update_allowed(
+    example_hash_table_medium: HashTable[str],
+):
+    h = example_hash_table_medium
+
+    for key in h:
+        h[key] = f'updated_{key}'
+        assert key in h
+
+    assert sorted(h.values()) == sorted(f'updated_{key}' for key in h)
+
+
+def test_hash_table_iteration_during_rehash():
+    h: HashTable[int] = HashTable(1)
+
+    while len(h) < 20 or h._old_array is None:
+        h.put(len(h), len(h))
+
+    assert sorted(h.values()) == list(range(len(h)))
+    assert h._old_array is None
+
+
+def test_hash_table_stats_disabled(example_hash_table_medium: HashTable[str]):
+    h = example_hash_table_medium
+    h.delete('first')
+    assert h._stats is None
+    assert h.stats() == {
+        'entries': 5,
+        'slots': 13,
+        'tombstones': 1,
+        'load_factor': 5 / 13,
+        'rehashing': False,
+    }
+
+
+def test_hash_table_stats_enabled():
+    events = []
+    h: HashTable[int] = HashTable()
+    h.enable_stats(lambda event, details: events.append((event, details)))
+
+    for n in range(20):
+        h.put(n, n)
+
+    assert h.get_many(range(20)) == list(range(20))
+    assert 20 not in h
+
+    for n in range(17):
+        h.delete(n)
+
+    h.put(20, 20)
+    stats = h.stats()
+    assert stats['entries'] == 4
+    assert stats['searches'] == 21 + 20 + 1 + 17
+    assert stats['comparisons'] == 20 + 17
+    assert sum(stats['probe_lengths'].values()) == stats['searches']
+    assert [event for event, details in events] == \
+        ['expand'] * stats['expand_count'] + ['shrink']
+    assert stats['expand_count'] == 3
+    assert stats['shrink_count'] == 1
+    assert stats['expand_time'] + stats['shrink_time'] == \
+        pytest.approx(sum(details['duration'] for event, details in events))
+
+    for event, details in events:
+        assert (details['new_size'] > details['old_size']) == \
+            (event == 'expand')
+
+    assert events[-1][1]['new_size'] == stats['slots']
+    h.disable_stats()
+    h.get(20)
+    assert 'searches' not in h.stats()
+
+
+def test_hash_table_dump_load(tmp_path, example_hash_table_large):
+    h: HashTable[str] = example_hash_table_large
+    h.delete('third')
+    path = str(tmp_path / 'table.snapshot')
+    h.dump(path)
+    loaded = HashTable.load(path)
+    assert loaded._array == h._array
+    assert loaded._num_tombstones == 1
+    assert len(loaded) == 11
+    assert loaded._data_type is str
+    assert dict(loaded.items()) == dict(h.items())
+    loaded.put('third', 'third@email.dev')
+    assert loaded['third'] == 'third@email.dev'
+
+
+def test_hash_table_load_rehash_on_seed_mismatch(tmp_path):
+    path = str(tmp_path / 'table.snapshot')
+    script = (
+        'from data_structures import HashTable\n'
+        'h = HashTable.from_items((f"{n}th", n) for n in range(100))\n'
+        'h.delete_many(f"{n}th" for n in range(0, 100, 10))\n'
+        f'h.dump({path!r})\n')
+    subprocess.run(
+        [sys.executable, '-c', script], check=True,
+        cwd=Path(__file__).parents[2],
+        env={**os.environ, 'PYTHONHASHSEED': '12345'})
+    loaded: HashTable[int] = HashTable.load(path)
+    assert loaded._num_tombstones == 0
+    assert len(loaded) == 90
+
+    for n in range(100):
+        if n % 10:
+            assert loaded[f'{n}th'] == n
+        else:
+            assert f'{n}th' not in loaded
+
+
+def test_hash_table_load_fail_invalid(tmp_path):
+    path = tmp_path / 'table.snapshot'
+    path.write_bytes(b'\0' * 64)
+
+    with pytest.raises(ValueError) as e:
+        HashTable.load(str(path))
+
+    assert 'is not a HashTable snapshot!' in str(e.value)
+
+
+def test_hash_table_bloom_filter(example_hash_table_large: HashTable[str]):
+    h = example_hash_table_large
+    h.enable_bloom_filter(0.001)
+    h.enable_stats()
+    assert h._bloom is not None
+    assert h._bloom.capacity == 64
+
+    for n in range(1000):
+        assert f'missing{n}' not in h
+
+        with pytest.raises(KeyError) as e:
+            h.get(f'missing{n}')
+
+        assert f"Key 'missing{n}' not found!" in str(e.value)
+
+    assert h.stats()['searches'] < 20
+    h.put_many((f'{n}th', f'{n}th@email.dev') for n in range(13, 64))
+    h.put('64th', '64th@email.dev')
+    assert h._bloom.capacity == 64
+    h.put('65th', '65th@email.dev')
+    assert h._bloom.capacity == 130
+    assert h['first'] == 'first@email.dev'
+    assert all(h[f'{n}th'] == f'{n}th@email.dev' for n in range(13, 66))
+
+    h.delete_many(f'{n}th' for n in range(13, 66))
+    assert len(h._bloom) == 65
+    h.rebuild_bloom_filter()
+    assert len(h._bloom) == 12
+    assert h._bloom.capacity == 64
+    assert h._bloom.error_rate == 0.001
+    h.disable_bloom_filter()
+    assert h._bloom is None
+    assert '13th' not in h
@@ -0,0 +1,151 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from . import PersistentHashTable
+
+
+@pytest.fixture
+def table_path(tmp_path: Path) -> str:
+    return str(tmp_path / 'table')
+
+
+def test_persistent_hash_table_get_put_update_delete(table_path: str):
+    with PersistentHashTable[str](
+        table_path, first='first@email.dev', second='second@email.dev',
+    ) as h:
+        assert len(h) == 2
+        assert h.get('first') == 'first@email.dev'
+        h.put('third', 'third@email.dev')
+        h.update('first', 'updated@email.dev')
+        h['second'] = 'updated_second@email.dev'
+        h.delete('third')
+        assert h['first'] == 'updated@email.dev'
+        assert h['second'] == 'updated_second@email.dev'
+        assert 'third' not in h
+        assert len(h) == 2
+
+        with pytest.raises(KeyError) as key_error:
+            h.get('third')
+
+        assert "Key 'third' not found!" in str(key_error.value)
+
+        with pytest.raises(ValueError) as value_error:
+            h.put('first', 'another@email.dev')
+
+        assert "Key 'first' already exists!" in str(value_error.value)
+
+        with pytest.raises(TypeError) as type_error:
+            h.put('fourth', 4) # type: ignore
+
+        assert "Value must be of type <class 'str'>!" in str(type_error.value)
+
+
+def test_persistent_hash_table_reopen(table_path: str):
+    with PersistentHashTable[str](table_path) as h:
+        for n in range(500):
+            h.put(n, f'{n}th')
+
+        for n in range(0, 500, 5):
+            h.delete(n)
+
+        assert h._capacity > 13
+
+    with PersistentHashTable[str](table_path, True) as h:
+        assert len(h) == 400
+        assert h._data_type is str
+
+        for n in range(500):
+            if n % 5:
+                assert h.get(n) == f'{n}th'
+            else:
+                assert n not in h
+
+        writes: list[tuple[Callable[..., None], tuple]] = [
+            (h.put, (1000, 'x')), (h.update, (1, 'x')), (h.delete, (1,)),
+        ]
+
+        for method, args in writes:
+            with pytest.raises(RuntimeError) as runtime_error:
+                method(*args)
+
+            assert 'Persistent hash table is read-only!' \
+                in str(runtime_error.value)
+
+    with PersistentHashTable[str](table_path) as h:
+        with pytest.raises(TypeError) as type_error:
+            h.put(1000, 1000) # type: ignore
+
+        assert "Value must be of type <class 'str'>!" in str(type_error.value)
+
+
+def test_persistent_hash_table_reuses_tombstones(table_path: str):
+    with PersistentHashTable[int](table_path) as h:
+        for n in range(1000):
+            h.put('key', n)
+            h.delete('key')
+
+        assert h._capacity == 13
+        assert len(h) == 0
+
+
+def test_persistent_hash_table_get_view(table_path: str):
+    with PersistentHashTable[bytes](table_path, False, first=b'first') as h:
+        view = h.get_view('first')
+        assert view.readonly
+        assert view == b'first'
+        assert h.get('first') == b'first'
+        view.release()
+
+    with PersistentHashTable[bytes](table_path, True) as h:
+        view = h.get_view('first')
+        assert view.readonly
+        assert bytes(view) == b'first'
+        view.release()
+
+
+def test_persistent_hash_table_get_view_across_growth(table_path: str):
+    h: PersistentHashTable[bytes] = \
+        PersistentHashTable(table_path, False, first=b'first')
+    view = h.get_view('first')
+    heap_size = len(h._heap)
+
+    for n in range(1000):
+        h.put(n, bytes(100))
+
+    assert len(h._heap) > heap_size
+    assert view == b'first'
+    assert h.get_view('first') == b'first'
+    h.close()
+    assert view == b'first'
+    view.release()
+
+
+@pytest.mark.parametrize('key', [
+    1.0, True, (1, 2), frozenset({'a'}), None,
+])
+def test_persistent_hash_table_fail_key_type(table_path: str, key):
+    with PersistentHashTable[str](table_path) as h:
+        with pytest.raises(TypeError) as e:
+            h.put(key, 'value')
+
+        assert 'Key must be a str, bytes or int!' in str(e.value)
+
+
+def test_persistent_hash_table_fail_missing(table_path: str):
+    with pytest.raises(FileNotFoundError) as e:
+        PersistentHashTable(table_path, True)
+
+    assert f"No persistent hash table at '{table_path}'!" in str(e.value)
+
+
+@pytest.mark.filterwarnings('error')
+def test_persistent_hash_table_fail_invalid_file(table_path: str):
+    Path(f'{table_path}.slots').write_bytes(b'\0' * 128)
+    Path(f'{table_path}.heap').write_bytes(b'\0' * 128)
+
+    with pytest.raises(ValueError) as e:
+        PersistentHashTable(table_path)
+
+    assert 'is not a persistent hash table!' in str(e.value)
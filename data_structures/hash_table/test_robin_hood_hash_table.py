@@ -0,0 +1,119 @@
+import pytest
+
+from . import RobinHoodHashTable
+
+
+def assert_robin_hood_invariant(h: RobinHoodHashTable):
+    size = len(h._array)
+
+    for index, entry in enumerate(h._array):
+        assert entry != ()
+
+        if entry:
+            previous = h._array[(index - 1) % size]
+            distance = h._displacement(entry[0], index, size)
+
+            if distance > 0:
+                assert previous
+                assert h._displacement(previous[0], index - 1, size) >= \
+                    distance - 1
+
+
+def test_robin_hood_hash_table_get_put_update_delete(
+    example_robin_hood_hash_table_medium: RobinHoodHashTable[str],
+):
+    h = example_robin_hood_hash_table_medium
+    assert len(h) == 6
+    assert len(h._array) == 13
+    assert h.get('first') == 'first@email.dev'
+    h.put('seventh', 'seventh@email.dev')
+    h.update('first', 'updated@email.dev')
+    assert h['first'] == 'updated@email.dev'
+    assert h['seventh'] == 'seventh@email.dev'
+    h.delete('second')
+    del h['third']
+    assert len(h) == 5
+    assert_robin_hood_invariant(h)
+
+    for key in ['second', 'third']:
+        with pytest.raises(KeyError) as e:
+            h.get(key)
+
+        assert f"Key '{key}' not found!" in str(e.value)
+
+    with pytest.raises(KeyError) as e:
+        h.delete('second')
+
+    assert "Key 'second' not found!" in str(e.value)
+
+    with pytest.raises(ValueError) as value_error:
+        h.put('fourth', 'another@email.dev')
+
+    assert "Key 'fourth' already exists!" in str(value_error.value)
+
+
+def test_robin_hood_hash_table_rehash_option_ignored():
+    with pytest.raises(TypeError):
+        RobinHoodHashTable(1, first=1) # type: ignore
+
+
+def test_robin_hood_hash_table_churn_leaves_no_tombstones():
+    h: RobinHoodHashTable[int] = RobinHoodHashTable()
+    live: list[int] = []
+
+    for n in range(2000):
+        h.put(n * 7919, n)
+        live.append(n * 7919)
+
+        if len(live) > 40:
+            h.delete(live.pop(n % len(live)))
+
+        assert_robin_hood_invariant(h)
+
+    assert len(h) == len(live)
+    assert h._num_tombstones == 0
+    assert sum(h.probe_histogram().values()) == len(live)
+
+    for key in live:
+        assert h.get(key) == key // 7919
+
+
+def test_robin_hood_hash_table_bulk_load():
+    items = [(f'{n}th', n) for n in range(500)]
+    h = RobinHoodHashTable.from_items(items)
+    assert isinstance(h, RobinHoodHashTable)
+    assert_robin_hood_invariant(h)
+    assert h.get_many([key for key, value in items]) == list(range(500))
+    h.delete_many([f'{n}th' for n in range(0, 500, 2)])
+    assert_robin_hood_invariant(h)
+    assert len(h) == 250
+
+
+def test_robin_hood_hash_table_probe_histogram():
+    h: RobinHoodHashTable[int] = RobinHoodHashTable()
+
+    for n in range(20):
+        h.put(n * 59, n)
+
+    assert len(h._array) == 59
+    assert h.probe_histogram() == {length: 1 for length in range(1, 21)}
+
+    h.delete(0)
+    assert h.probe_histogram() == {length: 1 for length in range(1, 20)}
+
+    with pytest.raises(KeyError):
+        h.get(20 * 59)
+
+
+def test_robin_hood_hash_table_stats():
+    h: RobinHoodHashTable[int] = RobinHoodHashTable()
+    h.enable_stats()
+
+    for n in range(20):
+        h.put(n * 59, n)
+
+    assert h.get_many([n * 59 for n in range(20)]) == list(range(20))
+    stats = h.stats()
+    assert stats['searches'] == 40
+    assert stats['comparisons'] == 20
+    assert sum(stats['probe_lengths'].values()) == 40
@@ -0,0 +1,220 @@
+import multiprocessing
+from typing import Callable, Iterator
+
+import pytest
+
+from . import SharedHashTable
+
+
+@pytest.fixture
+def shared_table() -> Iterator[SharedHashTable[int]]:
+    h: SharedHashTable[int] = SharedHashTable(100, 16)
+    yield h
+    h.close()
+    h.unlink()
+
+
+def increment_shared(name: str, lock, worker: int, rounds: int):
+    h: SharedHashTable[int] = SharedHashTable.attach(name, lock)
+
+    for n in range(rounds):
+        h.put(f'{worker}-{n}', n)
+
+        with lock:
+            h['total'] += 1
+
+    h.close()
+
+
+def test_shared_hash_table_get_put_update_delete(
+    shared_table: SharedHashTable[int],
+):
+    h = shared_table
+    h.put('first', 1)
+    h.put('second', 2)
+    h.update('first', 10)
+    h['second'] += 5
+    h.put('third', 3)
+    h.delete('third')
+    assert len(h) == 2
+    assert h.get('first') == 10
+    assert h['second'] == 7
+    assert 'third' not in h
+    assert dict(h.items()) == { 'first': 10, 'second': 7 }
+    assert h._counts() == (2, 1)
+    h.put('third', 30)
+    assert h._counts() == (3, 0)
+    assert h._sequence() == 14
+
+    with pytest.raises(KeyError) as e:
+        h.get('fourth')
+
+    assert "Key 'fourth' not found!" in str(e.value)
+
+    with pytest.raises(ValueError) as value_error:
+        h.put('first', 1)
+
+    assert "Key 'first' already exists!" in str(value_error.value)
+
+
+def test_shared_hash_table_attach(shared_table: SharedHashTable[int]):
+    shared_table.put('first', 1)
+    other: SharedHashTable[int] = SharedHashTable.attach(shared_table.name)
+    assert other.get('first') == 1
+    assert other._num_slots == shared_table._num_slots
+    shared_table.put('second', 2)
+    assert other['second'] == 2
+
+    writes: list[tuple[Callable[..., None], tuple]] = [
+        (other.put, ('third', 3)), (other.update, ('first', 3)),
+        (other.delete, ('first',)),
+    ]
+
+    for method, args in writes:
+        with pytest.raises(RuntimeError) as runtime_error:
+            method(*args)
+
+        assert 'Shared hash table is read-only!' in str(runtime_error.value)
+
+    assert dict(other.items()) == { 'first': 1, 'second': 2 }
+    other.close()
+
+    with pytest.raises(ValueError) as value_error:
+        SharedHashTable.attach(shared_table.name, multiprocessing.RLock())
+
+    assert 'was created without a lock!' in str(value_error.value)
+
+
+def test_shared_hash_table_attach_with_lock():
+    lock = multiprocessing.RLock()
+
+    with SharedHashTable[int](10, 8, lock=lock) as h:
+        other: SharedHashTable[int] = SharedHashTable.attach(h.name, lock)
+        other.put('first', 1)
+        h.put('second', 2)
+        assert dict(other.items()) == dict(h.items())
+        other.close()
+        h.unlink()
+
+
+def test_shared_hash_table_bytes_and_float_values():
+    with SharedHashTable(10, 8, bytes, 4) as h:
+        h.put('first', b'ab')
+        h.put('second', b'abcd')
+        assert h['first'] == b'ab'
+        assert h['second'] == b'abcd'
+
+        with pytest.raises(ValueError) as e:
+            h.put('third', b'abcde')
+
+        assert 'Value is longer than 4 bytes!' in str(e.value)
+        h.unlink()
+
+    with SharedHashTable(10, 8, float) as h:
+        h.put('first', 0.5)
+        assert h['first'] == 0.5
+
+        with pytest.raises(TypeError) as e:
+            h.put('second', 1) # type: ignore
+
+        assert "Value must be of type <class 'float'>!" in str(e.value)
+        h.unlink()
+
+
+def test_shared_hash_table_fixed_capacity(shared_table: SharedHashTable[int]):
+    for n in range(100):
+        shared_table.put(f'{n}th', n)
+
+    with pytest.raises(RuntimeError) as e:
+        shared_table.put('101th', 101)
+
+    assert 'Shared hash table is full (100 keys)!' in str(e.value)
+
+    for n in range(100):
+        shared_table.delete(f'{n}th')
+        shared_table.put(f'{n}th', -n)
+
+    assert len(shared_table) == 100
+    assert sum(shared_table.values()) == -sum(range(100))
+
+
+def test_shared_hash_table_churn(shared_table: SharedHashTable[int]):
+    h = shared_table
+    live = [f'{n}th' for n in range(100)]
+
+    for n, key in enumerate(live):
+        h.put(key, n)
+
+    for n in range(100, 5000):
+        index = n % 100
+        h.delete(live[index])
+        live[index] = f'{n}th'
+        h.put(live[index], n)
+        assert h._counts()[1] <= h._num_slots // 4
+
+    states = [
+        h._buf[h._slot_offset(index)] for index in range(h._num_slots)]
+    assert states.count(1) == 100
+    assert states.count(0) >= h._num_slots // 4
+    assert sorted(h.values()) == list(range(4900, 5000))
+    assert all(h[key] == int(key[:-2]) for key in live)
+    assert '99th' not in h
+
+
+@pytest.mark.parametrize('args, error, message', [
+    (('100',), TypeError, 'Capacity must be an integer!'),
+    ((0,), ValueError, 'Capacity must be positive!'),
+    ((10, 0), ValueError, 'Key size must be between 1 and 65535 bytes!'),
+    ((10, 8, str), TypeError, 'Value type must be int, float or bytes!'),
+    ((10, 8, bytes, 0), ValueError, 'Value size must be positive!'),
+])
+def test_shared_hash_table_fail_options(args, error, message):
+    with pytest.raises(error) as e:
+        SharedHashTable(*args)
+
+    assert message in str(e.value)
+
+
+def test_shared_hash_table_fail_keys_values(
+    shared_table: SharedHashTable[int],
+):
+    for key, error, message in [
+        ('', TypeError, 'Key must be a non-empty string!'),
+        (1, TypeError, 'Key must be a non-empty string!'),
+        ('x' * 17, ValueError, 'is longer than 16 bytes!'),
+    ]:
+        with pytest.raises(error) as e:
+            shared_table.put(key, 1) # type: ignore
+
+        assert message in str(e.value)
+
+    with pytest.raises(OverflowError) as e:
+        shared_table.put('first', 2 ** 63)
+
+    assert 'Value must fit in a signed 64-bit integer!' in str(e.value)
+    assert shared_table._sequence() == 0
+
+
+def test_shared_hash_table_across_processes():
+    context = multiprocessing.get_context('spawn')
+    lock = context.RLock()
+    shared_table: SharedHashTable[int] = SharedHashTable(100, 16, lock=lock)
+    shared_table.put('total', 0)
+    workers = [
+        context.Process(
+            target=increment_shared,
+            args=(shared_table.name, lock, worker, 20))
+        for worker in range(4)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    assert shared_table['total'] == 80
+    assert len(shared_table) == 81
+    assert shared_table['3-19'] == 19
+    shared_table.close()
+    shared_table.unlink()
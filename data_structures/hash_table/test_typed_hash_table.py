@@ -0,0 +1,96 @@
+from array import array
+
+import pytest
+
+from . import TypedHashTable
+
+
+def test_typed_hash_table_get_put_update_delete():
+    h: TypedHashTable[int] = TypedHashTable(int, first=1, second=2)
+    assert isinstance(h._values, array)
+    assert h._values.typecode == 'q'
+    h.put('third', 3)
+    h.update('first', 10)
+    h['second'] += 5
+    h.delete('third')
+    assert h.get('first') == 10
+    assert h['second'] == 7
+    assert 'third' not in h
+    assert len(h) == 2
+    assert str(h) == str({ 'first': 10, 'second': 7 })
+
+    with pytest.raises(KeyError) as e:
+        h.get('third')
+
+    assert "Key 'third' not found!" in str(e.value)
+
+
+def test_typed_hash_table_float_column():
+    h: TypedHashTable[float] = TypedHashTable(float)
+    assert h._values.typecode == 'd'
+
+    for n in range(100):
+        h.put(n, n / 2)
+
+    assert sum(h.values()) == sum(n / 2 for n in range(100))
+
+    with pytest.raises(TypeError) as e:
+        h.put(100, 100) # type: ignore
+
+    assert "Value must be of type <class 'float'>!" in str(e.value)
+
+
+def test_typed_hash_table_values_view():
+    h: TypedHashTable[int] = TypedHashTable()
+
+    for n in range(20):
+        h.put(f'{n}th', n)
+
+    for n in range(0, 20, 2):
+        h.delete(f'{n}th')
+
+    view = h.values_view()
+    assert view.format == 'q'
+    assert view.tolist() == list(range(1, 20, 2))
+    assert list(h.keys()) == [f'{n}th' for n in range(1, 20, 2)]
+    h.update('1th', 100)
+    assert view[0] == 100
+
+    with pytest.raises(BufferError):
+        h.put('20th', 20)
+
+    view.release()
+    h.put('20th', 20)
+    assert h.values_view()[-1] == 20
+
+
+def test_typed_hash_table_resize_keeps_column():
+    h: TypedHashTable[int] = TypedHashTable()
+
+    for n in range(1000):
+        h.put(n, n * n)
+
+    for n in range(0, 1000, 3):
+        h.delete(n)
+
+    for n in range(1000, 1500):
+        h.put(n, n * n)
+
+    assert isinstance(h._values, array)
+    assert dict(h.items()) == {
+        n: n * n for n in range(1500) if n >= 1000 or n % 3}
+
+
+@pytest.mark.parametrize('args, kwargs, error, message', [
+    ((str,), {}, TypeError, 'Value type must be int or float!'),
+    ((int,), dict(first='1'), TypeError,
+     "Value must be of type <class 'int'>!"),
+    ((float,), dict(first=1), TypeError,
+     "Value must be of type <class 'float'>!"),
+    ((int,), dict(first=2 ** 63), OverflowError, ''),
+])
+def test_typed_hash_table_fail(args, kwargs, error, message):
+    with pytest.raises(error) as e:
+        TypedHashTable(*args, **kwargs)
+
+    assert message in str(e.value)
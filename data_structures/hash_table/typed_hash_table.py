@@ -0,0 +1,36 @@
+from array import array
+from typing import Dict, Iterable, Type, TypeVar
+
+from .compact_hash_table import CompactHashTable
+
+
+VT = TypeVar('VT', int, float)
+
+TYPECODES: Dict[type, str] = { int: 'q', float: 'd' }
+
+
+class TypedHashTable(CompactHashTable[VT]):
+    _empty_value = 0
+    _values: array
+
+    def __init__(self, value_type: Type[VT] = int, /, **kwargs: VT):
+        if value_type not in TYPECODES:
+            raise TypeError('Value type must be int or float!')
+
+        self._typecode = TYPECODES[value_type]
+        super().__init__()
+        self._data_type = value_type
+
+        for key, value in kwargs.items():
+            self._insert_item(key, value)
+
+
+    def _new_values(self, values: Iterable[VT] = ()) -> array:
+        return array(self._typecode, values)
+
+
+    def values_view(self) -> memoryview:
+        if self._num_entries < len(self._keys):
+            self._resize()
+
+        return memoryview(self._values)
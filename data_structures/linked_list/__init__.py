@@ -1,4 +1,9 @@
+from .doubly_linked_list import DoublyLinkedList
+from .indexable_skip_list import IndexableSkipList
 from .linked_list import LinkedList
+from .unrolled_linked_list import UnrolledLinkedList
 
 
-__all__ = ['LinkedList']
+__all__ = [
+    'DoublyLinkedList', 'IndexableSkipList', 'LinkedList',
+    'UnrolledLinkedList',]
@@ -1,6 +1,7 @@
 import pytest
 
-from . import LinkedList
+from . import (
+    DoublyLinkedList, IndexableSkipList, LinkedList, UnrolledLinkedList,)
 
 
 @pytest.fixture
@@ -20,3 +21,20 @@ def example_linked_list_large() -> LinkedList[str]:
         'first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'seventh',
         'eighth', 'ninth', 'tenth', 'eleventh', 'twelfth',)
 
+
+
+@pytest.fixture
+def example_doubly_linked_list_small() -> DoublyLinkedList[str]:
+    return DoublyLinkedList('first', 'second', 'third')
+
+
+@pytest.fixture
+def example_unrolled_linked_list_medium() -> UnrolledLinkedList[str]:
+    return UnrolledLinkedList(
+        'first', 'second', 'third', 'fourth', 'fifth', 'sixth', chunk_size=4)
+
+
+@pytest.fixture
+def example_indexable_skip_list_medium() -> IndexableSkipList[str]:
+    return IndexableSkipList(
+        'first', 'second', 'third', 'fourth', 'fifth', 'sixth',)
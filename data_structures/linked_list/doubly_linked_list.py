@@ -0,0 +1,246 @@
+from typing import Generic, Iterator, Optional, Type, TypeVar
+
+from ..utils import DoublyLinkedNode
+
+
+DT = TypeVar('DT')
+
+class Node(DoublyLinkedNode[DT]):
+    __slots__ = ('owner',)
+
+    def __init__(self, data: DT, owner: Optional['DoublyLinkedList[DT]']):
+        super().__init__(data)
+        self.owner = owner
+        self.prev: Optional['Node[DT]'] = None
+        self.next: Optional['Node[DT]'] = None
+
+
+class DoublyLinkedList(Generic[DT]):
+    def __init__(self, *args: DT):
+        self._head: Optional[Node[DT]] = None
+        self._tail: Optional[Node[DT]] = None
+        self._size = 0
+
+        if not args:
+            self._data_type = None
+        else:
+            self._data_type = self._check_data_types(*args)
+
+            for data in args:
+                self._link_after(self._tail, data)
+
+
+    def _check_data_types(self, *args: DT) -> Type[DT]:
+        for index, data in enumerate(args):
+            if not isinstance(data, type(args[index - 1])):
+                raise TypeError('All entries must have the same type!')
+
+        return type(args[0])
+
+
+    def _check_data_type(self, data: DT):
+        if not self._data_type:
+            self._data_type = type(data)
+        elif not isinstance(data, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+
+    def _check_handle(self, node: Node[DT]):
+        if not isinstance(node, Node) or node.owner is not self:
+            raise ValueError('Node is not in this doubly linked list!')
+
+
+    def _link_after(self, previous: Optional[Node[DT]], data: DT) -> Node[DT]:
+        node = Node(data, self)
+        node.prev = previous
+
+        if previous:
+            node.next = previous.next
+            previous.next = node
+        else:
+            node.next = self._head
+            self._head = node
+
+        if node.next:
+            node.next.prev = node
+        else:
+            self._tail = node
+
+        self._size += 1
+        return node
+
+
+    def _unlink(self, node: Node[DT]):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+
+        node.prev = node.next = None
+        self._size -= 1
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DoublyLinkedList):
+            return False
+
+        return len(self) == len(other) and \
+            all(first == second for first, second in zip(self, other))
+
+
+    def __iter__(self) -> Iterator[DT]:
+        node = self._head
+
+        while node:
+            yield node.data
+            node = node.next
+
+
+    def __reversed__(self) -> Iterator[DT]:
+        node = self._tail
+
+        while node:
+            yield node.data
+            node = node.prev
+
+
+    def __contains__(self, data: object) -> bool:
+        node = self._head
+
+        while node:
+            if node.data == data:
+                return True
+
+            node = node.next
+
+        return False
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __repr__(self) -> str:
+        return str(list(self))
+
+
+    def append(self, data: DT) -> Node[DT]:
+        self._check_data_type(data)
+        return self._link_after(self._tail, data)
+
+
+    def append_left(self, data: DT) -> Node[DT]:
+        self._check_data_type(data)
+        return self._link_after(None, data)
+
+
+    def insert(self, data: DT, index: int = 0) -> Node[DT]:
+        self._check_data_type(data)
+
+        if not isinstance(index, int):
+            raise TypeError('Index must be an integer!')
+
+        if index < 0:
+            raise IndexError('DoublyLinkedList index out of range!')
+
+        previous = None
+
+        if index >= self._size:
+            previous = self._tail
+        elif index > 0:
+            previous = self._head
+
+            for _ in range(index - 1):
+                previous = previous.next # type: ignore
+
+        return self._link_after(previous, data)
+
+
+    def insert_after(self, node: Node[DT], data: DT) -> Node[DT]:
+        self._check_handle(node)
+        self._check_data_type(data)
+        return self._link_after(node, data)
+
+
+    def find(self, data: DT) -> Node[DT]:
+        node = self._head
+
+        while node:
+            if node.data == data:
+                return node
+
+            node = node.next
+
+        raise ValueError(f"'{data}' is not in doubly linked list!")
+
+
+    def remove(self, node: Node[DT]) -> DT:
+        self._check_handle(node)
+        self._unlink(node)
+        node.owner = None
+        return node.data
+
+
+    def move_to_front(self, node: Node[DT]):
+        self._check_handle(node)
+
+        if node is not self._head:
+            self._unlink(node)
+            node.next = self._head
+            self._head.prev = node # type: ignore
+            self._head = node
+            self._size += 1
+
+
+    def move_to_back(self, node: Node[DT]):
+        self._check_handle(node)
+
+        if node is not self._tail:
+            self._unlink(node)
+            node.prev = self._tail
+            self._tail.next = node # type: ignore
+            self._tail = node
+            self._size += 1
+
+
+    def pop_left(self) -> DT:
+        if not self._head:
+            raise RuntimeError('Doubly linked list is empty!')
+
+        return self.remove(self._head)
+
+
+    def pop_right(self) -> DT:
+        if not self._tail:
+            raise RuntimeError('Doubly linked list is empty!')
+
+        return self.remove(self._tail)
+
+
+    def first(self) -> Node[DT]:
+        if not self._head:
+            raise RuntimeError('Doubly linked list is empty!')
+
+        return self._head
+
+
+    def last(self) -> Node[DT]:
+        if not self._tail:
+            raise RuntimeError('Doubly linked list is empty!')
+
+        return self._tail
+
+
+    def copy(self) -> 'DoublyLinkedList[DT]':
+        l: DoublyLinkedList[DT] = DoublyLinkedList()
+        l._data_type = self._data_type
+
+        for data in self:
+            l._link_after(l._tail, data)
+
+        return l
@@ -0,0 +1,363 @@
+from random import Random
+from typing import (
+    Generic, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar,
+    overload,)
+
+
+DT = TypeVar('DT')
+
+MAX_LEVEL = 32
+
+class SkipNode(Generic[DT]):
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data: DT, height: int):
+        self.data = data
+        self.next: List[Optional['SkipNode[DT]']] = [None] * height
+        self.width: List[int] = [1] * height
+
+    def __repr__(self):
+        return str({
+            'data': self.data,
+            'address': hex(id(self)),
+            'height': len(self.next),
+        })
+
+
+class IndexableSkipList(Generic[DT]):
+    def __init__(self, *args: DT):
+        self._random = Random()
+
+        if not args:
+            self._data_type = None
+        else:
+            self._data_type = self._check_data_types(*args)
+
+        self._build(args)
+
+
+    def _check_data_types(self, *args: DT) -> Type[DT]:
+        for index, data in enumerate(args):
+            if not isinstance(data, type(args[index - 1])):
+                raise TypeError('All entries must have the same type!')
+
+        return type(args[0])
+
+
+    def _check_data_type(self, data: DT):
+        if not self._data_type:
+            self._data_type = type(data)
+        elif not isinstance(data, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+
+    def _random_height(self) -> int:
+        height = 1
+        bits = self._random.getrandbits(MAX_LEVEL - 1)
+
+        while bits & 1:
+            height += 1
+            bits >>= 1
+
+        return height
+
+
+    def _build(self, items: Iterable[DT]):
+        self._head: SkipNode = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        last: List[SkipNode[DT]] = [self._head] * MAX_LEVEL
+        last_positions = [-1] * MAX_LEVEL
+        position = -1
+
+        for position, data in enumerate(items):
+            height = self._random_height()
+            node = SkipNode(data, height)
+
+            for level in range(height):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_positions[level]
+                last[level] = node
+                last_positions[level] = position
+
+            if height > self._level:
+                self._level = height
+
+        self._size = position + 1
+
+        for level in range(self._level):
+            last[level].width[level] = self._size - last_positions[level]
+
+
+    def _predecessors(self, index: int) -> Tuple[List[SkipNode], List[int]]:
+        chain: List[SkipNode] = [self._head] * MAX_LEVEL
+        positions = [-1] * MAX_LEVEL
+        node = self._head
+        position = -1
+
+        for level in reversed(range(self._level)):
+            while position + node.width[level] < index:
+                position += node.width[level]
+                node = node.next[level] # type: ignore
+
+            chain[level] = node
+            positions[level] = position
+
+        return (chain, positions)
+
+
+    def _node_at(self, index: int) -> SkipNode[DT]:
+        node = self._head
+        position = -1
+
+        for level in reversed(range(self._level)):
+            while position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level] # type: ignore
+
+        return node
+
+
+    def _normalize_index(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError('Index must be an integer!')
+
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError('IndexableSkipList index out of range!')
+
+        return index
+
+
+    def _insert_at(self, index: int, data: DT):
+        height = self._random_height()
+
+        if height > self._level:
+            for level in range(self._level, height):
+                self._head.next[level] = None
+                self._head.width[level] = self._size + 1
+
+            self._level = height
+
+        chain, positions = self._predecessors(index)
+        node = SkipNode(data, height)
+
+        for level in range(height):
+            previous = chain[level]
+            offset = index - positions[level]
+            node.next[level] = previous.next[level]
+            node.width[level] = previous.width[level] - offset + 1
+            previous.next[level] = node
+            previous.width[level] = offset
+
+        for level in range(height, self._level):
+            chain[level].width[level] += 1
+
+        self._size += 1
+
+
+    def _remove_at(self, index: int) -> DT:
+        chain, positions = self._predecessors(index)
+        node: SkipNode[DT] = chain[0].next[0] # type: ignore
+
+        for level in range(self._level):
+            previous = chain[level]
+
+            if previous.next[level] is node:
+                previous.next[level] = node.next[level]
+                previous.width[level] += node.width[level] - 1
+            else:
+                previous.width[level] -= 1
+
+        while self._level > 1 and not self._head.next[self._level - 1]:
+            self._level -= 1
+
+        self._size -= 1
+        return node.data
+
+
+    def _index_of(self, data: DT) -> int:
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+
+        raise ValueError(f"'{data}' is not in skip list!")
+
+
+    def _slice(self, indices: slice) -> 'IndexableSkipList[DT]':
+        start, stop, step = indices.indices(self._size)
+        l: IndexableSkipList[DT] = IndexableSkipList()
+        l._data_type = self._data_type
+
+        if step < 0:
+            items = list(self)
+            l._build(items[index] for index in range(start, stop, step))
+            return l
+
+        count = len(range(start, stop, step))
+
+        if not count:
+            return l
+
+        def stepped_items() -> Iterator[DT]:
+            node: Optional[SkipNode[DT]] = self._node_at(start)
+
+            for position in range(start, stop):
+                if (position - start) % step == 0:
+                    yield node.data # type: ignore
+
+                node = node.next[0] # type: ignore
+
+        l._build(stepped_items())
+        return l
+
+
+    def __add__(self, other: object) -> 'IndexableSkipList':
+        if not isinstance(other, (type(self), list, tuple)):
+            raise TypeError(
+                'Unsupported operand type(s) for +:' +
+                f" '{type(self)}' and '{type(other)}'")
+        elif isinstance(other, IndexableSkipList) and self._size and \
+                other._size and self._data_type is not other._data_type:
+            raise TypeError(
+                'Cannot merge skip lists with different data types:' +
+                f" '{self._data_type}' and '{other._data_type}'")
+
+        l = self.copy()
+        l.extend(other)
+        return l
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IndexableSkipList):
+            return False
+
+        return len(self) == len(other) and \
+            all(first == second for first, second in zip(self, other))
+
+
+    @overload
+    def __getitem__(self, index: int) -> DT:
+        ...
+
+
+    @overload
+    def __getitem__(self, index: slice) -> 'IndexableSkipList[DT]':
+        ...
+
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> DT | 'IndexableSkipList[DT]':
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        return self._node_at(self._normalize_index(index)).data
+
+
+    def __setitem__(self, index: int, data: DT):
+        index = self._normalize_index(index)
+        self._check_data_type(data)
+        self._node_at(index).data = data
+
+
+    def __delitem__(self, index: int):
+        self._remove_at(self._normalize_index(index))
+
+
+    def __iter__(self) -> Iterator[DT]:
+        node = self._head.next[0]
+
+        while node:
+            yield node.data
+            node = node.next[0]
+
+
+    def __reversed__(self) -> Iterator[DT]:
+        nodes = list(self)
+
+        while nodes:
+            yield nodes.pop()
+
+
+    def __contains__(self, data: object) -> bool:
+        return any(item == data for item in self)
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __repr__(self) -> str:
+        return str(list(self))
+
+
+    def append(self, data: DT):
+        self._check_data_type(data)
+        self._insert_at(self._size, data)
+
+
+    def copy(self) -> 'IndexableSkipList[DT]':
+        l: IndexableSkipList[DT] = IndexableSkipList()
+        l._data_type = self._data_type
+        l._build(self)
+        return l
+
+
+    def delete(self, data: DT):
+        self._remove_at(self._index_of(data))
+
+
+    def extend(self, items: Iterable[DT]):
+        items = list(items)
+        data_type = self._data_type
+
+        for data in items:
+            if not data_type:
+                data_type = type(data)
+            elif not isinstance(data, data_type):
+                raise TypeError(f"Value must be of type {data_type}!")
+
+        self._data_type = data_type
+
+        for data in items:
+            self._insert_at(self._size, data)
+
+
+    def find(self, data: DT) -> dict[str, DT | str | int]:
+        index = self._index_of(data)
+        node = self._node_at(index)
+        return {
+            'data': node.data,
+            'index': index,
+            'node': hex(id(node)),
+        }
+
+
+    def insert(self, data: DT, index: int = 0):
+        self._check_data_type(data)
+
+        if not isinstance(index, int):
+            raise TypeError('Index must be an integer!')
+
+        if index < 0:
+            raise IndexError('IndexableSkipList index out of range!')
+
+        self._insert_at(min(index, self._size), data)
+
+
+    def pop(self, index: int = -1) -> DT:
+        if not self._size:
+            raise IndexError('Pop from empty skip list!')
+
+        return self._remove_at(self._normalize_index(index))
+
+
+    def reverse(self):
+        self._build(reversed(list(self)))
+
+
+    def update(self, data: DT, value: DT):
+        self._node_at(self._index_of(data)).data = value
@@ -1,4 +1,6 @@
-from typing import Generic, Optional, Type, TypeVar
+from typing import (
+    Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple,
+    Type, TypeVar,)
 
 from ..utils import LinearNode as Node
 
@@ -8,6 +10,8 @@ DT = TypeVar('DT')
 class LinkedList(Generic[DT]):
     def __init__(self, *args: DT):
         self._head: Optional[Node[DT]] = None
+        self._tail: Optional[Node[DT]] = None
+        self._size = 0
 
         if not args:
             self._data_type = None
@@ -27,17 +31,92 @@ class LinkedList(Generic[DT]):
     def _connect_nodes(self, *args: DT):
         if args:
             self._head = Node(args[0])
-            node: Optional[Node[DT]] = self._head
-            counter = 0
-
-            while node:
-                try:
-                    node.next = Node(args[counter + 1])
-                except IndexError:
-                    node.next = None
+            node = self._head
 
+            for data in args[1:]:
+                node.next = Node(data)
                 node = node.next
-                counter += 1
+
+            self._tail = node
+            self._size = len(args)
+
+
+    def _link_tail(self, data: DT):
+        node = Node(data)
+
+        if self._tail:
+            self._tail.next = node
+        else:
+            self._head = node
+
+        self._tail = node
+        self._size += 1
+
+
+    def _merge(
+        self,
+        left: Node[DT],
+        left_tail: Node[DT],
+        right: Node[DT],
+        right_tail: Node[DT],
+        keys: Optional[Dict[int, Any]],
+        reverse: bool,
+    ) -> Tuple[Node[DT], Node[DT]]:
+        first = keys[id(left)] if keys is not None else left.data
+        second = keys[id(right)] if keys is not None else right.data
+        head: Optional[Node[DT]] = None
+        tail: Optional[Node[DT]] = None
+
+        while True:
+            if first < second if reverse else second < first: # type: ignore
+                if tail:
+                    tail.next = right
+                else:
+                    head = right
+
+                tail = right
+                right = right.next # type: ignore
+
+                if not right:
+                    tail.next = left
+                    return (head, left_tail) # type: ignore
+
+                second = keys[id(right)] if keys is not None else right.data
+            else:
+                if tail:
+                    tail.next = left
+                else:
+                    head = left
+
+                tail = left
+                left = left.next # type: ignore
+
+                if not left:
+                    tail.next = right
+                    return (head, right_tail) # type: ignore
+
+                first = keys[id(left)] if keys is not None else left.data
+
+
+    def _nodes(self) -> List[Node[DT]]:
+        nodes = []
+        node = self._head
+
+        while node:
+            nodes.append(node)
+            node = node.next
+
+        return nodes
+
+
+    def _relink(self, nodes: List[Node[DT]]):
+        for node, next in zip(nodes, nodes[1:]):
+            node.next = next
+
+        if nodes:
+            nodes[-1].next = None
+            self._head = nodes[0]
+            self._tail = nodes[-1]
 
 
     def __add__(self, other: object) -> 'LinkedList':
@@ -61,21 +140,9 @@ class LinkedList(Generic[DT]):
                         f" '{type(source_node.data)}'")
 
             l = self.copy()
-            node = l._head
-
-            while node and node.next:
-                node = node.next
-
-            index = 0
 
-            while node:
-                try:
-                    node.next = Node(other[index])
-                except IndexError:
-                    break
-
-                node = node.next
-                index += 1
+            for item in other:
+                l._link_tail(item)
 
             return l
         else:
@@ -92,21 +159,30 @@ class LinkedList(Generic[DT]):
                         f" '{self._data_type}' and '{other._data_type}'")
 
                 l = self.copy()
-                node = l._head
-
-                while node and node.next:
-                    node = node.next
-
                 other_node = other._head
 
-                while node and other_node:
-                    node.next = Node(other_node.data)
-                    node = node.next
+                while other_node:
+                    l._link_tail(other_node.data)
                     other_node = other_node.next
 
                 return l
 
 
+    def __iadd__(self, other: object) -> 'LinkedList':
+        if not isinstance(other, (type(self), list, tuple)):
+            raise TypeError(
+                'Unsupported operand type(s) for +=:' +
+                f" '{type(self)}' and '{type(other)}'")
+        elif isinstance(other, LinkedList) and self._head and other._head \
+                and self._data_type is not other._data_type:
+            raise TypeError(
+                'Cannot merge linked lists with different data types:' +
+                f" '{self._data_type}' and '{other._data_type}'")
+
+        self.extend(other)
+        return self
+
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, LinkedList):
             return False
@@ -127,26 +203,39 @@ class LinkedList(Generic[DT]):
         return True
 
 
-    def __len__(self) -> int:
-        count = 0
+    def __iter__(self) -> Iterator[DT]:
         node = self._head
 
         while node:
-            count += 1
+            yield node.data
             node = node.next
 
-        return count
 
+    def __reversed__(self) -> Iterator[DT]:
+        nodes = list(self)
 
-    def __repr__(self) -> str:
-        nodes: list[DT] = []
+        while nodes:
+            yield nodes.pop()
+
+
+    def __contains__(self, data: object) -> bool:
         node = self._head
 
         while node:
-            nodes.append(node.data)
+            if node.data == data:
+                return True
+
             node = node.next
 
-        return str(nodes)
+        return False
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __repr__(self) -> str:
+        return str(list(self))
 
 
     def append(self, data: DT):
@@ -155,34 +244,17 @@ class LinkedList(Generic[DT]):
         elif not isinstance(data, self._data_type):
             raise TypeError(f"Value must be of type {self._data_type}!")
 
-        previous = None
-        current = self._head
-
-        while current:
-            previous = current
-            current = current.next
-
-        node = Node(data)
-        node.next = current
-
-        if previous:
-            previous.next = node
-        else:
-            self._head = node
+        self._link_tail(data)
 
 
     def copy(self) -> 'LinkedList[DT]':
         l: LinkedList[DT] = LinkedList()
+        l._data_type = self._data_type
         source_node = self._head
 
-        if source_node:
-            l.append(source_node.data)
-            new_node = l._head
-
-            while new_node and source_node.next:
-                new_node.next = Node(source_node.next.data)
-                new_node = new_node.next
-                source_node = source_node.next
+        while source_node:
+            l._link_tail(source_node.data)
+            source_node = source_node.next
 
         return l
 
@@ -199,6 +271,10 @@ class LinkedList(Generic[DT]):
                 else:
                     self._head = current.next
 
+                if current is self._tail:
+                    self._tail = previous
+
+                self._size -= 1
                 del current
                 return
 
@@ -208,6 +284,41 @@ class LinkedList(Generic[DT]):
         raise ValueError(f"'{data}' is not in linked list!")
 
 
+    def extend(self, items: Iterable[DT]):
+        data_type = self._data_type
+        head: Optional[Node[DT]] = None
+        tail: Optional[Node[DT]] = None
+        count = 0
+
+        for data in items:
+            if not data_type:
+                data_type = type(data)
+            elif not isinstance(data, data_type):
+                raise TypeError(f"Value must be of type {data_type}!")
+
+            node = Node(data)
+
+            if tail:
+                tail.next = node
+            else:
+                head = node
+
+            tail = node
+            count += 1
+
+        if not head:
+            return
+
+        if self._tail:
+            self._tail.next = head
+        else:
+            self._head = head
+
+        self._tail = tail
+        self._size += count
+        self._data_type = data_type
+
+
     def find(self, data: DT) -> dict[str, DT | str | int]:
         current = self._head
         counter = 0
@@ -258,10 +369,67 @@ class LinkedList(Generic[DT]):
             else:
                 self._head = node
 
+            if not current:
+                self._tail = node
+
+            self._size += 1
+
+
+    @staticmethod
+    def merge_sorted(
+        first: 'LinkedList[DT]',
+        second: 'LinkedList[DT]',
+        key: Optional[Callable[[DT], Any]] = None,
+        reverse: bool = False,
+    ) -> 'LinkedList[DT]':
+        if not isinstance(first, LinkedList) or \
+                not isinstance(second, LinkedList):
+            raise TypeError('Only linked lists can be merged!')
+        elif first is second:
+            raise ValueError('Cannot merge a linked list with itself!')
+        elif first._head and second._head and \
+                first._data_type is not second._data_type:
+            raise TypeError(
+                'Cannot merge linked lists with different data types:' +
+                f" '{first._data_type}' and '{second._data_type}'")
+
+        l: LinkedList[DT] = LinkedList()
+        l._data_type = first._data_type or second._data_type
+        l._size = first._size + second._size
+
+        if not first._head or not second._head:
+            l._head = first._head or second._head
+            l._tail = first._tail or second._tail
+        else:
+            first_nodes = first._nodes()
+            second_nodes = second._nodes()
+            keys = None
+
+            if key:
+                keys = {
+                    id(node): key(node.data)
+                    for node in first_nodes + second_nodes}
+
+            try:
+                l._head, l._tail = l._merge(
+                    first._head, first._tail, # type: ignore
+                    second._head, second._tail, keys, reverse) # type: ignore
+            except BaseException:
+                first._relink(first_nodes)
+                second._relink(second_nodes)
+                raise
+
+        for source in (first, second):
+            source._head = source._tail = None
+            source._size = 0
+
+        return l
+
 
     def reverse(self):
         previous = None
         current = self._head
+        self._tail = current
 
         while current:
             next = current.next
@@ -272,6 +440,84 @@ class LinkedList(Generic[DT]):
         self._head = previous
 
 
+    def sort(
+        self,
+        key: Optional[Callable[[DT], Any]] = None,
+        reverse: bool = False,
+    ):
+        nodes = self._nodes()
+        keys = None
+
+        if key:
+            keys = { id(node): key(node.data) for node in nodes }
+
+        heads: list[Optional[Node[DT]]] = []
+        tails: list[Optional[Node[DT]]] = []
+
+        try:
+            for node in nodes:
+                node.next = None
+                head, tail = node, node
+                level = 0
+
+                while level < len(heads) and heads[level]:
+                    head, tail = self._merge(
+                        heads[level], tails[level], # type: ignore
+                        head, tail, keys, reverse)
+                    heads[level] = tails[level] = None
+                    level += 1
+
+                if level == len(heads):
+                    heads.append(head)
+                    tails.append(tail)
+                else:
+                    heads[level] = head
+                    tails[level] = tail
+
+            self._head = self._tail = None
+
+            for run_head, run_tail in zip(heads, tails):
+                if not run_head or not run_tail:
+                    continue
+
+                if self._head and self._tail:
+                    self._head, self._tail = self._merge(
+                        run_head, run_tail, self._head, self._tail, keys,
+                        reverse)
+                else:
+                    self._head = run_head
+                    self._tail = run_tail
+        except BaseException:
+            self._relink(nodes)
+            raise
+
+
+    def splice(self, other: 'LinkedList[DT]'):
+        if not isinstance(other, LinkedList):
+            raise TypeError(
+                f"Cannot splice '{type(other)}' into a linked list!")
+        elif other is self:
+            raise ValueError('Cannot splice a linked list into itself!')
+
+        if not other._head:
+            return
+
+        if not self._head:
+            self._head = other._head
+            self._data_type = other._data_type
+        elif self._data_type is not other._data_type:
+            raise TypeError(
+                'Cannot merge linked lists with different data types:' +
+                f" '{self._data_type}' and '{other._data_type}'")
+        else:
+            self._tail.next = other._head # type: ignore
+
+        self._tail = other._tail
+        self._size += other._size
+        other._head = other._tail = None
+        other._size = 0
+
+
     def traverse(self):
         if not self._head:
             return print('No HEAD node.')
@@ -0,0 +1,209 @@
+from pytest import mark, raises, CaptureFixture
+
+from . import DoublyLinkedList
+
+
+def assert_links(l: DoublyLinkedList):
+    forward = []
+    node = l._head
+
+    while node:
+        assert node.owner is l
+        forward.append(node.data)
+        node = node.next
+
+    backward = []
+    node = l._tail
+
+    while node:
+        backward.append(node.data)
+        node = node.prev
+
+    assert forward == backward[::-1]
+    assert len(forward) == len(l)
+
+
+@mark.parametrize('args', [
+    ['first', 'second', 'third'],
+    [1, 2, 3],
+    [(1, 'first'), (2, 'second'), (3, 'third')],
+])
+def test_initialize_doubly_linked_list_success(
+    args: list[str | int | tuple],
+):
+    l = DoublyLinkedList(*args)
+    assert list(l) == args
+    assert_links(l)
+
+
+def test_initialize_doubly_linked_list_fail():
+    with raises(TypeError) as e:
+        DoublyLinkedList('first', 'second', 3)
+
+    assert 'All entries must have the same type!' in str(e.value)
+
+
+def test_doubly_linked_list_repr(
+    capsys: CaptureFixture[str],
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    print(example_doubly_linked_list_small)
+    captured = capsys.readouterr()
+    assert captured.out == "['first', 'second', 'third']\n"
+
+
+def test_doubly_linked_list_reversed(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    assert list(reversed(example_doubly_linked_list_small)) == \
+        ['third', 'second', 'first']
+
+
+def test_doubly_linked_list_append_returns_handles():
+    l: DoublyLinkedList[int] = DoublyLinkedList()
+    one = l.append(1)
+    zero = l.append_left(0)
+    two = l.append(2)
+    assert (zero.data, one.data, two.data) == (0, 1, 2)
+    assert list(l) == [0, 1, 2]
+    assert_links(l)
+
+    with raises(TypeError) as e:
+        l.append('3') # type: ignore
+
+    assert "Value must be of type <class 'int'>!" in str(e.value)
+
+
+@mark.parametrize('index, expected', [
+    (0, ['new', 'first', 'second', 'third']),
+    (1, ['first', 'new', 'second', 'third']),
+    (3, ['first', 'second', 'third', 'new']),
+    (10, ['first', 'second', 'third', 'new']),
+])
+def test_doubly_linked_list_insert(
+    index: int,
+    expected: list[str],
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    node = example_doubly_linked_list_small.insert('new', index)
+    assert node.data == 'new'
+    assert list(example_doubly_linked_list_small) == expected
+    assert_links(example_doubly_linked_list_small)
+
+
+def test_doubly_linked_list_insert_fail(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    with raises(IndexError) as e:
+        example_doubly_linked_list_small.insert('new', -1)
+
+    assert 'DoublyLinkedList index out of range!' in str(e.value)
+
+
+def test_doubly_linked_list_insert_after(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    node = l.insert_after(l.find('first'), 'new')
+    l.insert_after(l.last(), 'fourth')
+    l.insert_after(node, 'newer')
+    assert list(l) == ['first', 'new', 'newer', 'second', 'third', 'fourth']
+    assert_links(l)
+
+
+def test_doubly_linked_list_remove(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    middle = l.find('second')
+    assert l.remove(middle) == 'second'
+    assert middle.owner is None
+    assert list(l) == ['first', 'third']
+    assert_links(l)
+
+    assert l.remove(l.first()) == 'first'
+    assert l.remove(l.last()) == 'third'
+    assert len(l) == 0
+    assert l._head is None and l._tail is None
+
+
+def test_doubly_linked_list_foreign_handle(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    other = DoublyLinkedList('first')
+    node = l.first()
+    l.remove(node)
+
+    for handle in (node, other.first(), 'first'):
+        with raises(ValueError) as e:
+            l.remove(handle) # type: ignore
+
+        assert 'Node is not in this doubly linked list!' in str(e.value)
+
+    assert len(l) == 2
+
+
+def test_doubly_linked_list_move(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    l.move_to_front(l.find('third'))
+    assert list(l) == ['third', 'first', 'second']
+    l.move_to_back(l.find('third'))
+    assert list(l) == ['first', 'second', 'third']
+    l.move_to_front(l.first())
+    l.move_to_back(l.last())
+    assert list(l) == ['first', 'second', 'third']
+    assert len(l) == 3
+    assert_links(l)
+
+
+def test_doubly_linked_list_pop(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    assert l.pop_left() == 'first'
+    assert l.pop_right() == 'third'
+    assert l.pop_right() == 'second'
+
+    for method in (l.pop_left, l.pop_right, l.first, l.last):
+        with raises(RuntimeError) as e:
+            method()
+
+        assert 'Doubly linked list is empty!' in str(e.value)
+
+
+def test_doubly_linked_list_find_fail(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    with raises(ValueError) as e:
+        example_doubly_linked_list_small.find('fourth')
+
+    assert "'fourth' is not in doubly linked list!" in str(e.value)
+
+
+def test_doubly_linked_list_copy_and_eq(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    copied = l.copy()
+    assert copied == l
+    assert copied.first() is not l.first()
+    assert_links(copied)
+
+    copied.pop_left()
+    assert copied != l
+    assert l != list(l)
+
+    with raises(TypeError):
+        copied.append(1) # type: ignore
+
+
+def test_doubly_linked_list_contains(
+    example_doubly_linked_list_small: DoublyLinkedList[str],
+):
+    l = example_doubly_linked_list_small
+    assert 'second' in l
+    l.remove(l.find('second'))
+    assert 'second' not in l
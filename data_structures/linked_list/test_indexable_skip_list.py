@@ -0,0 +1,254 @@
+from pytest import mark, raises, CaptureFixture
+from random import Random
+
+from . import IndexableSkipList
+
+
+def assert_widths(l: IndexableSkipList):
+    positions = { id(l._head): -1 }
+
+    for position, node in enumerate(nodes(l)):
+        positions[id(node)] = position
+
+    for level in range(l._level):
+        node = l._head
+
+        while node:
+            following = node.next[level]
+            end = positions[id(following)] if following else len(l)
+            assert node.width[level] == end - positions[id(node)]
+            node = following
+
+    for level in range(l._level, len(l._head.next)):
+        assert l._head.next[level] is None
+
+
+def nodes(l: IndexableSkipList):
+    node = l._head.next[0]
+
+    while node:
+        yield node
+        node = node.next[0]
+
+
+@mark.parametrize('args', [
+    [],
+    ['first', 'second', 'third'],
+    list(range(100)),
+])
+def test_initialize_indexable_skip_list_success(args: list[str | int]):
+    l = IndexableSkipList(*args)
+    assert list(l) == args
+    assert len(l) == len(args)
+    assert_widths(l)
+
+
+def test_initialize_indexable_skip_list_fail():
+    with raises(TypeError) as e:
+        IndexableSkipList('first', 'second', 3)
+
+    assert 'All entries must have the same type!' in str(e.value)
+
+
+def test_indexable_skip_list_repr(
+    capsys: CaptureFixture[str],
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    print(example_indexable_skip_list_medium)
+    captured = capsys.readouterr()
+    assert captured.out == \
+        "['first', 'second', 'third', 'fourth', 'fifth', 'sixth']\n"
+
+
+def test_indexable_skip_list_getitem(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    assert l[0] == 'first'
+    assert l[3] == 'fourth'
+    assert l[-1] == 'sixth'
+    assert l[-6] == 'first'
+
+    for index in (6, -7):
+        with raises(IndexError) as e:
+            l[index]
+
+        assert 'IndexableSkipList index out of range!' in str(e.value)
+
+    with raises(TypeError) as type_error:
+        l['first'] # type: ignore
+
+    assert 'Index must be an integer!' in str(type_error.value)
+
+
+@mark.parametrize('indices', [
+    slice(None), slice(1, 4), slice(None, None, 2), slice(4, None, -2),
+    slice(-2, None), slice(None, None, -1), slice(3, 1), slice(10, 20),
+])
+def test_indexable_skip_list_slice(
+    indices: slice,
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    expected = list(l)[indices]
+    sliced = l[indices]
+    assert isinstance(sliced, IndexableSkipList)
+    assert list(sliced) == expected
+    assert_widths(sliced)
+
+
+def test_indexable_skip_list_setitem_and_delitem(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    l[1] = 'updated_second'
+    del l[0]
+    del l[-1]
+    assert list(l) == ['updated_second', 'third', 'fourth', 'fifth']
+    assert_widths(l)
+
+    with raises(TypeError) as e:
+        l[0] = 2 # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+
+
+@mark.parametrize('index, expected', [
+    (0, ['new', 'first', 'second', 'third', 'fourth', 'fifth', 'sixth']),
+    (3, ['first', 'second', 'third', 'new', 'fourth', 'fifth', 'sixth']),
+    (6, ['first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'new']),
+    (99, ['first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'new']),
+])
+def test_indexable_skip_list_insert(
+    index: int,
+    expected: list[str],
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    l.insert('new', index)
+    assert list(l) == expected
+    assert_widths(l)
+
+
+def test_indexable_skip_list_insert_fail(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+
+    with raises(TypeError) as e:
+        l.insert(7) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+
+    with raises(TypeError) as e:
+        l.insert('new', 'two') # type: ignore
+
+    assert 'Index must be an integer!' in str(e.value)
+
+    with raises(IndexError) as index_error:
+        l.insert('new', -1)
+
+    assert 'IndexableSkipList index out of range!' in str(index_error.value)
+
+
+def test_indexable_skip_list_pop(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    assert l.pop() == 'sixth'
+    assert l.pop(0) == 'first'
+    assert l.pop(1) == 'third'
+    assert list(l) == ['second', 'fourth', 'fifth']
+    assert_widths(l)
+
+    while l:
+        l.pop()
+
+    with raises(IndexError) as e:
+        l.pop()
+
+    assert 'Pop from empty skip list!' in str(e.value)
+    assert_widths(l)
+
+
+def test_indexable_skip_list_random_operations():
+    random = Random(0)
+    l: IndexableSkipList[int] = IndexableSkipList()
+    l._random = Random(0)
+    expected: list[int] = []
+
+    for n in range(3000):
+        if expected and random.random() < 0.4:
+            index = random.randrange(len(expected))
+            assert l.pop(index) == expected.pop(index)
+        else:
+            index = random.randrange(len(expected) + 1)
+            l.insert(n, index)
+            expected.insert(index, n)
+
+    assert list(l) == expected
+    assert [l[index] for index in range(len(l))] == expected
+    assert_widths(l)
+
+
+def test_indexable_skip_list_find_update_delete(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    result = l.find('third')
+    assert result['data'] == 'third'
+    assert result['index'] == 2
+    l.update('third', 'updated_third')
+    assert l[2] == 'updated_third'
+    l.delete('updated_third')
+    assert 'updated_third' not in l
+    assert 'second' in l
+    assert len(l) == 5
+    assert_widths(l)
+
+    for method in (l.find, l.delete):
+        with raises(ValueError) as e:
+            method('third')
+
+        assert "'third' is not in skip list!" in str(e.value)
+
+
+def test_indexable_skip_list_reverse_copy_and_eq(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    m = l.copy()
+    assert m == l
+    assert m._head is not l._head
+    l.reverse()
+    assert list(l) == list(reversed(m))
+    assert l != m
+    assert l != list(l)
+    assert_widths(l)
+
+
+def test_indexable_skip_list_extend_and_add(
+    example_indexable_skip_list_medium: IndexableSkipList[str],
+):
+    l = example_indexable_skip_list_medium
+    combined = l + IndexableSkipList('seventh') + ['eighth']
+    assert list(combined)[-2:] == ['seventh', 'eighth']
+    assert len(l) == 6
+    assert_widths(combined)
+
+    with raises(TypeError) as e:
+        l.extend(['seventh', 8]) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+    assert len(l) == 6
+
+    with raises(TypeError) as e:
+        l + 'seventh'
+
+    assert 'Unsupported operand type(s) for +:' in str(e.value)
+
+    with raises(TypeError) as e:
+        l + IndexableSkipList(7)
+
+    assert 'Cannot merge skip lists with different data types:' \
+        in str(e.value)
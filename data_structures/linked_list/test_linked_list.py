@@ -1,5 +1,6 @@
 from pytest import mark, raises, CaptureFixture, MonkeyPatch
-from typing import Optional
+from random import Random
+from typing import Any, Callable, Optional, Type
 
 from . import LinkedList
 
@@ -412,3 +413,338 @@ def test_linked_list_eq_ne(example_linked_list_small: LinkedList[str]):
     assert example_linked_list_small == other_1
     assert other_1 != other_2
 
+
+
+def assert_tail_and_size(l: LinkedList):
+    node = l._head
+    last = None
+    count = 0
+
+    while node:
+        last = node
+        node = node.next
+        count += 1
+
+    assert l._tail is last
+    assert l._size == count == len(l)
+
+
+def test_linked_list_tail_and_size(
+    example_linked_list_medium: LinkedList[str],
+):
+    l = example_linked_list_medium
+    assert_tail_and_size(l)
+    l.append('seventh')
+    assert l._tail and l._tail.data == 'seventh'
+    assert_tail_and_size(l)
+    l.insert('eighth', 100)
+    assert l._tail and l._tail.data == 'eighth'
+    l.insert('zero')
+    assert_tail_and_size(l)
+    l.delete('eighth')
+    assert l._tail and l._tail.data == 'seventh'
+    l.delete('zero')
+    assert_tail_and_size(l)
+    l.reverse()
+    assert l._tail and l._tail.data == 'first'
+    assert_tail_and_size(l)
+
+    for data in [
+        'seventh', 'sixth', 'fifth', 'fourth', 'third', 'second', 'first',
+    ]:
+        l.delete(data)
+        assert_tail_and_size(l)
+
+    assert l._head is None and l._tail is None
+    l.append('first')
+    assert l._head is l._tail
+    assert_tail_and_size(l)
+
+
+def test_linked_list_tail_and_size_add_copy(
+    example_linked_list_small: LinkedList[str],
+):
+    l = example_linked_list_small
+
+    for result in [
+        l.copy(), l + ['third', 'fourth'], l + LinkedList('third'),
+        LinkedList() + l, l + [],
+    ]:
+        assert_tail_and_size(result)
+        assert result._tail is not l._tail
+
+    assert_tail_and_size(l)
+    assert len(l) == 2
+
+
+def test_linked_list_append_many():
+    l: LinkedList[int] = LinkedList()
+
+    for n in range(100_000):
+        l.append(n)
+
+    assert len(l) == 100_000
+    assert l._tail and l._tail.data == 99_999
+
+
+def test_linked_list_iter(example_linked_list_medium: LinkedList[str]):
+    l = example_linked_list_medium
+    assert list(l) == \
+        ['first', 'second', 'third', 'fourth', 'fifth', 'sixth']
+    assert list(reversed(l)) == \
+        ['sixth', 'fifth', 'fourth', 'third', 'second', 'first']
+    assert list(zip(l, range(2))) == [('first', 0), ('second', 1)]
+    assert sum(LinkedList(1, 2, 3)) == 6
+    assert list(LinkedList()) == []
+    assert list(reversed(LinkedList())) == []
+
+
+def test_linked_list_contains(example_linked_list_small: LinkedList[str]):
+    l = example_linked_list_small
+    assert 'first' in l
+    assert 'second' in l
+    assert 'third' not in l
+    assert None not in l
+
+
+def assert_contents(l: LinkedList, expected: list):
+    assert list(l) == expected
+    assert_tail_and_size(l)
+
+
+def test_linked_list_extend(example_linked_list_small: LinkedList[str]):
+    l = example_linked_list_small
+    l.extend(['third', 'fourth'])
+    l.extend(data for data in ('fifth',))
+    l.extend([])
+    assert_contents(
+        l, ['first', 'second', 'third', 'fourth', 'fifth'])
+
+    l.extend(l)
+    assert len(l) == 10
+
+    empty: LinkedList[int] = LinkedList()
+    empty.extend(range(3))
+    assert_contents(empty, [0, 1, 2])
+    assert empty._data_type is int
+
+
+def test_linked_list_extend_fail_leaves_list_unchanged(
+    example_linked_list_small: LinkedList[str],
+):
+    l = example_linked_list_small
+
+    with raises(TypeError) as e:
+        l.extend(['third', 4]) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+    assert_contents(l, ['first', 'second'])
+
+
+def test_linked_list_iadd(example_linked_list_small: LinkedList[str]):
+    l = example_linked_list_small
+    original = l
+    other = LinkedList('third')
+    l += other
+    l += ['fourth']
+    l += ('fifth',)
+    assert l is original
+    assert_contents(
+        l, ['first', 'second', 'third', 'fourth', 'fifth'])
+    assert_contents(other, ['third'])
+
+    with raises(TypeError) as e:
+        l += 'sixth'
+
+    assert 'Unsupported operand type(s) for +=:' in str(e.value)
+
+    with raises(TypeError) as e:
+        l += LinkedList(6)
+
+    assert 'Cannot merge linked lists with different data types:' \
+        in str(e.value)
+
+
+def test_linked_list_splice(example_linked_list_small: LinkedList[str]):
+    l = example_linked_list_small
+    other = LinkedList('third', 'fourth')
+    other_head = other._head
+    l.splice(other)
+    assert_contents(l, ['first', 'second', 'third', 'fourth'])
+    assert_contents(other, [])
+    assert l._head and l._head.next and l._head.next.next is other_head
+
+    l.splice(other)
+    assert len(l) == 4
+
+    other.append('fifth')
+    l.splice(other)
+    assert_contents(
+        l, ['first', 'second', 'third', 'fourth', 'fifth'])
+
+    empty: LinkedList[str] = LinkedList()
+    empty.splice(l)
+    assert len(empty) == 5
+    assert empty._data_type is str
+    assert_contents(l, [])
+
+
+def test_linked_list_splice_many():
+    l: LinkedList[int] = LinkedList()
+
+    for shard in range(1000):
+        l.splice(LinkedList(*range(shard * 10, shard * 10 + 10)))
+
+    assert_contents(l, list(range(10000)))
+
+
+def test_linked_list_splice_fail(example_linked_list_small: LinkedList[str]):
+    l = example_linked_list_small
+
+    with raises(TypeError) as e:
+        l.splice(['third']) # type: ignore
+
+    assert "Cannot splice '<class 'list'>' into a linked list!" \
+        in str(e.value)
+
+    with raises(ValueError) as value_error:
+        l.splice(l)
+
+    assert 'Cannot splice a linked list into itself!' in str(value_error.value)
+
+    other = LinkedList(3)
+
+    with raises(TypeError) as e:
+        l.splice(other) # type: ignore
+
+    assert 'Cannot merge linked lists with different data types:' \
+        in str(e.value)
+    assert_contents(l, ['first', 'second'])
+    assert_contents(other, [3])
+
+
+@mark.parametrize('size', [0, 1, 2, 3, 7, 64, 1000])
+def test_linked_list_sort(size: int):
+    random = Random(size)
+    values = [random.randrange(size // 2 + 1) for _ in range(size)]
+    l = LinkedList(*values)
+    nodes = set()
+    node = l._head
+
+    while node:
+        nodes.add(id(node))
+        node = node.next
+
+    l.sort()
+    assert_contents(l, sorted(values))
+    node = l._head
+
+    while node:
+        assert id(node) in nodes
+        node = node.next
+
+    l.sort(reverse=True)
+    assert_contents(l, sorted(values, reverse=True))
+
+
+def test_linked_list_sort_stable():
+    random = Random(0)
+    pairs = [(random.randrange(5), n) for n in range(200)]
+    l = LinkedList(*pairs)
+    l.sort(key=lambda pair: pair[0])
+    assert_contents(l, sorted(pairs, key=lambda pair: pair[0]))
+    l = LinkedList(*pairs)
+    l.sort(key=lambda pair: pair[0], reverse=True)
+    assert_contents(
+        l, sorted(pairs, key=lambda pair: pair[0], reverse=True))
+
+
+def test_linked_list_sort_key(example_linked_list_medium: LinkedList[str]):
+    l = example_linked_list_medium
+    l.sort(key=len)
+    assert_contents(
+        l, ['first', 'third', 'fifth', 'sixth', 'second', 'fourth'])
+
+
+def test_linked_list_sort_key_calls():
+    calls = []
+
+    def key(value: int) -> int:
+        calls.append(value)
+        return -value
+
+    l = LinkedList(*range(50))
+    l.sort(key=key)
+    assert_contents(l, list(reversed(range(50))))
+    assert sorted(calls) == list(range(50))
+
+
+@mark.parametrize('key, error', [
+    (lambda value: 1 // (value - 2), ZeroDivisionError),
+    (lambda value: 'x' if value == 5 else value, TypeError),
+])
+def test_linked_list_sort_fail_keeps_nodes(
+    key: Callable[[int], Any],
+    error: Type[Exception],
+):
+    l = LinkedList(3, 1, 2, 5, 4)
+
+    with raises(error):
+        l.sort(key=key)
+
+    assert_contents(l, [3, 1, 2, 5, 4])
+
+
+def test_linked_list_merge_sorted_fail_keeps_nodes():
+    first = LinkedList(1, 3)
+    second = LinkedList(2, 4)
+
+    with raises(TypeError):
+        LinkedList.merge_sorted(
+            first, second, key=lambda value: 'x' if value == 4 else value)
+
+    assert_contents(first, [1, 3])
+    assert_contents(second, [2, 4])
+
+
+def test_linked_list_merge_sorted():
+    first = LinkedList(1, 3, 5, 7)
+    second = LinkedList(2, 3, 4, 8, 9)
+    second_three = second._head.next
+    merged = LinkedList.merge_sorted(first, second)
+    assert_contents(merged, [1, 2, 3, 3, 4, 5, 7, 8, 9])
+    assert merged._data_type is int
+    assert_contents(first, [])
+    assert_contents(second, [])
+    assert merged._head.next.next.next is second_three
+
+    descending = LinkedList.merge_sorted(
+        LinkedList('ccc', 'a'), LinkedList('bb'), key=len, reverse=True)
+    assert_contents(descending, ['ccc', 'bb', 'a'])
+
+    empty = LinkedList.merge_sorted(LinkedList(), LinkedList('first'))
+    assert_contents(empty, ['first'])
+    assert empty._data_type is str
+
+
+def test_linked_list_merge_sorted_fail(
+    example_linked_list_small: LinkedList[str],
+):
+    l = example_linked_list_small
+
+    with raises(TypeError) as e:
+        LinkedList.merge_sorted(l, ['third']) # type: ignore
+
+    assert 'Only linked lists can be merged!' in str(e.value)
+
+    with raises(ValueError) as value_error:
+        LinkedList.merge_sorted(l, l)
+
+    assert 'Cannot merge a linked list with itself!' in str(value_error.value)
+
+    with raises(TypeError) as e:
+        LinkedList.merge_sorted(l, LinkedList(3)) # type: ignore
+
+    assert 'Cannot merge linked lists with different data types:' \
+        in str(e.value)
+    assert_contents(l, ['first', 'second'])
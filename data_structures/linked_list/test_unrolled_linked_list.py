@@ -0,0 +1,274 @@
+from pytest import mark, raises, CaptureFixture
+from random import Random
+
+from . import UnrolledLinkedList
+
+
+def assert_chunks(l: UnrolledLinkedList):
+    sizes = []
+    chunk = l._head
+
+    while chunk:
+        assert 0 < len(chunk.items) <= l._chunk_size
+        sizes.append(len(chunk.items))
+
+        if not chunk.next:
+            assert chunk is l._tail
+
+        chunk = chunk.next
+
+    assert sum(sizes) == len(l)
+
+    if not sizes:
+        assert l._tail is None
+
+
+@mark.parametrize('args', [
+    ['first', 'second', 'third'],
+    [1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [(1, 'first'), (2, 'second'), (3, 'third')],
+])
+def test_initialize_unrolled_linked_list_success(
+    args: list[str | int | tuple],
+):
+    l = UnrolledLinkedList(*args, chunk_size=2)
+    assert list(l) == args
+    assert_chunks(l)
+
+
+def test_initialize_unrolled_linked_list_fail():
+    with raises(TypeError) as e:
+        UnrolledLinkedList('first', 'second', 3)
+
+    assert 'All entries must have the same type!' in str(e.value)
+
+    with raises(TypeError) as e:
+        UnrolledLinkedList(chunk_size='4') # type: ignore
+
+    assert 'Chunk size must be an integer!' in str(e.value)
+
+    with raises(ValueError) as e:
+        UnrolledLinkedList(chunk_size=1)
+
+    assert 'Chunk size must be at least 2!' in str(e.value)
+
+
+def test_unrolled_linked_list_repr(
+    capsys: CaptureFixture[str],
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    print(example_unrolled_linked_list_medium)
+    captured = capsys.readouterr()
+    assert captured.out == \
+        "['first', 'second', 'third', 'fourth', 'fifth', 'sixth']\n"
+    assert len(example_unrolled_linked_list_medium) == 6
+
+
+def test_unrolled_linked_list_append(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+
+    for data in ['seventh', 'eighth', 'ninth']:
+        l.append(data)
+
+    assert list(l)[-3:] == ['seventh', 'eighth', 'ninth']
+    assert len(l) == 9
+    assert l._head and l._tail
+    assert [len(chunk) for chunk in [l._head.items, l._tail.items]] == [4, 1]
+    assert_chunks(l)
+
+    with raises(TypeError) as e:
+        l.append(10) # type: ignore
+
+    assert "Value must be of type <class 'str'>!" in str(e.value)
+
+
+@mark.parametrize('index, expected', [
+    (0, ['new', 'first', 'second', 'third', 'fourth', 'fifth', 'sixth']),
+    (2, ['first', 'second', 'new', 'third', 'fourth', 'fifth', 'sixth']),
+    (4, ['first', 'second', 'third', 'fourth', 'new', 'fifth', 'sixth']),
+    (6, ['first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'new']),
+    (99, ['first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'new']),
+])
+def test_unrolled_linked_list_insert(
+    index: int,
+    expected: list[str],
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    l.insert('new', index)
+    assert list(l) == expected
+    assert_chunks(l)
+
+
+def test_unrolled_linked_list_insert_splits_chunk(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    l.insert('new', 1)
+    assert l._head and l._head.next
+    assert [len(l._head.items), len(l._head.next.items)] == [2, 3]
+    assert_chunks(l)
+
+
+def test_unrolled_linked_list_insert_fail(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+
+    with raises(TypeError) as type_error:
+        l.insert('new', 'two') # type: ignore
+
+    assert 'Index must be an integer!' in str(type_error.value)
+
+    with raises(IndexError) as index_error:
+        l.insert('new', -1)
+
+    assert 'UnrolledLinkedList index out of range!' in str(index_error.value)
+
+
+def test_unrolled_linked_list_delete_merges_chunks(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    l.delete('second')
+    l.delete('first')
+    assert l._head and l._head.items == ['third', 'fourth']
+    l.delete('third')
+    assert l._head and l._head.items == ['fourth', 'fifth', 'sixth']
+    assert l._head is l._tail
+    l.delete('sixth')
+    l.delete('fourth')
+    l.delete('fifth')
+    assert len(l) == 0
+    assert l._head is None
+    assert_chunks(l)
+
+    with raises(ValueError) as e:
+        l.delete('first')
+
+    assert "'first' is not in unrolled linked list!" in str(e.value)
+
+
+def test_unrolled_linked_list_delete_borrows_from_next():
+    l = UnrolledLinkedList(*range(8), chunk_size=4)
+    l.delete(0)
+    l.delete(1)
+    l.delete(2)
+    assert l._head.items == [3, 4]
+    assert l._tail.items == [5, 6, 7]
+    assert_chunks(l)
+
+
+def test_unrolled_linked_list_random_operations():
+    random = Random(0)
+    l: UnrolledLinkedList[int] = UnrolledLinkedList(chunk_size=8)
+    expected: list[int] = []
+
+    for n in range(2000):
+        if expected and random.random() < 0.4:
+            data = random.choice(expected)
+            expected.remove(data)
+            l.delete(data)
+        else:
+            index = random.randrange(len(expected) + 1)
+            expected.insert(index, n)
+            l.insert(n, index)
+
+    assert list(l) == expected
+    assert_chunks(l)
+
+
+def test_unrolled_linked_list_find_and_update(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    result = l.find('fifth')
+    assert result['data'] == 'fifth'
+    assert result['index'] == 4
+    assert result['node'] == hex(id(l._tail))
+
+    l.update('fifth', 'updated_fifth')
+    assert l.find('updated_fifth')['index'] == 4
+
+    with raises(ValueError) as e:
+        l.find('fifth')
+
+    assert "'fifth' is not in unrolled linked list!" in str(e.value)
+
+
+def test_unrolled_linked_list_reverse(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    l.reverse()
+    assert list(l) == \
+        ['sixth', 'fifth', 'fourth', 'third', 'second', 'first']
+    assert_chunks(l)
+    l.append('zeroth')
+    assert list(l)[-1] == 'zeroth'
+
+
+def test_unrolled_linked_list_copy_and_eq(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    m = l.copy()
+    assert m == l
+    assert m is not l
+    assert m._head is not l._head
+    assert m._head and l._head
+    assert m._head.items is not l._head.items
+    m.append('seventh')
+    assert m != l
+    assert l != list(l)
+
+
+def test_unrolled_linked_list_add_success(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    other = UnrolledLinkedList('seventh', 'eighth', chunk_size=4)
+    empty: UnrolledLinkedList[str] = UnrolledLinkedList()
+    combined = l + other
+    assert len(combined) == 8
+    assert list(combined)[-2:] == ['seventh', 'eighth']
+    assert_chunks(combined)
+    assert list(l + ['seventh']) == list(l) + ['seventh']
+    assert list(empty + ('first',)) == ['first']
+    assert empty + l == l
+    assert l + empty == l
+    assert len(l) == 6
+
+
+def test_unrolled_linked_list_add_fail(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+
+    with raises(TypeError) as e:
+        l + 'seventh'
+
+    assert 'Unsupported operand type(s) for +:' in str(e.value)
+
+    with raises(TypeError) as e:
+        l + ['seventh', 8]
+
+    assert "Appended items must be of type '<class 'str'>'" in str(e.value)
+
+    with raises(TypeError) as e:
+        l + UnrolledLinkedList(7, 8)
+
+    assert 'Cannot merge unrolled linked lists with different data types:' \
+        in str(e.value)
+
+
+def test_unrolled_linked_list_reversed_and_contains(
+    example_unrolled_linked_list_medium: UnrolledLinkedList[str],
+):
+    l = example_unrolled_linked_list_medium
+    assert list(reversed(l)) == \
+        ['sixth', 'fifth', 'fourth', 'third', 'second', 'first']
+    assert 'fifth' in l
+    assert 'seventh' not in l
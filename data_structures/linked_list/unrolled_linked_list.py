@@ -0,0 +1,318 @@
+from typing import Generic, Iterator, List, Optional, Tuple, Type, TypeVar
+
+
+DT = TypeVar('DT')
+
+CHUNK_SIZE = 64
+
+class Chunk(Generic[DT]):
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items: List[DT]):
+        self.items = items
+        self.next: Optional['Chunk[DT]'] = None
+
+    def __repr__(self):
+        return str({
+            'items': self.items,
+            'address': hex(id(self)),
+            'has_next': bool(self.next),
+        })
+
+
+class UnrolledLinkedList(Generic[DT]):
+    def __init__(self, *args: DT, chunk_size: int = CHUNK_SIZE):
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+            raise TypeError('Chunk size must be an integer!')
+        elif chunk_size < 2:
+            raise ValueError('Chunk size must be at least 2!')
+
+        self._chunk_size = chunk_size
+        self._head: Optional[Chunk[DT]] = None
+        self._tail: Optional[Chunk[DT]] = None
+        self._size = 0
+
+        if not args:
+            self._data_type = None
+        else:
+            self._data_type = self._check_data_types(*args)
+            self._extend_tail(args)
+
+
+    def _check_data_types(self, *args: DT) -> Type[DT]:
+        for index, data in enumerate(args):
+            if not isinstance(data, type(args[index - 1])):
+                raise TypeError('All entries must have the same type!')
+
+        return type(args[0])
+
+
+    def _check_data_type(self, data: DT):
+        if not self._data_type:
+            self._data_type = type(data)
+        elif not isinstance(data, self._data_type):
+            raise TypeError(f"Value must be of type {self._data_type}!")
+
+
+    def _link_chunk(self, previous: Optional[Chunk[DT]], items: List[DT]):
+        chunk = Chunk(items)
+
+        if previous:
+            chunk.next = previous.next
+            previous.next = chunk
+        else:
+            chunk.next = self._head
+            self._head = chunk
+
+        if not chunk.next:
+            self._tail = chunk
+
+
+    def _extend_tail(self, items: Tuple[DT, ...] | List[DT]):
+        chunk_size = self._chunk_size
+        start = 0
+
+        if self._tail:
+            start = chunk_size - len(self._tail.items)
+            self._tail.items.extend(items[:start])
+
+        for index in range(start, len(items), chunk_size):
+            self._link_chunk(
+                self._tail, list(items[index:index + chunk_size]))
+
+        self._size += len(items)
+
+
+    def _locate(self, data: DT) -> Tuple[
+        Optional[Chunk[DT]],
+        Optional[Chunk[DT]],
+        int,
+        int,
+    ]:
+        previous = None
+        chunk = self._head
+        counter = 0
+
+        while chunk:
+            items = chunk.items
+
+            if data in items:
+                offset = items.index(data)
+                return (previous, chunk, offset, counter + offset)
+
+            counter += len(items)
+            previous = chunk
+            chunk = chunk.next
+
+        raise ValueError(f"'{data}' is not in unrolled linked list!")
+
+
+    def _rebalance(self, previous: Optional[Chunk[DT]], chunk: Chunk[DT]):
+        following = chunk.next
+
+        if not chunk.items:
+            if previous:
+                previous.next = following
+            else:
+                self._head = following
+
+            if chunk is self._tail:
+                self._tail = previous
+
+            return
+
+        if not following or len(chunk.items) >= self._chunk_size // 2:
+            return
+
+        if len(chunk.items) + len(following.items) <= self._chunk_size:
+            chunk.items.extend(following.items)
+            chunk.next = following.next
+
+            if following is self._tail:
+                self._tail = chunk
+        else:
+            needed = self._chunk_size // 2 - len(chunk.items)
+            chunk.items.extend(following.items[:needed])
+            del following.items[:needed]
+
+
+    def __add__(self, other: object) -> 'UnrolledLinkedList':
+        if not isinstance(other, (type(self), list, tuple)):
+            raise TypeError(
+                'Unsupported operand type(s) for +:' +
+                f" '{type(self)}' and '{type(other)}'")
+        elif isinstance(other, (list, tuple)):
+            if not other:
+                return self.copy()
+
+            if not self._head:
+                return UnrolledLinkedList(
+                    *other, chunk_size=self._chunk_size)
+
+            for item in other:
+                if type(item) != self._data_type:
+                    raise TypeError(
+                        'Appended items must be of type' +
+                        f" '{self._data_type}'")
+
+            l = self.copy()
+            l._extend_tail(other)
+            return l
+        else:
+            if self._head and not other._head:
+                return self.copy()
+            elif not self._head and other._head:
+                return other.copy()
+            elif not self._head and not other._head:
+                return UnrolledLinkedList(chunk_size=self._chunk_size)
+            else:
+                if self._data_type is not other._data_type:
+                    raise TypeError(
+                        'Cannot merge unrolled linked lists with different' +
+                        f" data types: '{self._data_type}' and" +
+                        f" '{other._data_type}'")
+
+                l = self.copy()
+                other_chunk = other._head
+
+                while other_chunk:
+                    l._extend_tail(other_chunk.items)
+                    other_chunk = other_chunk.next
+
+                return l
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UnrolledLinkedList):
+            return False
+
+        return len(self) == len(other) and \
+            all(first == second for first, second in zip(self, other))
+
+
+    def __iter__(self) -> Iterator[DT]:
+        chunk = self._head
+
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
+
+
+    def __reversed__(self) -> Iterator[DT]:
+        chunks = []
+        chunk = self._head
+
+        while chunk:
+            chunks.append(chunk)
+            chunk = chunk.next
+
+        while chunks:
+            yield from reversed(chunks.pop().items)
+
+
+    def __contains__(self, data: object) -> bool:
+        chunk = self._head
+
+        while chunk:
+            if data in chunk.items:
+                return True
+
+            chunk = chunk.next
+
+        return False
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __repr__(self) -> str:
+        return str(list(self))
+
+
+    def append(self, data: DT):
+        self._check_data_type(data)
+
+        if self._tail and len(self._tail.items) < self._chunk_size:
+            self._tail.items.append(data)
+        else:
+            self._link_chunk(self._tail, [data])
+
+        self._size += 1
+
+
+    def copy(self) -> 'UnrolledLinkedList[DT]':
+        l: UnrolledLinkedList[DT] = \
+            UnrolledLinkedList(chunk_size=self._chunk_size)
+        l._data_type = self._data_type
+        chunk = self._head
+
+        while chunk:
+            l._link_chunk(l._tail, chunk.items.copy())
+            chunk = chunk.next
+
+        l._size = self._size
+        return l
+
+
+    def delete(self, data: DT):
+        previous, chunk, offset, index = self._locate(data)
+        del chunk.items[offset] # type: ignore
+        self._size -= 1
+        self._rebalance(previous, chunk) # type: ignore
+
+
+    def find(self, data: DT) -> dict[str, DT | str | int]:
+        previous, chunk, offset, index = self._locate(data)
+        return {
+            'data': chunk.items[offset], # type: ignore
+            'index': index,
+            'node': hex(id(chunk)),
+        }
+
+
+    def insert(self, data: DT, index: int = 0):
+        self._check_data_type(data)
+
+        if not isinstance(index, int):
+            raise TypeError('Index must be an integer!')
+
+        if index < 0:
+            raise IndexError('UnrolledLinkedList index out of range!')
+
+        if index >= self._size:
+            return self.append(data)
+
+        chunk: Chunk[DT] = self._head # type: ignore
+
+        while index > len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.next # type: ignore
+
+        chunk.items.insert(index, data)
+        self._size += 1
+
+        if len(chunk.items) > self._chunk_size:
+            half = len(chunk.items) // 2
+            self._link_chunk(chunk, chunk.items[half:])
+            del chunk.items[half:]
+
+
+    def reverse(self):
+        previous = None
+        current = self._head
+        self._tail = current
+
+        while current:
+            current.items.reverse()
+            next = current.next
+            current.next = previous
+            previous = current
+            current = next
+
+        self._head = previous
+
+
+    def update(self, data: DT, value: DT):
+        previous, chunk, offset, index = self._locate(data)
+        chunk.items[offset] = value # type: ignore
@@ -167,3 +167,23 @@ def test_queue_copy_success(example_queue_small: Queue[str]):
     assert q._rear and q._rear.next is None
     assert r._rear and r._rear.next is None
 
+
+
+def test_queue_iter(example_queue_medium: Queue[str]):
+    q = example_queue_medium
+    assert list(q) == \
+        ['first', 'second', 'third', 'fourth', 'fifth', 'sixth']
+    assert list(reversed(q)) == \
+        ['sixth', 'fifth', 'fourth', 'third', 'second', 'first']
+    assert sum(len(data) for data in q) == 32
+    assert list(Queue()) == []
+    assert list(reversed(Queue())) == []
+
+
+def test_queue_contains(example_queue_small: Queue[str]):
+    q = example_queue_small
+    assert 'first' in q
+    assert 'second' in q
+    assert 'third' not in q
+    q.dequeue()
+    assert 'first' not in q
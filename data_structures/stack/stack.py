@@ -1,4 +1,4 @@
-from typing import Generic, Optional, Type, TypeVar
+from typing import Generic, Iterator, Optional, Type, TypeVar
 
 from ..utils import LinearNode as Node
 
@@ -51,15 +51,35 @@ class Stack(Generic[DT]):
         return count
 
 
-    def __repr__(self) -> str:
-        nodes: list[DT] = []
+    def __iter__(self) -> Iterator[DT]:
+        node = self._top
+
+        while node:
+            yield node.data
+            node = node.next
+
+
+    def __reversed__(self) -> Iterator[DT]:
+        nodes = list(self)
+
+        while nodes:
+            yield nodes.pop()
+
+
+    def __contains__(self, data: object) -> bool:
         node = self._top
 
         while node:
-            nodes.insert(0, node.data)
+            if node.data == data:
+                return True
+
             node = node.next
 
-        return str(nodes)
+        return False
+
+
+    def __repr__(self) -> str:
+        return str(list(reversed(self)))
 
 
     def copy(self) -> 'Stack[DT]':
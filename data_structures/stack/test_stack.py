@@ -120,3 +120,28 @@ def test_stack_copy_success(example_stack_small: Stack[str]):
     assert s._top is not t._top
     assert s._top and t._top and s._top.next is not t._top.next
 
+
+
+def test_stack_iter(example_stack_medium: Stack[str]):
+    s = example_stack_medium
+    assert list(s) == \
+        ['sixth', 'fifth', 'fourth', 'third', 'second', 'first']
+    assert list(reversed(s)) == \
+        ['first', 'second', 'third', 'fourth', 'fifth', 'sixth']
+    assert sorted(s)[0] == 'fifth'
+    assert list(Stack()) == []
+    assert list(reversed(Stack())) == []
+
+
+def test_stack_iter_matches_pop_order(example_stack_medium: Stack[str]):
+    s = example_stack_medium
+    expected = list(s)
+    assert [s.pop() for _ in range(len(expected))] == expected
+
+
+def test_stack_contains(example_stack_small: Stack[str]):
+    s = example_stack_small
+    assert 'first' in s
+    assert 'second' in s
+    assert 'third' not in s
+    assert 1 not in s
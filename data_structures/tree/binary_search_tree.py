@@ -1,13 +1,15 @@
 from math import ceil, floor
 from typing import Generic, Optional, Type, TypeVar
 
-from ..utils import BinaryTreeNode
+from ..utils import BloomFilter
 
 
 VT = TypeVar('VT')
 
 
-class BSTData(Generic[VT]):
+class Node(Generic[VT]):
+    __slots__ = ('key', 'value', 'left', 'right')
+
     def __init__(
         self,
         key: bytes | float | int | str,
@@ -15,21 +17,18 @@ class BSTData(Generic[VT]):
     ):
         self.key = key
         self.value = value
-
-    def __repr__(self) -> str:
-        return str({ 'key': self.key, 'value': self.value })
-
-
-class Node(Generic[VT], BinaryTreeNode[BSTData]):
-    def __init__(
-        self,
-        key: bytes | float | int | str,
-        value: Optional[VT] = None,
-    ):
-        self.data = BSTData(key, value)
         self.left: Optional['Node[VT]'] = None
         self.right: Optional['Node[VT]'] = None
 
+    def __repr__(self):
+        return str({
+            'key': self.key,
+            'value': self.value,
+            'address': hex(id(self)),
+            'has_left': bool(self.left),
+            'has_right': bool(self.right),
+        })
+
 
 class BinarySearchTree(Generic[VT]):
     def __init__(
@@ -38,6 +37,7 @@ class BinarySearchTree(Generic[VT]):
         **kwargs
     ):
         self.__root: Optional[Node[VT]] = None
+        self.__bloom: Optional[BloomFilter] = None
 
         if not args:
             self.__key_type = None
@@ -149,21 +149,35 @@ class BinarySearchTree(Generic[VT]):
         return True
 
 
+    def __add_to_bloom(self, key: bytes | float | int | str):
+        if self.__bloom is None:
+            return
+
+        if len(self.__bloom) >= self.__bloom.capacity:
+            self.rebuild_bloom_filter()
+        else:
+            self.__bloom.add_hash(hash(key))
+
+
     def __getitem__(self, key) -> Optional[VT]:
         if not self.__key_type:
             raise RuntimeError('Key type not defined!')
         elif not isinstance(key, self.__key_type):
             raise TypeError(f"Key must be of type {self.__key_type}!")
 
-        current = self.__root
+        if self.__bloom is not None and \
+                not self.__bloom.contains_hash(hash(key)):
+            current = None
+        else:
+            current = self.__root
 
         while current:
-            if key == current.data.key:
-                return current.data.value
+            if key == current.key:
+                return current.value
 
-            if key < current.data.key: # type: ignore
+            if key < current.key: # type: ignore
                 current = current.left
-            elif key > current.data.key: # type: ignore
+            elif key > current.key: # type: ignore
                 current = current.right
 
         error_key = key
@@ -191,23 +205,26 @@ class BinarySearchTree(Generic[VT]):
                 self.__value_type = type(value)
 
             self.__root = Node(key, value)
+            self.__add_to_bloom(key)
             return
 
         current = self.__root
 
         while current:
-            if key == current.data.key:
-                current.data.value = value
+            if key == current.key:
+                current.value = value
                 return
-            elif key < current.data.key: # type: ignore
+            elif key < current.key: # type: ignore
                 if not current.left:
                     current.left = Node(key, value)
+                    self.__add_to_bloom(key)
                     return
                 else:
                     current = current.left
-            elif key > current.data.key: # type: ignore
+            elif key > current.key: # type: ignore
                 if not current.right:
                     current.right = Node(key, value)
+                    self.__add_to_bloom(key)
                     return
                 else:
                     current = current.right
@@ -224,7 +241,7 @@ class BinarySearchTree(Generic[VT]):
         parent: Optional[Node[VT]] = None
 
         while current:
-            if key == current.data.key:
+            if key == current.key:
                 if current.left and current.right:
                     successor_parent = current        
                     successor = current.right
@@ -238,8 +255,8 @@ class BinarySearchTree(Generic[VT]):
                     else:
                         successor_parent.right = successor.right
 
-                    current.data.key = successor.data.key
-                    current.data.value = successor.data.value
+                    current.key = successor.key
+                    current.value = successor.value
                     return
 
                 temp = None
@@ -257,10 +274,10 @@ class BinarySearchTree(Generic[VT]):
                 else:
                     self.__root = temp
                 return
-            elif key < current.data.key: # type: ignore
+            elif key < current.key: # type: ignore
                 parent = current
                 current = current.left
-            elif key > current.data.key: # type: ignore
+            elif key > current.key: # type: ignore
                 parent = current
                 current = current.right
 
@@ -307,7 +324,7 @@ class BinarySearchTree(Generic[VT]):
             item = queue.pop(0)
 
             node_copy: Node[VT] = \
-                Node(item.node.data.key, item.node.data.value)
+                Node(item.node.key, item.node.value)
 
             if item.parent_copy:
                 if item.position is False:
@@ -352,6 +369,35 @@ class BinarySearchTree(Generic[VT]):
         return height
 
 
+    def enable_bloom_filter(self, error_rate: float = 0.01):
+        keys: list[bytes | float | int | str] = []
+        stack: list[Node[VT]] = [self.__root] if self.__root else []
+
+        while stack:
+            current = stack.pop()
+            keys.append(current.key)
+
+            if current.left:
+                stack.append(current.left)
+
+            if current.right:
+                stack.append(current.right)
+
+        self.__bloom = BloomFilter(max(len(keys) * 2, 64), error_rate)
+
+        for key in keys:
+            self.__bloom.add_hash(hash(key))
+
+
+    def disable_bloom_filter(self):
+        self.__bloom = None
+
+
+    def rebuild_bloom_filter(self):
+        if self.__bloom is not None:
+            self.enable_bloom_filter(self.__bloom.error_rate)
+
+
     def get(self, key) -> Optional[VT]:
         return self.__getitem__(key)
 
@@ -375,7 +421,7 @@ class BinarySearchTree(Generic[VT]):
 
         while queue:
             current = queue.pop(0)
-            nodes.append((current.data.key, current.data.value))
+            nodes.append((current.key, current.value))
 
             if current.left:
                 queue.append(current.left)
@@ -394,7 +440,7 @@ class BinarySearchTree(Generic[VT]):
             nodes: list[tuple[bytes | float | int | str, Optional[VT]]],
         ):
             if root:
-                nodes.append((root.data.key, root.data.value))
+                nodes.append((root.key, root.value))
                 traverse(root.left, nodes)
                 traverse(root.right, nodes)
 
@@ -412,7 +458,7 @@ class BinarySearchTree(Generic[VT]):
         ):
             if root:
                 traverse(root.left, nodes)
-                nodes.append((root.data.key, root.data.value))
+                nodes.append((root.key, root.value))
                 traverse(root.right, nodes)
 
             return nodes
@@ -430,7 +476,7 @@ class BinarySearchTree(Generic[VT]):
             if root:
                 traverse(root.left, nodes)
                 traverse(root.right, nodes)
-                nodes.append((root.data.key, root.data.value))
+                nodes.append((root.key, root.value))
 
             return nodes
 
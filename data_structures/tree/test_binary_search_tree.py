@@ -202,11 +202,11 @@ def test_bst_copy(
         assert copy._BinarySearchTree__root is not ( # type: ignore
             tree._BinarySearchTree__root # type: ignore
         )
-        assert copy._BinarySearchTree__root.data.key == ( # type: ignore
-            tree._BinarySearchTree__root.data.key # type: ignore
+        assert copy._BinarySearchTree__root.key == ( # type: ignore
+            tree._BinarySearchTree__root.key # type: ignore
         )
-        assert copy._BinarySearchTree__root.data.value == ( # type: ignore
-            tree._BinarySearchTree__root.data.value # type: ignore
+        assert copy._BinarySearchTree__root.value == ( # type: ignore
+            tree._BinarySearchTree__root.value # type: ignore
         )
         assert copy.traverse_level_order() == tree.traverse_level_order()
         assert copy.traverse_pre_order() == tree.traverse_pre_order()
@@ -279,14 +279,14 @@ def test_bst_put_success_empty():
     t.put('1', 'first')
     assert t.get('1') == 'first'
     assert t._BinarySearchTree__root is not None
-    assert t._BinarySearchTree__root.data.key == '1'
-    assert t._BinarySearchTree__root.data.value == 'first'
+    assert t._BinarySearchTree__root.key == '1'
+    assert t._BinarySearchTree__root.value == 'first'
     assert str(t._BinarySearchTree__key_type) == "<class 'str'>"
     assert str(t._BinarySearchTree__value_type) == "<class 'str'>"
     t['2'] = 'second'
     assert t.get('2') == 'second'
-    assert t._BinarySearchTree__root.right.data.key == '2'
-    assert t._BinarySearchTree__root.right.data.value == 'second'
+    assert t._BinarySearchTree__root.right.key == '2'
+    assert t._BinarySearchTree__root.right.value == 'second'
 
 
 def test_bst_put_fail_invalid_key(example_perfect_bst_small: BST[str]):
@@ -314,7 +314,7 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
     t = example_perfect_bst_large
 
     assert t.get(2) == 'second'
-    assert t._BinarySearchTree__root.left.left.data.key == 2 # type: ignore
+    assert t._BinarySearchTree__root.left.left.key == 2 # type: ignore
     t.remove(2)
     with raises(KeyError) as e:
         t.get(2)
@@ -324,7 +324,7 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (7, 'seventh'), (8, 'eighth'), (9, 'ninth'), (10, 'tenth'),
         (11, 'eleventh'), (12, 'twelfth'), (13, 'thirteenth'),
         (14, 'fourteenth'), (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.left.left.data.key == 3 # type: ignore
+    assert t._BinarySearchTree__root.left.left.key == 3 # type: ignore
 
     assert t.get(3) == 'third'
     t.remove(3)
@@ -336,7 +336,7 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (7, 'seventh'), (8, 'eighth'), (9, 'ninth'), (10, 'tenth'),
         (11, 'eleventh'), (12, 'twelfth'), (13, 'thirteenth'),
         (14, 'fourteenth'), (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.left.left.data.key == 1 # type: ignore
+    assert t._BinarySearchTree__root.left.left.key == 1 # type: ignore
 
     assert t.get(1) == 'first'
     t.remove(1)
@@ -348,7 +348,7 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (8, 'eighth'), (9, 'ninth'), (10, 'tenth'), (11, 'eleventh'),
         (12, 'twelfth'), (13, 'thirteenth'), (14, 'fourteenth'),
         (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.left.data.key == 4 # type: ignore
+    assert t._BinarySearchTree__root.left.key == 4 # type: ignore
     assert t._BinarySearchTree__root.left.left is None # type: ignore
 
     assert t.get(4) == 'fourth'
@@ -360,13 +360,13 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (5, 'fifth'), (6, 'sixth'), (7, 'seventh'), (8, 'eighth'),
         (9, 'ninth'), (10, 'tenth'), (11, 'eleventh'), (12, 'twelfth'),
         (13, 'thirteenth'), (14, 'fourteenth'), (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.left.data.key == 6 # type: ignore
-    assert t._BinarySearchTree__root.left.left.data.key == 5 # type: ignore
+    assert t._BinarySearchTree__root.left.key == 6 # type: ignore
+    assert t._BinarySearchTree__root.left.left.key == 5 # type: ignore
 
     assert t.get(8) == 'eighth'
-    assert t._BinarySearchTree__root.data.key == 8 # type: ignore
+    assert t._BinarySearchTree__root.key == 8 # type: ignore
     assert \
-        t._BinarySearchTree__root.right.left.left.data.key == 9 # type: ignore
+        t._BinarySearchTree__root.right.left.left.key == 9 # type: ignore
     del t[8]
     with raises(KeyError) as e:
         t.get(8)
@@ -375,19 +375,19 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (5, 'fifth'), (6, 'sixth'), (7, 'seventh'), (9, 'ninth'),
         (10, 'tenth'), (11, 'eleventh'), (12, 'twelfth'), (13, 'thirteenth'),
         (14, 'fourteenth'), (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.data.key == 9 # type: ignore
-    assert t._BinarySearchTree__root.left.data.key == 6 # type: ignore
-    assert t._BinarySearchTree__root.right.left.data.key == 10 # type: ignore
+    assert t._BinarySearchTree__root.key == 9 # type: ignore
+    assert t._BinarySearchTree__root.left.key == 6 # type: ignore
+    assert t._BinarySearchTree__root.right.left.key == 10 # type: ignore
     assert \
-        t._BinarySearchTree__root.right.left.right.data.key == ( # type: ignore
+        t._BinarySearchTree__root.right.left.right.key == ( # type: ignore
             11
         )
     assert t._BinarySearchTree__root.right.left.left is None # type: ignore
 
     assert t.get(12) == 'twelfth'
-    assert t._BinarySearchTree__root.right.data.key == 12 # type: ignore
+    assert t._BinarySearchTree__root.right.key == 12 # type: ignore
     assert \
-        t._BinarySearchTree__root.right.right.left.data.key == ( # type: ignore
+        t._BinarySearchTree__root.right.right.left.key == ( # type: ignore
             13
         )
     del t[12]
@@ -398,9 +398,9 @@ def test_bst_remove_success(example_perfect_bst_large: BST[str]):
         (5, 'fifth'), (6, 'sixth'), (7, 'seventh'), (9, 'ninth'),
         (10, 'tenth'), (11, 'eleventh'), (13, 'thirteenth'),
         (14, 'fourteenth'), (15, 'fifteenth'),]
-    assert t._BinarySearchTree__root.data.key == 9 # type: ignore
-    assert t._BinarySearchTree__root.right.data.key == 13 # type: ignore
-    assert t._BinarySearchTree__root.right.right.data.key == 14 # type: ignore
+    assert t._BinarySearchTree__root.key == 9 # type: ignore
+    assert t._BinarySearchTree__root.right.key == 13 # type: ignore
+    assert t._BinarySearchTree__root.right.right.key == 14 # type: ignore
     assert t._BinarySearchTree__root.right.right.left is None # type: ignore
 
 
@@ -424,3 +424,46 @@ def test_bst_remove_fail_keyerror(example_perfect_bst_small: BST[str]):
 
     assert 'Key 4 not found!' in str(e.value)
 
+
+
+def test_bst_bloom_filter(example_perfect_bst_large: BST[str]):
+    bst = example_perfect_bst_large
+    bst.enable_bloom_filter()
+
+    for key in range(16, 1000):
+        with raises(KeyError) as e:
+            bst.get(key)
+
+        assert f'Key {key} not found!' in str(e.value)
+
+    assert bst.get(8) == 'eighth'
+    bst.put(16, 'sixteenth')
+    assert bst.get(16) == 'sixteenth'
+
+    for key in range(17, 200):
+        bst.put(key, f'{key}th')
+
+    assert bst._BinarySearchTree__bloom.capacity >= 199 # type: ignore
+    assert all(bst.get(key) == f'{key}th' for key in range(17, 200))
+
+    for key in range(17, 200):
+        bst.remove(key)
+
+    bst.rebuild_bloom_filter()
+    assert len(bst._BinarySearchTree__bloom) == 16 # type: ignore
+    bst.disable_bloom_filter()
+    assert bst._BinarySearchTree__bloom is None # type: ignore
+
+
+def test_bst_bloom_filter_sorted_inserts():
+    bst: BST[str] = BST()
+    bst.enable_bloom_filter()
+
+    for key in range(1500):
+        bst.put(key, f'{key}th')
+
+    assert bst._BinarySearchTree__bloom.capacity >= 1500 # type: ignore
+    assert bst.get(1499) == '1499th'
+
+    with raises(KeyError):
+        bst.get(1500)
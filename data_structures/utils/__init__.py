@@ -1,5 +1,7 @@
+from .bloom_filter import BloomFilter
+from .hashing import hash_fingerprint, hash_key, stable_hash
 from .infinite_string import InfiniteString
-from .nodes import LinearNode, BinaryTreeNode
+from .nodes import LinearNode, DoublyLinkedNode, BinaryTreeNode
 from .prime_numbers import is_prime, next_prime
 
 
@@ -19,6 +21,7 @@ def flatten(items: list):
 
 
 __all__ = [
-    'LinearNode', 'BinaryTreeNode',
+    'BloomFilter', 'LinearNode', 'DoublyLinkedNode', 'BinaryTreeNode',
     'INF_NUM', 'INF_STR',
-    'flatten', 'is_prime', 'next_prime',]
+    'flatten', 'hash_fingerprint', 'hash_key', 'is_prime', 'next_prime',
+    'stable_hash',]
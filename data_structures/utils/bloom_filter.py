@@ -0,0 +1,99 @@
+from math import ceil, exp, log
+from typing import Hashable, Iterable
+
+from .hashing import hash_key
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _mix_64(key_hash: int) -> int:
+    key_hash &= MASK_64
+    key_hash = ((key_hash ^ (key_hash >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    key_hash = ((key_hash ^ (key_hash >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return key_hash ^ (key_hash >> 31)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError('Capacity must be an integer!')
+        elif capacity < 1:
+            raise ValueError('Capacity must be positive!')
+
+        if not 0 < error_rate < 1:
+            raise ValueError('Error rate must be between 0 and 1!')
+
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._num_bits = \
+            max(ceil(-capacity * log(error_rate) / log(2) ** 2), 8)
+        self._num_hashes = max(round(self._num_bits / capacity * log(2)), 1)
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+
+    def _bit_indices(self, key_hash: int) -> Iterable[int]:
+        mixed = _mix_64(key_hash)
+        first = mixed & 0xFFFFFFFF
+        second = (mixed >> 32) | 1
+        num_bits = self._num_bits
+
+        for n in range(self._num_hashes):
+            yield (first + n * second) % num_bits
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.contains_hash(hash_key(key))
+
+
+    def __len__(self) -> int:
+        return self._count
+
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+
+    @property
+    def error_rate(self) -> float:
+        return self._error_rate
+
+
+    def add(self, key: Hashable):
+        self.add_hash(hash_key(key))
+
+
+    def add_hash(self, key_hash: int):
+        bits = self._bits
+
+        for index in self._bit_indices(key_hash):
+            bits[index >> 3] |= 1 << (index & 7)
+
+        self._count += 1
+
+
+    def contains_hash(self, key_hash: int) -> bool:
+        bits = self._bits
+
+        for index in self._bit_indices(key_hash):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+
+        return True
+
+
+    def update(self, keys: Iterable[Hashable]):
+        for key in keys:
+            self.add(key)
+
+
+    def clear(self):
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+
+    def false_positive_rate(self) -> float:
+        return (1 - exp(-self._num_hashes * self._count / self._num_bits)) \
+            ** self._num_hashes
@@ -0,0 +1,27 @@
+from hashlib import blake2b
+from sys import hash_info
+from typing import Hashable
+
+
+HASH_MODULUS = hash_info.modulus
+
+
+def hash_key(key: Hashable) -> int:
+    if type(key) is int and 0 <= key < HASH_MODULUS: # type: ignore
+        return key # type: ignore
+
+    if isinstance(key, str) and not key:
+        raise TypeError('Key must be a non-empty string!')
+
+    try:
+        return hash(key)
+    except TypeError:
+        raise TypeError('Key must be hashable!')
+
+
+def hash_fingerprint() -> int:
+    return hash('simpledsa')
+
+
+def stable_hash(data: bytes) -> int:
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little')
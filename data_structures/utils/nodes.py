@@ -4,6 +4,8 @@ from typing import Generic, Optional, TypeVar
 DT = TypeVar('DT')
 
 class LinearNode(Generic[DT]):
+    __slots__ = ('data', 'next')
+
     def __init__(self, data: DT):
         self.data = data
         self.next: Optional['LinearNode[DT]'] = None
@@ -16,7 +18,26 @@ class LinearNode(Generic[DT]):
         })
 
 
+class DoublyLinkedNode(Generic[DT]):
+    __slots__ = ('data', 'prev', 'next')
+
+    def __init__(self, data: DT):
+        self.data = data
+        self.prev: Optional['DoublyLinkedNode[DT]'] = None
+        self.next: Optional['DoublyLinkedNode[DT]'] = None
+
+    def __repr__(self):
+        return str({
+            'data': self.data,
+            'address': hex(id(self)),
+            'has_prev': bool(self.prev),
+            'has_next': bool(self.next),
+        })
+
+
 class BinaryTreeNode(Generic[DT]):
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data: DT):
         self.data = data
         self.left: Optional['BinaryTreeNode[DT]'] = None
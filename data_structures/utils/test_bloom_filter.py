@@ -0,0 +1,54 @@
+from pytest import mark, raises
+
+from .bloom_filter import BloomFilter
+
+
+def test_bloom_filter_no_false_negatives():
+    bloom = BloomFilter(1000)
+
+    for n in range(1000):
+        bloom.add(f'{n}th')
+
+    assert len(bloom) == 1000
+    assert all(f'{n}th' in bloom for n in range(1000))
+
+
+@mark.parametrize('error_rate', [0.1, 0.01, 0.001])
+def test_bloom_filter_false_positive_rate(error_rate: float):
+    bloom = BloomFilter(10000, error_rate)
+    bloom.update(range(10000))
+    false_positives = sum(n in bloom for n in range(10000, 60000))
+    assert false_positives / 50000 < error_rate * 2
+    assert bloom.false_positive_rate() < error_rate * 1.1
+
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter(1000, 0.01)
+    assert bloom._num_bits == 9586
+    assert bloom._num_hashes == 7
+    assert len(bloom._bits) == 1199
+    assert bloom.capacity == 1000
+    assert bloom.error_rate == 0.01
+
+
+def test_bloom_filter_clear():
+    bloom = BloomFilter(10)
+    bloom.update(['first', 'second'])
+    assert 'first' in bloom
+    bloom.clear()
+    assert len(bloom) == 0
+    assert 'first' not in bloom
+    assert not any(bloom._bits)
+
+
+@mark.parametrize('args, error, message', [
+    (('10',), TypeError, 'Capacity must be an integer!'),
+    ((0,), ValueError, 'Capacity must be positive!'),
+    ((10, 0), ValueError, 'Error rate must be between 0 and 1!'),
+    ((10, 1), ValueError, 'Error rate must be between 0 and 1!'),
+])
+def test_bloom_filter_fail_options(args, error, message):
+    with raises(error) as e:
+        BloomFilter(*args)
+
+    assert message in str(e.value)
@@ -0,0 +1,33 @@
+from pytest import mark, raises
+
+from ..cache.eviction import CacheEntry, FrequencyBucket
+from ..linked_list.doubly_linked_list import Node as DoublyLinkedListNode
+from ..linked_list.indexable_skip_list import SkipNode
+from ..linked_list.unrolled_linked_list import Chunk
+from ..tree.binary_search_tree import Node as BSTNode
+from .nodes import BinaryTreeNode, DoublyLinkedNode, LinearNode
+
+
+@mark.parametrize('node', [
+    LinearNode('first'),
+    DoublyLinkedNode('first'),
+    BinaryTreeNode('first'),
+    DoublyLinkedListNode('first', None),
+    Chunk(['first']),
+    SkipNode('first', 2),
+    BSTNode('first', 1),
+    CacheEntry('first', 1, None),
+    FrequencyBucket(1),
+])
+def test_nodes_use_slots(node: object):
+    assert not hasattr(node, '__dict__')
+
+    with raises(AttributeError):
+        node.extra = True # type: ignore
+
+
+def test_bst_node_holds_key_and_value():
+    node = BSTNode('first', 1)
+    assert (node.key, node.value) == ('first', 1)
+    assert node.left is None and node.right is None
+    assert "'key': 'first', 'value': 1" in repr(node)